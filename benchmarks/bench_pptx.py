@@ -0,0 +1,116 @@
+"""
+Benchmark PPTX writers: python-pptx vs the direct streaming writer.
+
+Builds decks of N picture slides (plus the title slide) with each writer, every run in a
+fresh process, and reports the time to add all slides and save, the peak resident memory
+of the process and the file size.
+
+Usage:
+    python benchmarks/bench_pptx.py
+    python benchmarks/bench_pptx.py --slides 100 1000 5000 --width 1920 --height 1080
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from io import BytesIO
+
+import cv2
+import numpy as np
+from pptx import Presentation
+
+from video2slides.converter import SLIDE_HEIGHT, SLIDE_WIDTH
+from video2slides.frame_store import encode_frame
+from video2slides.pptx_writer import DirectPresentationWriter
+
+
+def make_slide_image(width: int, height: int) -> bytes:
+    """Encode a text slide as JPEG, the way kept frames are stored."""
+    frame = np.full((height, width, 3), 60, dtype=np.uint8)
+    cv2.putText(
+        frame,
+        "Benchmark slide",
+        (width // 10, height // 2),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        height / 200,
+        (255, 255, 255),
+        max(1, height // 150),
+    )
+    return encode_frame(frame)
+
+
+def build_deck(writer: str, image: bytes, slide_count: int, output_path: str) -> None:
+    """Write a deck of ``slide_count`` distinct pictures with one writer."""
+    # Bytes after the JPEG end marker are ignored by viewers but keep every image distinct,
+    # so python-pptx cannot deduplicate them
+    images = (image + index.to_bytes(4, "big") for index in range(slide_count))
+
+    if writer == "direct":
+        deck = DirectPresentationWriter(output_path, SLIDE_WIDTH, SLIDE_HEIGHT)
+        deck.add_title_slide("Benchmark", f"{slide_count} slides")
+        for data in images:
+            deck.add_picture_slide(data, 0, 0, SLIDE_WIDTH, SLIDE_HEIGHT)
+        deck.save()
+        return
+
+    prs = Presentation()
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    slide.shapes.title.text = "Benchmark"
+    slide.placeholders[1].text = f"{slide_count} slides"
+    for data in images:
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_picture(BytesIO(data), 0, 0, SLIDE_WIDTH, SLIDE_HEIGHT)
+    prs.save(output_path)
+
+
+def run(writer: str, image: bytes, slide_count: int, output_path: str) -> tuple[float, float]:
+    """Return (seconds, peak RSS in MB) of building one deck (subprocess entry point)."""
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    build_deck(writer, image, slide_count, output_path)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    unit = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return elapsed, max(peak, baseline) / unit
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--slides", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    args = parser.parse_args()
+
+    image = make_slide_image(args.width, args.height)
+    print(f"Slide image: {args.width}x{args.height} JPEG, {len(image) / 1024:.1f} KB")
+    print(
+        f"{'slides':>6} {'writer':>12} {'seconds':>8} {'peak MB':>8} {'file MB':>8} {'speedup':>8}"
+    )
+
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        for slide_count in args.slides:
+            baseline = None
+            for writer in ("python-pptx", "direct"):
+                output_path = os.path.join(tmp, f"{writer}_{slide_count}.pptx")
+                with context.Pool(1) as pool:
+                    elapsed, peak = pool.apply(run, (writer, image, slide_count, output_path))
+                baseline = baseline or elapsed
+                size = os.path.getsize(output_path) / (1024 * 1024)
+                print(
+                    f"{slide_count:>6} {writer:>12} {elapsed:>8.2f} {peak:>8.1f} {size:>8.1f} "
+                    f"{baseline / elapsed:>7.2f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
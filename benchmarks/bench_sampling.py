@@ -0,0 +1,105 @@
+"""
+Benchmark frame sampling modes: decode-all (read) vs grab vs seek.
+
+Generates synthetic slide videos and measures the time needed to visit every
+N-th frame with each sampling mode.
+
+Usage:
+    python benchmarks/bench_sampling.py
+    python benchmarks/bench_sampling.py --duration 120 --width 1920 --height 1080 --intervals 1 5 10
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+from video2slides.sampling import FrameSampler, estimate_gop_size
+
+
+def make_synthetic_video(
+    path: str, duration: int, fps: float, width: int, height: int, slide_seconds: int = 10
+) -> None:
+    """Write a video of static text slides with a small moving box in the bottom-right corner."""
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(path, fourcc, fps, (width, height))
+    frames_per_slide = int(fps * slide_seconds)
+    box = max(8, height // 10)
+
+    slide = np.zeros((height, width, 3), dtype=np.uint8)
+    for index in range(int(duration * fps)):
+        if index % frames_per_slide == 0:
+            slide_num = index // frames_per_slide
+            slide[:] = (40 + slide_num * 17) % 200
+            cv2.putText(
+                slide,
+                f"Slide {slide_num + 1}",
+                (width // 10, height // 2),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                height / 200,
+                (255, 255, 255),
+                max(1, height // 150),
+            )
+        frame = slide.copy()
+        x = width - 2 * box + int(box * 0.5 * np.sin(index / 5))
+        cv2.rectangle(frame, (x, height - 2 * box), (x + box, height - box), (0, 0, 255), -1)
+        out.write(frame)
+
+    out.release()
+
+
+def time_mode(video_path: str, frame_interval: int, mode: str) -> tuple[float, int]:
+    """Return (seconds, sampled frame count) for one sampling mode."""
+    cap = cv2.VideoCapture(video_path)
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    start = time.perf_counter()
+    count = sum(1 for _ in FrameSampler(cap, frame_interval, mode=mode, total_frames=total_frames))
+    elapsed = time.perf_counter() - start
+    cap.release()
+    return elapsed, count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--duration", type=int, default=60, help="Video duration in seconds")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--intervals", type=int, nargs="+", default=[1, 5, 10], help="Seconds")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        video_path = os.path.join(tmp, "synthetic.mp4")
+        make_synthetic_video(video_path, args.duration, args.fps, args.width, args.height)
+
+        cap = cv2.VideoCapture(video_path)
+        gop_size = estimate_gop_size(cap)
+        cap.release()
+        print(
+            f"Synthetic video: {args.duration}s @ {args.fps}fps, "
+            f"{args.width}x{args.height}, GOP={gop_size}"
+        )
+        print(f"{'interval':>8} {'mode':>6} {'auto->':>6} {'samples':>8} {'seconds':>8} {'speedup':>8}")
+
+        for interval in args.intervals:
+            frame_interval = int(args.fps * interval)
+            cap = cv2.VideoCapture(video_path)
+            auto_mode = FrameSampler(cap, frame_interval, mode="auto").mode
+            cap.release()
+
+            baseline = None
+            for mode in ("read", "grab", "seek"):
+                elapsed, count = time_mode(video_path, frame_interval, mode)
+                baseline = baseline or elapsed
+                marker = "*" if mode == auto_mode else ""
+                print(
+                    f"{interval:>7}s {mode:>6} {marker:>6} {count:>8} {elapsed:>8.2f} "
+                    f"{baseline / elapsed:>7.2f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
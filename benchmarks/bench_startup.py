@@ -0,0 +1,68 @@
+"""
+Benchmark CLI startup: time to import the package and to print --help or reject bad arguments.
+
+Each command runs in a fresh interpreter, so the numbers include Python's own startup; the
+"python" row is that baseline. The heavy modules each command loaded are listed, which should
+be none for everything but the full import.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 20
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ("cv2", "numpy", "pptx", "skimage", "eliot")
+
+# Prints the heavy modules loaded at exit (also after the CLI exits through SystemExit)
+_REPORT_MODULES = f"""
+import atexit, json, sys
+atexit.register(
+    lambda: print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]), file=sys.stderr)
+)
+"""
+
+COMMANDS = {
+    "python": "pass",
+    "import video2slides": _REPORT_MODULES + "import video2slides",
+    "from video2slides import Video2Slides": _REPORT_MODULES
+    + "from video2slides import Video2Slides",
+}
+for _args in (["--help"], ["convert", "--help"], ["convert", "-s", "2", "x.mp4"]):
+    COMMANDS[" ".join(["video2slides", *_args])] = (
+        _REPORT_MODULES + f"from video2slides.main import app\napp({_args!r})"
+    )
+
+
+def time_command(code: str, runs: int) -> tuple[float, list[str]]:
+    """Median wall time of running code in a fresh interpreter, and the heavy modules it loaded."""
+    times = []
+    modules: list[str] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        times.append(time.perf_counter() - start)
+        lines = result.stderr.strip().splitlines()
+        if lines and lines[-1].startswith("["):
+            modules = json.loads(lines[-1])
+    return statistics.median(times), modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Runs per command (median is shown)")
+    args = parser.parse_args()
+
+    print(f"{'command':<40} {'ms':>8}  heavy modules loaded")
+    for name, code in COMMANDS.items():
+        seconds, modules = time_command(code, args.runs)
+        print(f"{name:<40} {seconds * 1000:>8.0f}  {', '.join(modules) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""Unit tests for the comparison backends."""
+
+import os
+import tempfile
+
+import cv2
+import numpy as np
+import pytest
+
+from video2slides import accelerator as accelerator_module
+from video2slides.accelerator import (
+    CPU_ACCELERATOR,
+    CPUAccelerator,
+    UMatAccelerator,
+    benchmark,
+    get_accelerator,
+    select_accelerator,
+)
+from video2slides.converter import (
+    COMPARISON_HEIGHT,
+    FrameSignature,
+    GPUAccelerator,
+    Video2Slides,
+)
+from video2slides.regions import Rect
+from video2slides.ssim import SSIM_TOLERANCE, structural_similarity
+
+
+@pytest.fixture
+def temp_dir() -> str:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+@pytest.fixture
+def slides_video(temp_dir: str) -> str:
+    """Create a 720p video of 4 slides, each shown for 2 seconds at 5 fps."""
+    video_path = os.path.join(temp_dir, "slides.mp4")
+
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(video_path, fourcc, 5.0, (1280, 720))
+
+    for slide_num in range(4):
+        for _ in range(10):
+            frame = np.full((720, 1280, 3), slide_num * 50, dtype=np.uint8)
+            cv2.putText(
+                frame,
+                f"Slide {slide_num}",
+                (100, 200 + slide_num * 80),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                3,
+                (255, 255, 255),
+                4,
+            )
+            out.write(frame)
+
+    out.release()
+    return video_path
+
+
+class CountingAccelerator(CPUAccelerator):
+    """CPU backend counting host/device transfers."""
+
+    def __init__(self) -> None:
+        self.uploads = 0
+        self.downloads = 0
+
+    def upload(self, image: np.ndarray) -> np.ndarray:
+        self.uploads += 1
+        return super().upload(image)
+
+    def download(self, image: np.ndarray) -> np.ndarray:
+        self.downloads += 1
+        return super().download(image)
+
+
+def _frame(seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    frame = np.full((720, 1280, 3), 30, dtype=np.uint8)
+    for _ in range(20):
+        x, y = rng.integers(0, 1200), rng.integers(0, 650)
+        color = tuple(int(c) for c in rng.integers(0, 256, 3))
+        cv2.rectangle(frame, (int(x), int(y)), (int(x) + 80, int(y) + 60), color, -1)
+    return frame
+
+
+def test_cpu_chain_matches_reference_implementation() -> None:
+    """Test that the CPU backend reduces and scores like plain OpenCV + SSIM."""
+    frames = [_frame(1), _frame(2)]
+    reduced = [CPU_ACCELERATOR.reduce(frame, COMPARISON_HEIGHT) for frame in frames]
+
+    for frame, image in zip(frames, reduced, strict=True):
+        expected = cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), (853, 480))
+        np.testing.assert_array_equal(image, expected)
+
+    stats = [CPU_ACCELERATOR.stats(image) for image in reduced]
+    assert CPU_ACCELERATOR.ssim(*stats) == pytest.approx(structural_similarity(*reduced))
+    assert CPU_ACCELERATOR.ssim(stats[0], stats[0]) == pytest.approx(1.0)
+
+    # Frames no taller than the comparison height are only converted
+    small = CPU_ACCELERATOR.reduce(frames[0][:240, :320], COMPARISON_HEIGHT)
+    assert small.shape == (240, 320)
+
+
+def test_device_signature_matches_host_signature(slides_video: str) -> None:
+    """Test that device-prepared signatures score like host-prepared ones."""
+    converter = Video2Slides(
+        slides_video, use_gpu=False, ignore_regions=[Rect(0.4, 0.4, 0.2, 0.2)]
+    )
+
+    frames = [_frame(3), _frame(4)]
+    device = [converter._prepare_signature(frame) for frame in frames]
+    host = [converter._signature_from_reduced(converter._reduce_frame(f)) for f in frames]
+
+    np.testing.assert_array_equal(device[0].image, host[0].image)
+    assert device[0].ssim(device[1]) == host[0].ssim(host[1])
+
+
+def test_gpu_falls_back_to_cpu(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that requesting the GPU without a CUDA device uses the CPU, detecting once."""
+    calls = []
+
+    def device_count() -> int:
+        calls.append(1)
+        return 0
+
+    accelerator_module.cuda_device_count.cache_clear()
+    monkeypatch.setattr(cv2.cuda, "getCudaEnabledDeviceCount", device_count)
+    try:
+        assert get_accelerator(True) is CPU_ACCELERATOR
+        assert get_accelerator(True) is CPU_ACCELERATOR
+        assert get_accelerator(False) is CPU_ACCELERATOR
+        assert len(calls) == 1
+    finally:
+        accelerator_module.cuda_device_count.cache_clear()
+
+
+def test_detection_without_cuda_module(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test detection when OpenCV was built without the cuda module."""
+    accelerator_module.cuda_device_count.cache_clear()
+    monkeypatch.delattr(cv2.cuda, "getCudaEnabledDeviceCount")
+    try:
+        assert accelerator_module.cuda_device_count() == 0
+    finally:
+        accelerator_module.cuda_device_count.cache_clear()
+
+
+def test_deprecated_gpu_accelerator() -> None:
+    """Test that the deprecated GPUAccelerator still resizes and converts frames."""
+    with pytest.deprecated_call():
+        gpu = GPUAccelerator()
+    assert gpu.use_gpu == gpu.cuda_available == (accelerator_module.cuda_device_count() > 0)
+    frame = np.random.default_rng(0).integers(0, 256, (48, 64, 3), dtype=np.uint8)
+    assert gpu.resize_frame(frame, (32, 24)).shape == (24, 32, 3)
+    gray = gpu.cvt_color(frame, cv2.COLOR_BGR2GRAY)
+    np.testing.assert_array_equal(gray, cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
+
+
+def test_ssim_extraction_downloads_nothing(slides_video: str, temp_dir: str) -> None:
+    """Test that the SSIM chain keeps comparison images on the backend."""
+    expected = Video2Slides(slides_video, os.path.join(temp_dir, "a.pptx"), use_gpu=False)
+    expected.extract_frames()
+    expected.cleanup()
+
+    counting = CountingAccelerator()
+    converter = Video2Slides(slides_video, os.path.join(temp_dir, "b.pptx"), use_gpu=False)
+    converter.accelerator = counting
+    converter.extract_frames()
+    converter.cleanup()
+
+    assert converter.frame_numbers == expected.frame_numbers
+    assert len(converter.frame_numbers) == 4
+    assert counting.downloads == 0 and counting.uploads == 0
+
+
+def test_signature_transfers_lazily() -> None:
+    """Test that signatures only cross between host and device when a feature needs it."""
+    counting = CountingAccelerator()
+    image = CPU_ACCELERATOR.reduce(_frame(5), COMPARISON_HEIGHT)
+
+    on_device = FrameSignature(accelerator=counting, device=image.copy())
+    on_device.ssim(on_device)
+    assert counting.downloads == 0
+    assert on_device.dhash is not None and on_device.image is not None
+    assert counting.downloads == 1
+
+    on_host = FrameSignature(image.copy(), counting)
+    assert on_host.histogram is not None and counting.uploads == 0
+    on_host.ssim(on_device)
+    assert counting.uploads == 1
+
+    with pytest.raises(ValueError):
+        FrameSignature()
+
+
+def test_umat_backend_keeps_opencl_setting() -> None:
+    """Test that creating the UMat backend does not switch OpenCL on or off for the process."""
+    enabled = cv2.ocl.useOpenCL()
+    try:
+        cv2.ocl.setUseOpenCL(False)
+        assert not UMatAccelerator().is_gpu
+        assert not cv2.ocl.useOpenCL()
+    finally:
+        cv2.ocl.setUseOpenCL(enabled)
+
+
+def test_umat_backend_matches_cpu() -> None:
+    """Test that the UMat backend reduces, masks and scores like the CPU backend."""
+    umat = get_accelerator(backend="umat")
+    assert isinstance(umat, UMatAccelerator)
+    frames = [_frame(6), cv2.GaussianBlur(_frame(6), (9, 9), 0), _frame(7)]
+    mask = np.full((480, 853), 255, dtype=np.uint8)
+    mask[:100, :200] = 0
+
+    cpu = CPU_ACCELERATOR
+    host = [cpu.mask(cpu.reduce(f, COMPARISON_HEIGHT), mask) for f in frames]
+    device = [umat.mask(umat.reduce(f, COMPARISON_HEIGHT), mask) for f in frames]
+    assert umat.shape(device[0]) == (480, 853)
+    if not umat.is_gpu:
+        # Without OpenCL the transparent API runs the same CPU code
+        np.testing.assert_array_equal(umat.download(device[0]), host[0])
+
+    host_stats = [CPU_ACCELERATOR.stats(image) for image in host]
+    device_stats = [umat.stats(image) for image in device]
+    for other in (1, 2):
+        expected = CPU_ACCELERATOR.ssim(host_stats[0], host_stats[other])
+        assert umat.ssim(device_stats[0], device_stats[other]) == pytest.approx(
+            expected, abs=SSIM_TOLERANCE
+        )
+
+    uploaded = umat.upload(host[0])
+    assert umat.ssim(umat.stats(uploaded), device_stats[0]) == pytest.approx(1.0, abs=1e-6)
+    assert benchmark(umat, rounds=1) > 0
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_umat_extraction_matches_cpu(slides_video: str, temp_dir: str, workers: int) -> None:
+    """Test that converting with the UMat backend keeps the same frames."""
+    kept = []
+    for backend in ("cpu", "umat"):
+        output_path = os.path.join(temp_dir, f"{backend}.pptx")
+        converter = Video2Slides(slides_video, output_path, backend=backend, workers=workers)
+        assert converter.accelerator.name == backend
+        converter.extract_frames()
+        converter.cleanup()
+        kept.append(converter.frame_numbers)
+    assert kept[0] == kept[1] and len(kept[0]) == 4
+
+
+def test_auto_backend_picks_fastest(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the auto backend benchmarks the available backends once and keeps the fastest."""
+    fast = CountingAccelerator()
+    timed = []
+
+    def fake_benchmark(accelerator: object) -> float:
+        timed.append(accelerator)
+        return 0.001 if accelerator is fast else 0.01
+
+    monkeypatch.setattr(accelerator_module, "opencl_available", lambda: True)
+    monkeypatch.setattr(accelerator_module, "cuda_device_count", lambda: 0)
+    monkeypatch.setattr(accelerator_module, "_umat_accelerator", lambda: fast)
+    monkeypatch.setattr(accelerator_module, "benchmark", fake_benchmark)
+    select_accelerator.cache_clear()
+    try:
+        assert get_accelerator(True, "auto") is fast
+        assert get_accelerator(True, "auto") is fast
+        assert timed == [CPU_ACCELERATOR, fast]
+        assert get_accelerator(False, "auto") is CPU_ACCELERATOR
+        assert get_accelerator(True, "cpu") is CPU_ACCELERATOR
+    finally:
+        select_accelerator.cache_clear()
+
+    # Without OpenCL or CUDA there is nothing to benchmark
+    monkeypatch.setattr(accelerator_module, "opencl_available", lambda: False)
+    try:
+        assert get_accelerator(True, "auto") is CPU_ACCELERATOR
+        assert len(timed) == 2
+    finally:
+        select_accelerator.cache_clear()
+
+
+def test_invalid_backends(slides_video: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that unknown backends and CUDA without a device are rejected."""
+    with pytest.raises(ValueError, match="Unknown backend"):
+        Video2Slides(slides_video, backend="metal")
+
+    monkeypatch.setattr(accelerator_module, "cuda_device_count", lambda: 0)
+    with pytest.raises(ValueError, match="CUDA"):
+        get_accelerator(backend="cuda")
@@ -0,0 +1,181 @@
+"""Unit tests for the analysis cache."""
+
+import os
+import tempfile
+
+import cv2
+import numpy as np
+import pytest
+
+from video2slides import converter as converter_module
+from video2slides.analysis_cache import AnalysisCache, SampleRecorder, video_fingerprint
+from video2slides.converter import Video2Slides
+from video2slides.regions import Rect
+
+
+@pytest.fixture
+def temp_dir() -> str:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+@pytest.fixture
+def slides_video(temp_dir: str) -> str:
+    """Create a video of 6 slides with gradual changes, each shown for 2 seconds at 5 fps."""
+    video_path = os.path.join(temp_dir, "slides.mp4")
+
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(video_path, fourcc, 5.0, (320, 240))
+
+    for slide_num in range(6):
+        for step in range(10):
+            frame = np.full((240, 320, 3), slide_num * 40, dtype=np.uint8)
+            cv2.putText(
+                frame,
+                f"Slide {slide_num}",
+                (60, 60 + slide_num * 30),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (255, 255, 255),
+                2,
+            )
+            # A bullet point appears half way through each slide
+            if step >= 5:
+                cv2.putText(
+                    frame, "- point", (60, 220), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1
+                )
+            out.write(frame)
+
+    out.release()
+    return video_path
+
+
+def _extract(video_path: str, output_dir: str, **options: object) -> tuple[list[int], list[bytes]]:
+    converter = Video2Slides(
+        video_path=video_path,
+        output_path=os.path.join(output_dir, "out.pptx"),
+        use_gpu=False,
+        **options,
+    )
+    converter.extract_frames()
+    images = [converter.frame_store.read(key) for key in converter.frames]
+    converter.cleanup()
+    return converter.frame_numbers, images
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_cached_runs_match_uncached_runs(
+    slides_video: str, temp_dir: str, workers: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that replaying from the cache keeps the same frames for any threshold/detector."""
+    cache_dir = os.path.join(temp_dir, "cache")
+    cache_options = {"analysis_cache": True, "cache_dir": cache_dir, "workers": workers}
+    settings = [
+        {"similarity_threshold": 0.95},
+        {"similarity_threshold": 0.999},
+        {"similarity_threshold": 0.9, "detector": "tiered", "ignore_corners": False},
+    ]
+    expected = [_extract(slides_video, temp_dir, **options) for options in settings]
+
+    assert _extract(slides_video, temp_dir, **settings[0], **cache_options) == expected[0]
+    assert len(os.listdir(cache_dir)) == 1
+
+    # Cache hits must not sample the video
+    def no_sampling(*args: object, **kwargs: object) -> None:
+        raise AssertionError("video was sampled despite a cache hit")
+
+    monkeypatch.setattr(converter_module, "FrameSampler", no_sampling)
+    for options, frames in zip(settings, expected, strict=True):
+        assert _extract(slides_video, temp_dir, **options, **cache_options) == frames
+
+
+def test_cache_key(slides_video: str, temp_dir: str) -> None:
+    """Test that keys change with the sampling settings and the video content only."""
+    key = AnalysisCache.key(slides_video, frame_interval=5, crop_region=None)
+    assert key == AnalysisCache.key(slides_video, frame_interval=5, crop_region=None)
+    assert key != AnalysisCache.key(slides_video, frame_interval=10, crop_region=None)
+
+    converter = Video2Slides(slides_video, use_gpu=False)
+    cropped = Video2Slides(slides_video, use_gpu=False, crop_region=Rect(0, 0, 0.5, 1))
+    stricter = Video2Slides(slides_video, use_gpu=False, similarity_threshold=0.5)
+    assert converter._analysis_cache_key(5) != cropped._analysis_cache_key(5)
+    assert converter._analysis_cache_key(5) == stricter._analysis_cache_key(5)
+
+    copy_path = os.path.join(temp_dir, "copy.mp4")
+    with open(slides_video, "rb") as src, open(copy_path, "wb") as dst:
+        data = bytearray(src.read())
+        dst.write(data)
+    assert video_fingerprint(copy_path) == video_fingerprint(slides_video)
+    data[len(data) // 2] ^= 0xFF
+    with open(copy_path, "wb") as dst:
+        dst.write(data)
+    assert video_fingerprint(copy_path) != video_fingerprint(slides_video)
+
+
+def test_lru_eviction(temp_dir: str) -> None:
+    """Test that least recently used entries are evicted beyond the size limit."""
+    recorder = SampleRecorder()
+    rng = np.random.default_rng(0)
+    for frame_number in range(4):
+        recorder.record(frame_number, rng.integers(0, 255, (240, 320), dtype=np.uint8))
+    entry_size = sum(len(data) for data in recorder.samples.values())
+
+    cache = AnalysisCache(temp_dir, size_limit_mb=1)
+    cache.size_limit = int(entry_size * 2.5)
+    for age, key in enumerate(["a", "b"]):
+        assert cache.store(key, recorder.samples, {})
+        os.utime(cache.path(key), (1000 + age, 1000 + age))
+
+    # Reading "a" makes "b" the least recently used entry
+    entry = cache.load("a")
+    assert entry is not None
+    frame_number, image = next(iter(entry))
+    assert frame_number == 0 and image.shape == (240, 320)
+    entry.close()
+
+    assert cache.store("c", recorder.samples, {})
+    assert sorted(os.listdir(temp_dir)) == ["a.zip", "c.zip"]
+
+    cache.size_limit = entry_size // 2
+    assert not cache.store("d", recorder.samples, {})
+    assert cache.load("d") is None
+
+
+def test_unreadable_entry_is_dropped(temp_dir: str) -> None:
+    """Test that a corrupt entry counts as a miss and is deleted."""
+    cache = AnalysisCache(temp_dir)
+    with open(cache.path("broken"), "wb") as f:
+        f.write(b"not a zip file")
+
+    assert cache.load("broken") is None
+    assert not os.path.exists(cache.path("broken"))
+
+
+def test_hit_keeps_the_frames_of_the_miss(temp_dir: str) -> None:
+    """Test that a cache hit keeps the same frames as the miss with identical settings."""
+    video_path = os.path.join(temp_dir, "bullets.mp4")
+    out = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*"mp4v"), 5.0, (1280, 720))
+    # One slide whose bullet points appear one by one: small changes below the threshold
+    frame = np.full((720, 1280, 3), 255, dtype=np.uint8)
+    cv2.putText(frame, "Title", (80, 100), cv2.FONT_HERSHEY_SIMPLEX, 2, (0, 0, 0), 3)
+    for bullet in range(12):
+        cv2.putText(
+            frame,
+            f"- point {bullet}",
+            (100 + bullet % 2 * 560, 180 + bullet // 2 * 80),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.8,
+            (0, 0, 0),
+            2,
+        )
+        for _ in range(5):
+            out.write(frame)
+    out.release()
+
+    options = {"analysis_cache": True, "cache_dir": os.path.join(temp_dir, "cache")}
+    expected = _extract(video_path, temp_dir)
+    miss = _extract(video_path, temp_dir, **options)
+    hit = _extract(video_path, temp_dir, **options)
+    assert len(expected[0]) == 1
+    assert miss == hit == expected
@@ -0,0 +1,148 @@
+"""Unit tests for batch conversion."""
+
+import json
+import os
+import tempfile
+
+import cv2
+import numpy as np
+import pytest
+
+from video2slides.batch import (
+    BatchJob,
+    coerce_option,
+    convert_many,
+    is_up_to_date,
+    load_jobs,
+    write_report,
+)
+from video2slides.regions import Rect
+
+
+@pytest.fixture
+def temp_dir() -> str:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+def _write_video(path: str, slide_count: int) -> None:
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(path, fourcc, 5.0, (320, 240))
+    for slide_num in range(slide_count):
+        for _ in range(5):
+            frame = np.full((240, 320, 3), slide_num * 60, dtype=np.uint8)
+            cv2.putText(
+                frame,
+                f"Slide {slide_num}",
+                (60, 60 + slide_num * 40),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (255, 255, 255),
+                2,
+            )
+            out.write(frame)
+    out.release()
+
+
+@pytest.fixture
+def video_dir(temp_dir: str) -> str:
+    """Create a directory with two short slide videos and a non-video file."""
+    videos = os.path.join(temp_dir, "videos")
+    os.makedirs(videos)
+    _write_video(os.path.join(videos, "lecture_a.mp4"), 2)
+    _write_video(os.path.join(videos, "lecture_b.mp4"), 3)
+    with open(os.path.join(videos, "notes.txt"), "w") as f:
+        f.write("not a video")
+    return videos
+
+
+def test_load_jobs_from_directory(video_dir: str, temp_dir: str) -> None:
+    """Test that directory sources pick up videos only and name outputs after them."""
+    out_dir = os.path.join(temp_dir, "out")
+    jobs = load_jobs(video_dir, output_dir=out_dir, options={"fps_interval": 2})
+
+    assert [os.path.basename(job.video_path) for job in jobs] == ["lecture_a.mp4", "lecture_b.mp4"]
+    assert [job.output_path for job in jobs] == [
+        os.path.join(out_dir, "lecture_a.pptx"),
+        os.path.join(out_dir, "lecture_b.pptx"),
+    ]
+    assert all(job.options == {"fps_interval": 2} for job in jobs)
+
+    assert len(load_jobs(os.path.join(video_dir, "*_b.mp4"), output_dir=out_dir)) == 1
+
+
+def test_load_jobs_from_manifests(video_dir: str, temp_dir: str) -> None:
+    """Test CSV and JSONL manifests with per-video options and relative paths."""
+    csv_path = os.path.join(video_dir, "manifest.csv")
+    with open(csv_path, "w") as f:
+        f.write("video,output,similarity_threshold,ignore_corners,ignore_regions\n")
+        f.write('lecture_a.mp4,a.pptx,0.9,false,"0.7,0.7,0.3,0.3"\n')
+        f.write("lecture_b.mp4,,,,\n")
+
+    jobs = load_jobs(csv_path, output_dir=temp_dir, options={"similarity_threshold": 0.95})
+    assert jobs[0].video_path == os.path.join(video_dir, "lecture_a.mp4")
+    assert jobs[0].output_path == os.path.join(temp_dir, "a.pptx")
+    assert jobs[0].options == {
+        "similarity_threshold": 0.9,
+        "ignore_corners": False,
+        "ignore_regions": [Rect(0.7, 0.7, 0.3, 0.3)],
+    }
+    assert jobs[1].output_path == os.path.join(temp_dir, "lecture_b.pptx")
+    assert jobs[1].options == {"similarity_threshold": 0.95}
+
+    jsonl_path = os.path.join(video_dir, "manifest.jsonl")
+    with open(jsonl_path, "w") as f:
+        f.write(json.dumps({"video": "lecture_b.mp4", "fps_interval": 2, "detector": "tiered"}))
+        f.write("\n\n")
+    (job,) = load_jobs(jsonl_path, output_dir=temp_dir)
+    assert job.options == {"fps_interval": 2, "detector": "tiered"}
+
+
+def test_invalid_manifest_entries(video_dir: str, temp_dir: str) -> None:
+    """Test that unknown options, bad values and colliding outputs are rejected."""
+    with pytest.raises(ValueError):
+        coerce_option("frames_per_slide", "3")
+    with pytest.raises(ValueError):
+        coerce_option("ignore_corners", "maybe")
+    assert coerce_option("fps_interval", "5") == 5
+    assert coerce_option("crop_region", "0,0,0.75,1") == Rect(0.0, 0.0, 0.75, 1.0)
+
+    jsonl_path = os.path.join(video_dir, "manifest.jsonl")
+    with open(jsonl_path, "w") as f:
+        f.write(json.dumps({"video": "lecture_a.mp4", "output": "same.pptx"}) + "\n")
+        f.write(json.dumps({"video": "lecture_b.mp4", "output": "same.pptx"}) + "\n")
+    with pytest.raises(ValueError):
+        load_jobs(jsonl_path, output_dir=temp_dir)
+
+
+def test_convert_many(video_dir: str, temp_dir: str) -> None:
+    """Test concurrent conversion, skipping up-to-date outputs and failure reporting."""
+    out_dir = os.path.join(temp_dir, "out")
+    jobs = load_jobs(video_dir, output_dir=out_dir, options={"use_gpu": False})
+    broken = os.path.join(video_dir, "broken.mp4")
+    with open(broken, "w") as f:
+        f.write("not a video")
+    jobs.append(BatchJob(broken, os.path.join(out_dir, "broken.pptx"), {"use_gpu": False}))
+
+    results = convert_many(jobs, max_workers=2)
+
+    assert [result.status for result in results] == ["converted", "converted", "failed"]
+    assert [result.slide_count for result in results[:2]] == [2, 3]
+    assert results[2].error
+    assert all(os.path.exists(job.output_path) for job in jobs[:2])
+    assert is_up_to_date(jobs[0]) and not is_up_to_date(jobs[2])
+    assert not os.path.exists("temp_frames")
+
+    rerun = convert_many(jobs[:2], max_workers=2)
+    assert [result.status for result in rerun] == ["skipped", "skipped"]
+    forced = convert_many(jobs[:1], max_workers=1, force=True)
+    assert [result.status for result in forced] == ["converted"]
+
+    report_path = os.path.join(temp_dir, "report", "report.json")
+    write_report(results, report_path)
+    with open(report_path) as f:
+        report = json.load(f)
+    assert report["summary"]["converted"] == 2
+    assert report["summary"]["failed"] == 1
+    assert [job["status"] for job in report["jobs"]] == ["converted", "converted", "failed"]
@@ -0,0 +1,145 @@
+"""Unit tests for the benchmark suite."""
+
+import copy
+import json
+import os
+import tempfile
+from dataclasses import replace
+
+import cv2
+import numpy as np
+import pytest
+from typer.testing import CliRunner
+
+from video2slides.bench import (
+    LectureSpec,
+    Regression,
+    compare_results,
+    generate_lecture_video,
+    run_benchmark,
+)
+from video2slides.main import app
+
+# 3 slides of 1 second at 10 fps, small enough for unit tests
+TINY = LectureSpec(duration=3, width=320, height=240, fps=10, slide_seconds=1)
+TINY_ARGS = ["--duration", "3", "--width", "320", "--height", "240", "--fps", "10"]
+
+
+@pytest.fixture
+def temp_dir() -> str:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+def _frames(path: str) -> list[np.ndarray]:
+    cap = cv2.VideoCapture(path)
+    frames = []
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(frame)
+    cap.release()
+    return frames
+
+
+def _results(**stages: dict[str, float]) -> dict:
+    return {
+        "version": 1,
+        "spec": {"duration": 3},
+        "video": None,
+        "options": {"use_gpu": "False"},
+        "stages": stages,
+    }
+
+
+def test_generate_lecture_video(temp_dir: str) -> None:
+    """Test that synthetic lectures are deterministic and have the requested layout."""
+    paths = [os.path.join(temp_dir, f"{name}.mp4") for name in ("a", "b", "c")]
+    states = generate_lecture_video(paths[0], TINY)
+    assert generate_lecture_video(paths[1], TINY) == states
+    # 3 slides, each shown without bullets and with 1, 2 and 3 bullets
+    assert states == 12
+
+    first, second = _frames(paths[0]), _frames(paths[1])
+    assert len(first) == 30
+    assert all(np.array_equal(a, b) for a, b in zip(first, second, strict=True))
+
+    generate_lecture_video(paths[2], replace(TINY, seed=1))
+    assert not np.array_equal(_frames(paths[2])[0], first[0])
+
+
+def test_run_benchmark() -> None:
+    """Test that a benchmark run measures every stage and is JSON-serializable."""
+    results = run_benchmark(TINY, {"similarity_threshold": 0.99}, repeat=2)
+
+    assert results["slide_states"] == 12
+    assert results["spec"]["width"] == 320
+    stages = results["stages"]
+    assert list(stages) == ["decode", "extract", "pptx"]
+    assert stages["decode"]["frames"] == 30
+    assert stages["extract"]["comparisons"] == 2
+    assert 1 <= stages["extract"]["slides"] <= 12
+    for metrics in stages.values():
+        assert metrics["seconds"] > 0 and metrics["peak_rss_mb"] > 0
+    json.dumps(results)
+
+
+def test_compare_results() -> None:
+    """Test regression detection against a baseline."""
+    baseline = _results(
+        decode={"seconds": 2.0, "frames_per_second": 900.0, "peak_rss_mb": 200.0},
+        extract={"seconds": 4.0, "comparisons_per_second": 50.0, "slides": 10},
+        pptx={"seconds": 0.05, "bytes": 1000},
+    )
+    same = copy.deepcopy(baseline)
+    same["stages"]["decode"]["seconds"] = 2.3
+    # Small stages are within the absolute noise floor
+    same["stages"]["pptx"]["seconds"] = 0.1
+    same["stages"]["pptx"]["bytes"] = 5000
+    assert compare_results(same, baseline) == []
+
+    worse = copy.deepcopy(baseline)
+    worse["stages"]["decode"]["seconds"] = 3.0
+    worse["stages"]["extract"]["comparisons_per_second"] = 30.0
+    worse["stages"]["extract"]["slides"] = 11
+    regressions = compare_results(worse, baseline)
+    assert [(r.stage, r.metric) for r in regressions] == [
+        ("decode", "seconds"),
+        ("extract", "comparisons_per_second"),
+        ("extract", "slides"),
+    ]
+    assert regressions[0].change == pytest.approx(0.5)
+    assert str(regressions[0]) == "decode.seconds: 2 -> 3 (+50%)"
+    assert compare_results(worse, baseline, tolerance=0.6) == [
+        Regression("extract", "slides", 10, 11)
+    ]
+
+    other = copy.deepcopy(baseline)
+    other["spec"] = {"duration": 60}
+    with pytest.raises(ValueError, match="spec"):
+        compare_results(other, baseline)
+
+
+def test_bench_command(temp_dir: str) -> None:
+    """Test the bench command output, JSON results and baseline check."""
+    runner = CliRunner()
+    output = os.path.join(temp_dir, "results.json")
+    result = runner.invoke(app, ["bench", *TINY_ARGS, "--slide-seconds", "1", "-o", output])
+    assert result.exit_code == 0, result.output
+    assert "comparisons/s" in result.output and "12 distinct slide states" in result.output
+
+    with open(output) as f:
+        results = json.load(f)
+    # A baseline recorded on an impossibly fast machine
+    results["stages"]["decode"]["frames_per_second"] = 1e9
+    baseline = os.path.join(temp_dir, "baseline.json")
+    with open(baseline, "w") as f:
+        json.dump(results, f)
+
+    result = runner.invoke(
+        app, ["bench", *TINY_ARGS, "--slide-seconds", "1", "--baseline", baseline]
+    )
+    assert result.exit_code == 1
+    assert "decode.frames_per_second" in result.output
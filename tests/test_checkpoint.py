@@ -0,0 +1,167 @@
+"""Unit tests for checkpointed, resumable extraction."""
+
+import os
+import tempfile
+
+import cv2
+import numpy as np
+import pytest
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+from video2slides import converter as converter_module
+from video2slides.checkpoint import Checkpoint, CheckpointState, default_checkpoint_dir
+from video2slides.converter import Video2Slides
+
+
+@pytest.fixture
+def temp_dir() -> str:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+@pytest.fixture
+def slides_video(temp_dir: str) -> str:
+    """Create a video of 6 slides with gradual changes, each shown for 2 seconds at 5 fps."""
+    video_path = os.path.join(temp_dir, "slides.mp4")
+
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(video_path, fourcc, 5.0, (320, 240))
+
+    for slide_num in range(6):
+        for step in range(10):
+            frame = np.full((240, 320, 3), slide_num * 40, dtype=np.uint8)
+            cv2.putText(
+                frame,
+                f"Slide {slide_num}",
+                (60, 60 + slide_num * 30),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (255, 255, 255),
+                2,
+            )
+            # A bullet point appears half way through each slide
+            if step >= 5:
+                cv2.putText(
+                    frame, "- point", (60, 220), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1
+                )
+            out.write(frame)
+
+    out.release()
+    return video_path
+
+
+def _pictures(path: str) -> list[bytes]:
+    return [
+        shape.image.blob
+        for slide in Presentation(path).slides
+        for shape in slide.shapes
+        if shape.shape_type == MSO_SHAPE_TYPE.PICTURE
+    ]
+
+
+def _convert(video_path: str, output_path: str, **options: object) -> Video2Slides:
+    options.setdefault("similarity_threshold", 0.99)
+    converter = Video2Slides(video_path=video_path, output_path=output_path, use_gpu=False, **options)
+    converter.convert()
+    return converter
+
+
+@pytest.mark.parametrize("options", [{}, {"reduced_decode": True}, {"pptx_writer": "direct"}])
+def test_resume_after_crash(
+    slides_video: str, temp_dir: str, options: dict, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a resumed conversion matches an uninterrupted one and skips finished work."""
+    expected = _convert(slides_video, os.path.join(temp_dir, "expected.pptx"), **options)
+    output_path = os.path.join(temp_dir, "out.pptx")
+    checkpoint_dir = default_checkpoint_dir(output_path)
+
+    # Fail while storing the 4th kept frame, after checkpoints of the earlier ones
+    store_frame = Video2Slides._store_frame
+
+    def failing_store_frame(self: Video2Slides, index: int, *args: object) -> None:
+        if index == 3:
+            raise OSError("worker preempted")
+        store_frame(self, index, *args)
+
+    monkeypatch.setattr(Video2Slides, "_store_frame", failing_store_frame)
+    with pytest.raises(OSError):
+        _convert(slides_video, output_path, checkpoint=True, checkpoint_interval=1e-6, **options)
+    assert not os.path.exists(output_path)
+    assert len(os.listdir(os.path.join(checkpoint_dir, "frames"))) == 3
+
+    monkeypatch.setattr(Video2Slides, "_store_frame", store_frame)
+    resumed = _convert(slides_video, output_path, resume=True, **options)
+
+    assert resumed.frame_numbers == expected.frame_numbers
+    assert _pictures(output_path) == _pictures(expected.output_path)
+    assert sum(resumed.detector_tiers.values()) < sum(expected.detector_tiers.values())
+    assert not os.path.exists(checkpoint_dir)
+
+
+def test_resume_segments(slides_video: str, temp_dir: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test resuming a segmented extraction after the first segment was stitched."""
+    expected = _convert(slides_video, os.path.join(temp_dir, "expected.pptx"), workers=2)
+    output_path = os.path.join(temp_dir, "out.pptx")
+
+    def failing_stitch(*args: object) -> None:
+        raise OSError("worker preempted")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(converter_module, "stitch_segment", failing_stitch)
+        with pytest.raises(OSError):
+            _convert(slides_video, output_path, workers=2, checkpoint=True)
+
+    # The first of two 6-sample segments was saved
+    settings = Video2Slides(slides_video, output_path, use_gpu=False, similarity_threshold=0.99)
+    state = Checkpoint(default_checkpoint_dir(output_path), settings._checkpoint_key(5)).load()
+    assert state.next_frame == 30 and state.frame_numbers
+    resumed = _convert(slides_video, output_path, workers=2, resume=True)
+
+    assert resumed.frame_numbers == expected.frame_numbers
+    assert _pictures(output_path) == _pictures(expected.output_path)
+
+
+def test_checkpoint_of_other_settings_is_not_resumed(
+    slides_video: str, temp_dir: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a checkpoint written with another threshold is discarded."""
+    output_path = os.path.join(temp_dir, "out.pptx")
+
+    put_frame = Video2Slides._put_frame
+
+    def failing_put_frame(self: Video2Slides, index: int, data: bytes) -> None:
+        if index == 2:
+            raise OSError("worker preempted")
+        put_frame(self, index, data)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(Video2Slides, "_put_frame", failing_put_frame)
+        with pytest.raises(OSError):
+            _convert(slides_video, output_path, checkpoint=True, checkpoint_interval=1e-6)
+
+    resumed = _convert(slides_video, output_path, resume=True, similarity_threshold=0.5)
+    expected = _convert(
+        slides_video, os.path.join(temp_dir, "expected.pptx"), similarity_threshold=0.5
+    )
+    assert resumed.frame_numbers == expected.frame_numbers
+    assert _pictures(output_path) == _pictures(expected.output_path)
+
+
+def test_checkpoint_state_roundtrip(temp_dir: str) -> None:
+    """Test saving and loading a checkpoint state."""
+    reference = np.arange(48 * 64, dtype=np.uint8).reshape(48, 64)
+    checkpoint = Checkpoint(os.path.join(temp_dir, "ckpt"), "key")
+    assert checkpoint.load() is None
+
+    checkpoint.save(CheckpointState(25, [0, 10, 20], reference))
+    checkpoint.save(CheckpointState(30, [0, 10, 20, 25], reference[::-1].copy()))
+    state = checkpoint.load()
+    assert state.next_frame == 30 and state.frame_numbers == [0, 10, 20, 25]
+    np.testing.assert_array_equal(state.reference, reference[::-1])
+    assert sorted(os.listdir(checkpoint.directory)) == ["checkpoint.json", "reference_4.png"]
+
+    assert Checkpoint(checkpoint.directory, "other settings").load() is None
+    checkpoint.remove()
+    assert not os.path.exists(checkpoint.directory)
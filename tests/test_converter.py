@@ -8,7 +8,7 @@ import cv2
 import numpy as np
 import pytest
 
-from video2slides.converter import Video2Slides
+from video2slides.converter import ChangeDetector, Video2Slides
 
 
 @pytest.fixture
@@ -122,6 +122,30 @@ def test_frame_similarity_detection(sample_video_with_duplicates: str, temp_dir:
     assert len(converter.frames) >= 4, f"Expected >= 4 frames, got {len(converter.frames)}"
 
 
+def test_each_sample_prepared_once(sample_video_with_duplicates: str, temp_dir: str) -> None:
+    """Test that the kept reference is not re-prepared for every comparison."""
+    converter = Video2Slides(
+        video_path=sample_video_with_duplicates,
+        output_path=os.path.join(temp_dir, "out.pptx"),
+        use_gpu=False,
+        compare_workers=2,
+    )
+    prepared = 0
+    prepare_signature = converter._prepare_signature
+
+    def counting_prepare(frame: np.ndarray) -> np.ndarray:
+        nonlocal prepared
+        prepared += 1
+        return prepare_signature(frame)
+
+    converter._prepare_signature = counting_prepare  # type: ignore[method-assign]
+    converter.extract_frames()
+
+    # 50 frames at 10 fps sampled once per second
+    assert prepared == 5
+    converter.cleanup()
+
+
 def test_corner_masking(sample_video: str) -> None:
     """Test that corner masking correctly ignores corner regions."""
     # Create two frames: identical except for corner
@@ -145,3 +169,89 @@ def test_corner_masking(sample_video: str) -> None:
     converter.ignore_corners = False
     similarity_no_mask = converter._compute_frame_similarity(frame1, frame2)
     assert similarity_no_mask < similarity, "Expected lower similarity without corner masking"
+
+
+@pytest.mark.parametrize("detector", ["ssim", "hash", "hist", "tiered"])
+def test_detectors_score_identical_and_different_frames(sample_video: str, detector: str) -> None:
+    """Test that every detector scores identical frames 1 and different slides lower."""
+    frame1 = np.zeros((480, 640, 3), dtype=np.uint8)
+    cv2.putText(frame1, "Slide 1", (150, 240), cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3)
+    frame2 = np.full((480, 640, 3), 200, dtype=np.uint8)
+    cv2.rectangle(frame2, (150, 150), (450, 300), (0, 0, 0), -1)
+
+    converter = Video2Slides(video_path=sample_video, detector=detector, use_gpu=False)
+
+    assert converter._compute_frame_similarity(frame1, frame1) == pytest.approx(1.0)
+    assert converter._compute_frame_similarity(frame1, frame2) < 0.9
+
+
+def test_tiered_detector_matches_ssim(sample_video_with_duplicates: str, temp_dir: str) -> None:
+    """Test that the tiered detector keeps the same slides and reports which tier decided."""
+    results = {}
+    for detector in ("ssim", "tiered"):
+        converter = Video2Slides(
+            video_path=sample_video_with_duplicates,
+            output_path=os.path.join(temp_dir, f"{detector}.pptx"),
+            detector=detector,
+            use_gpu=False,
+        )
+        converter.extract_frames()
+        results[detector] = converter
+        converter.cleanup()
+
+    assert results["tiered"].frame_numbers == results["ssim"].frame_numbers
+    assert set(results["ssim"].detector_tiers) == {"ssim"}
+    tiers = results["tiered"].detector_tiers
+    assert sum(tiers.values()) == sum(results["ssim"].detector_tiers.values())
+    assert tiers["ssim"] < sum(tiers.values())
+
+
+def test_unknown_detector(sample_video: str) -> None:
+    """Test that unknown detectors are rejected."""
+    with pytest.raises(ValueError):
+        Video2Slides(video_path=sample_video, detector="magic", use_gpu=False)
+
+
+def test_change_detector_is_abstract() -> None:
+    """Test that detectors must implement compare."""
+
+    class Incomplete(ChangeDetector):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_image_encoding_options(
+    sample_video_with_duplicates: str, temp_dir: str, workers: int
+) -> None:
+    """Test that slide images use the requested format and are capped at max_dpi."""
+    converter = Video2Slides(
+        video_path=sample_video_with_duplicates,
+        output_path=os.path.join(temp_dir, "output.pptx"),
+        use_gpu=False,
+        workers=workers,
+        image_format="png",
+        max_dpi=20,
+    )
+    converter.extract_frames()
+
+    assert converter.frames and all(key.endswith(".png") for key in converter.frames)
+    for key in converter.frames:
+        data = converter.frame_store.read(key)
+        assert data.startswith(b"\x89PNG")
+        image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        # 10" x 7.5" at 20 DPI
+        assert image.shape[:2] == (150, 200)
+    converter.cleanup()
+
+
+def test_invalid_image_encoding(sample_video: str) -> None:
+    """Test that unsupported image settings are rejected."""
+    with pytest.raises(ValueError):
+        Video2Slides(video_path=sample_video, image_format="webp", use_gpu=False)
+    with pytest.raises(ValueError):
+        Video2Slides(video_path=sample_video, jpeg_quality=0, use_gpu=False)
+    with pytest.raises(ValueError):
+        Video2Slides(video_path=sample_video, max_dpi=0, use_gpu=False)
@@ -0,0 +1,142 @@
+"""Unit tests for following a video file while it is written."""
+
+import os
+import tempfile
+import threading
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from video2slides.converter import Video2Slides
+from video2slides.follow import FollowingCapture
+
+
+@pytest.fixture
+def temp_dir() -> str:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+def _write_video(path: str, fourcc: str, slides: int = 5) -> str:
+    """Write a video of ``slides`` slides, each shown for 2 seconds at 5 fps."""
+    out = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*fourcc), 5.0, (320, 240))
+    for slide_num in range(slides):
+        for _ in range(10):
+            frame = np.full((240, 320, 3), slide_num * 40 % 256, dtype=np.uint8)
+            cv2.putText(
+                frame,
+                f"Slide {slide_num}",
+                (20, 60 + slide_num * 30),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (255, 255, 255),
+                2,
+            )
+            out.write(frame)
+    out.release()
+    return path
+
+
+def _grow(source: str, target: str, chunks: int = 30, delay: float = 0.02) -> threading.Event:
+    """Copy source to target in chunks on a thread; the event is set once the copy is done."""
+    with open(source, "rb") as f:
+        data = f.read()
+    chunk_size = len(data) // chunks + 1
+    done = threading.Event()
+
+    def copy() -> None:
+        with open(target, "wb") as f:
+            for offset in range(0, len(data), chunk_size):
+                f.write(data[offset : offset + chunk_size])
+                f.flush()
+                time.sleep(delay)
+        done.set()
+
+    threading.Thread(target=copy, daemon=True).start()
+    return done
+
+
+def _read_all(cap: cv2.VideoCapture | FollowingCapture) -> list[np.ndarray]:
+    frames = []
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(frame)
+    cap.release()
+    return frames
+
+
+@pytest.mark.parametrize(("extension", "fourcc"), [("avi", "MJPG"), ("mkv", "XVID")])
+def test_following_capture_reads_growing_file(temp_dir: str, extension: str, fourcc: str) -> None:
+    """Test that a growing file yields exactly the frames of the complete file."""
+    source = _write_video(os.path.join(temp_dir, f"source.{extension}"), fourcc)
+    target = os.path.join(temp_dir, f"growing.{extension}")
+    expected = _read_all(cv2.VideoCapture(source))
+
+    done = _grow(source, target)
+    cap = FollowingCapture(target, done.is_set, poll_interval=0.01)
+    assert cap.isOpened()
+    assert cap.get(cv2.CAP_PROP_FRAME_COUNT) == 0
+    assert cap.get(cv2.CAP_PROP_FPS) == 5.0
+    frames = _read_all(cap)
+
+    assert len(frames) == len(expected)
+    # Frames cut off at the end of the data written so far are decoded again
+    assert all(np.array_equal(frame, ref) for frame, ref in zip(frames, expected, strict=True))
+    assert cap.opens > 1 and cap.wait_seconds > 0
+
+
+def test_following_capture_completion(temp_dir: str) -> None:
+    """Test completion by timeout and files that never become readable."""
+    source = _write_video(os.path.join(temp_dir, "source.avi"), "MJPG", slides=2)
+    # The timeout runs from the last growth, which the capture sees while it opens the file
+    start = time.monotonic()
+    cap = FollowingCapture(source, timeout=0.2, poll_interval=0.01)
+    assert len(_read_all(cap)) == 20
+    assert time.monotonic() - start >= 0.2
+
+    missing = FollowingCapture(os.path.join(temp_dir, "missing.avi"), lambda: True)
+    assert not missing.isOpened()
+    assert missing.read() == (False, None)
+
+    garbage = os.path.join(temp_dir, "garbage.avi")
+    with open(garbage, "wb") as f:
+        f.write(b"not a video")
+    assert not FollowingCapture(garbage, timeout=0.1, poll_interval=0.01).isOpened()
+
+
+def test_convert_follows_growing_file(temp_dir: str) -> None:
+    """Test that following a file that does not exist yet keeps the same slides."""
+    source = _write_video(os.path.join(temp_dir, "source.mkv"), "XVID")
+    target = os.path.join(temp_dir, "growing.mkv")
+    reference = Video2Slides(source, os.path.join(temp_dir, "ref.pptx"), use_gpu=False)
+    reference.extract_frames()
+
+    converter = Video2Slides(target, os.path.join(temp_dir, "out.pptx"), use_gpu=False, follow=True)
+    assert not os.path.exists(target)
+    converter.source_complete = _grow(source, target, chunks=10, delay=0.1).is_set
+    converter.convert()
+
+    assert converter.frame_numbers == reference.frame_numbers == [0, 10, 20, 30, 40]
+    assert os.path.exists(converter.output_path)
+
+
+@pytest.mark.parametrize(
+    ("options", "conflict"),
+    [
+        ({"workers": 2}, "workers > 1"),
+        ({"sampling_mode": "seek"}, "sampling_mode='seek'"),
+        ({"reduced_decode": True}, "reduced_decode"),
+        ({"analysis_cache": True}, "analysis_cache"),
+        ({"resume": True}, "checkpoint"),
+        ({"follow_timeout": 0}, "follow_timeout must be positive"),
+    ],
+)
+def test_follow_validation(temp_dir: str, options: dict, conflict: str) -> None:
+    """Test that following rejects options that need random access or a complete file."""
+    with pytest.raises(ValueError, match=conflict):
+        Video2Slides(os.path.join(temp_dir, "later.mkv"), follow=True, use_gpu=False, **options)
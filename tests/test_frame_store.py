@@ -0,0 +1,117 @@
+"""Unit tests for frame stores."""
+
+import os
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from video2slides.converter import Video2Slides
+from video2slides.frame_store import (
+    DiskFrameStore,
+    ImageEncoding,
+    SpillFrameStore,
+    create_frame_store,
+    encode_frame,
+)
+
+
+@pytest.fixture
+def frame() -> np.ndarray:
+    """A small BGR frame with some content."""
+    image = np.full((120, 160, 3), 40, dtype=np.uint8)
+    cv2.putText(image, "Slide", (20, 70), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+    return image
+
+
+def test_encode_frame(frame: np.ndarray) -> None:
+    """Test that encoded frames decode to an image of the same size."""
+    data = encode_frame(frame)
+    decoded = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    assert decoded.shape == frame.shape
+
+
+def test_encode_frame_settings(frame: np.ndarray) -> None:
+    """Test JPEG quality and chroma subsampling, lossless PNG and invalid settings."""
+    default = encode_frame(frame)
+    assert default == encode_frame(frame, ImageEncoding())
+    assert len(encode_frame(frame, ImageEncoding(jpeg_quality=30))) < len(default)
+    assert len(encode_frame(frame, ImageEncoding(chroma_subsampling="444"))) > len(default)
+
+    png = encode_frame(frame, ImageEncoding("png"))
+    assert ImageEncoding("png").extension == ".png"
+    decoded = cv2.imdecode(np.frombuffer(png, dtype=np.uint8), cv2.IMREAD_COLOR)
+    assert np.array_equal(decoded, frame)
+
+    with pytest.raises(ValueError):
+        ImageEncoding("webp")
+    with pytest.raises(ValueError):
+        ImageEncoding(chroma_subsampling="411")
+    with pytest.raises(ValueError):
+        ImageEncoding(jpeg_quality=101)
+
+
+@pytest.mark.parametrize("kind", ["memory", "disk", "spill"])
+def test_store_round_trip(kind: str, frame: np.ndarray) -> None:
+    """Test that every store returns what was put and releases it on close."""
+    store = create_frame_store(kind)
+    data = encode_frame(frame)
+    store.put("frame_0000.jpg", data)
+
+    assert store.read("frame_0000.jpg") == data
+    assert store.nbytes == len(data)
+    picture = store.picture("frame_0000.jpg")
+    if isinstance(picture, str):
+        assert os.path.exists(picture)
+    else:
+        assert picture.read() == data
+
+    store.close()
+    if isinstance(store, DiskFrameStore):
+        assert not os.path.exists(store.directory)
+
+    with pytest.raises(ValueError):
+        create_frame_store("cloud")
+
+
+def test_spill_store_writes_to_disk_over_budget(frame: np.ndarray) -> None:
+    """Test that frames beyond the memory budget are written to a temporary directory."""
+    data = encode_frame(frame)
+    store = SpillFrameStore(memory_budget=2 * len(data))
+    for index in range(2):
+        store.put(f"frame_{index:04d}.jpg", data)
+    assert not store.spilled
+
+    store.put("frame_0002.jpg", data)
+    assert store.spilled
+    assert not isinstance(store.picture("frame_0000.jpg"), str)
+    assert isinstance(store.picture("frame_0002.jpg"), str)
+    assert all(store.read(f"frame_{index:04d}.jpg") == data for index in range(3))
+    assert store.nbytes == 3 * len(data)
+
+    spill_dir = os.path.dirname(store.picture("frame_0002.jpg"))
+    store.close()
+    assert not os.path.exists(spill_dir)
+
+
+@pytest.mark.parametrize("kind", ["memory", "disk"])
+def test_convert_without_working_directory_files(
+    kind: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a conversion leaves nothing in the current directory but the output."""
+    video_path = os.path.join(str(tmp_path), "video.mp4")
+    out = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*"mp4v"), 2.0, (160, 120))
+    for i in range(6):
+        out.write(np.full((120, 160, 3), i * 40, dtype=np.uint8))
+    out.release()
+
+    workdir = os.path.join(str(tmp_path), "work")
+    os.makedirs(workdir)
+    monkeypatch.chdir(workdir)
+
+    converter = Video2Slides(video_path, "out.pptx", use_gpu=False, frame_store=kind)
+    converter.convert()
+
+    assert os.listdir(workdir) == ["out.pptx"]
+    assert converter.frame_store is None
@@ -0,0 +1,134 @@
+"""Unit tests for stage timers and run reports."""
+
+import json
+import os
+import pickle
+import tempfile
+import threading
+
+import cv2
+import numpy as np
+import pytest
+from typer.testing import CliRunner
+
+from video2slides.converter import Video2Slides
+from video2slides.main import app
+from video2slides.metrics import STAGES, StageTimers, peak_rss_mb
+
+
+@pytest.fixture
+def temp_dir() -> str:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+@pytest.fixture
+def slides_video(temp_dir: str) -> str:
+    """Create a video of 4 slides, each shown for 2 seconds at 5 fps."""
+    video_path = os.path.join(temp_dir, "slides.mp4")
+
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(video_path, fourcc, 5.0, (320, 240))
+
+    for slide_num in range(4):
+        for _ in range(10):
+            frame = np.full((240, 320, 3), slide_num * 50, dtype=np.uint8)
+            cv2.putText(
+                frame,
+                f"Slide {slide_num}",
+                (20, 60 + slide_num * 40),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (255, 255, 255),
+                2,
+            )
+            out.write(frame)
+
+    out.release()
+    return video_path
+
+
+def test_stage_timers() -> None:
+    """Test accumulating, merging and pickling stage timers across threads."""
+    timers = StageTimers()
+
+    def work() -> None:
+        for _ in range(1000):
+            timers.add("decode", 0.001)
+        with timers.measure("save"):
+            pass
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert timers.count("decode") == 4000
+    assert timers.seconds("decode") == pytest.approx(4.0)
+    assert timers.count("save") == 4
+    with pytest.raises(KeyError):
+        timers.add("unknown", 1.0)
+
+    # Timers cross process boundaries with segment results
+    copy = pickle.loads(pickle.dumps(timers))
+    copy.add("encode", 0.5, count=0)
+    timers.merge(copy)
+    report = timers.to_dict()
+    assert list(report) == list(STAGES)
+    assert report["decode"] == {"seconds": 8.0, "count": 8000}
+    assert report["encode"] == {"seconds": 0.5, "count": 0}
+
+
+@pytest.mark.parametrize(
+    ("sampling_mode", "workers"), [("read", 1), ("grab", 1), ("seek", 1), ("auto", 2)]
+)
+def test_run_report(slides_video: str, temp_dir: str, sampling_mode: str, workers: int) -> None:
+    """Test that a conversion times every stage and reports consistent counts."""
+    output = os.path.join(temp_dir, "out.pptx")
+    converter = Video2Slides(
+        slides_video,
+        output,
+        fps_interval=1,
+        sampling_mode=sampling_mode,
+        workers=workers,
+        compare_workers=2,
+    )
+    converter.convert()
+
+    report = converter.run_report()
+    json.dumps(report)
+    stages = report["stages"]
+    assert report["slides"] == len(converter.frames) == 4
+    assert report["samples"] == 8 and report["skipped"] == 4
+    # Stitching segments decodes and prepares samples at segment starts again
+    assert stages["decode"]["count"] >= 8
+    assert stages["prepare"]["count"] >= 8
+    assert stages["similarity"]["count"] >= 7
+    if sampling_mode != "seek" and workers == 1:
+        assert stages["skip"]["count"] == 32
+        assert report["frames_read"] == 40
+    for stage in ("encode", "write", "slide_add"):
+        assert stages[stage]["count"] == 4
+    assert stages["save"]["count"] == 1
+    assert all(stages[stage]["seconds"] > 0 for stage in ("decode", "prepare", "encode", "save"))
+    assert report["frames_per_second"] > 0
+    assert report["file_bytes"] == os.path.getsize(output)
+    assert 0 < report["peak_rss_mb"] <= peak_rss_mb()
+
+
+def test_report_option(slides_video: str, temp_dir: str) -> None:
+    """Test that --report writes the run report as JSON."""
+    output = os.path.join(temp_dir, "out.pptx")
+    report_path = os.path.join(temp_dir, "report.json")
+    result = CliRunner().invoke(
+        app, ["convert", slides_video, "-o", output, "--report", report_path]
+    )
+    assert result.exit_code == 0, result.output
+
+    with open(report_path) as f:
+        report = json.load(f)
+    assert report["output_path"] == os.path.abspath(output)
+    assert report["slides"] == 4
+    assert list(report["stages"]) == list(STAGES)
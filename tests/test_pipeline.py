@@ -0,0 +1,185 @@
+"""Unit tests for the threaded extraction pipeline."""
+
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+
+import cv2
+import numpy as np
+import pytest
+
+from video2slides.converter import Video2Slides
+from video2slides.pipeline import BoundedExecutor, BoundedProducer, OrderedConsumer
+
+
+@pytest.fixture
+def temp_dir() -> str:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+@pytest.fixture
+def slides_video(temp_dir: str) -> str:
+    """Create a video of 6 slides, each shown for 2 seconds at 5 fps."""
+    video_path = os.path.join(temp_dir, "slides.mp4")
+
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(video_path, fourcc, 5.0, (320, 240))
+
+    for slide_num in range(6):
+        for _ in range(10):
+            frame = np.full((240, 320, 3), slide_num * 40, dtype=np.uint8)
+            cv2.putText(
+                frame,
+                f"Slide {slide_num}",
+                (60, 60 + slide_num * 30),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (255, 255, 255),
+                2,
+            )
+            out.write(frame)
+
+    out.release()
+    return video_path
+
+
+def test_producer_yields_items_in_order() -> None:
+    """Test that the producer thread forwards every item in order."""
+    with BoundedProducer(range(100), maxsize=3) as producer:
+        assert list(producer) == list(range(100))
+
+
+def test_producer_applies_backpressure() -> None:
+    """Test that the producer never runs more than maxsize items ahead of the consumer."""
+    produced = 0
+
+    def source() -> Iterator[int]:
+        nonlocal produced
+        for i in range(50):
+            produced += 1
+            yield i
+
+    with BoundedProducer(source(), maxsize=4) as producer:
+        items = iter(producer)
+        next(items)
+        time.sleep(0.2)
+        # One consumed, four queued, one blocked in put()
+        assert produced <= 6
+
+
+def test_producer_reraises_source_errors() -> None:
+    """Test that exceptions in the producer thread surface in the consumer."""
+
+    def source() -> Iterator[int]:
+        yield 1
+        raise RuntimeError("decoder failed")
+
+    with BoundedProducer(source(), maxsize=2) as producer, pytest.raises(RuntimeError):
+        list(producer)
+
+
+def test_executor_bounds_pending_tasks() -> None:
+    """Test that submit blocks while max_pending tasks are unfinished."""
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def task() -> None:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+
+    with BoundedExecutor(max_workers=8, max_pending=3) as executor:
+        for _ in range(20):
+            executor.submit(task)
+        executor.wait()
+
+    assert peak <= 3
+
+
+def test_executor_wait_reraises_errors() -> None:
+    """Test that task failures are re-raised by wait()."""
+
+    def task() -> None:
+        raise OSError("disk full")
+
+    with BoundedExecutor(max_workers=2, max_pending=2) as executor:
+        executor.submit(task)
+        with pytest.raises(OSError):
+            executor.wait()
+
+
+def test_executor_submit_reraises_completed_errors() -> None:
+    """Test that submit() re-raises a failure as soon as the task has completed."""
+    calls = []
+
+    def task() -> None:
+        calls.append(None)
+        raise OSError("disk full")
+
+    with BoundedExecutor(max_workers=1, max_pending=4) as executor:
+        executor.submit(task).exception()
+        with pytest.raises(OSError):
+            executor.submit(task)
+    assert len(calls) == 1
+
+
+def test_ordered_consumer_restores_order() -> None:
+    """Test that items submitted out of order from several threads are consumed in order."""
+    consumed: list[int] = []
+    with OrderedConsumer(consumed.append) as consumer:
+        indices = list(range(50))
+        threads = [
+            threading.Thread(target=lambda part=part: [consumer.submit(i, i) for i in part])
+            for part in (indices[1::3], indices[2::3], indices[0::3][::-1])
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        consumer.finish(len(indices))
+
+    assert consumed == indices
+
+
+def test_ordered_consumer_reraises_errors() -> None:
+    """Test that a failing consumer surfaces in finish() instead of hanging."""
+
+    def consume(item: int) -> None:
+        if item == 1:
+            raise OSError("disk full")
+
+    with OrderedConsumer(consume) as consumer:
+        consumer.submit(1, 1)
+        consumer.submit(0, 0)
+        with pytest.raises(OSError):
+            consumer.finish(3)
+
+
+@pytest.mark.parametrize("compare_workers", [1, 4])
+def test_extraction_independent_of_worker_count(
+    slides_video: str, temp_dir: str, compare_workers: int
+) -> None:
+    """Test that speculative parallel comparison keeps the same frames as a single worker."""
+    converter = Video2Slides(
+        video_path=slides_video,
+        output_path=os.path.join(temp_dir, "out.pptx"),
+        use_gpu=False,
+        compare_workers=compare_workers,
+        decode_queue_size=2,
+        writer_workers=2,
+        write_queue_size=1,
+    )
+    converter.extract_frames()
+
+    assert len(converter.frames) == 6
+    assert all(converter.frame_store.read(key) for key in converter.frames)
+    converter.cleanup()
@@ -0,0 +1,133 @@
+"""Unit tests for the direct PPTX writer."""
+
+import os
+import tempfile
+
+import cv2
+import numpy as np
+import pytest
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+from video2slides.converter import SLIDE_HEIGHT, SLIDE_WIDTH, Video2Slides
+from video2slides.frame_store import encode_frame
+from video2slides.pptx_writer import DirectPresentationWriter
+
+
+@pytest.fixture
+def temp_dir() -> str:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+@pytest.fixture
+def slides_video(temp_dir: str) -> str:
+    """Create a video of 4 slides, each shown for 2 seconds at 5 fps."""
+    video_path = os.path.join(temp_dir, "slides.mp4")
+
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(video_path, fourcc, 5.0, (320, 180))
+
+    for slide_num in range(4):
+        for _ in range(10):
+            frame = np.full((180, 320, 3), slide_num * 50, dtype=np.uint8)
+            cv2.putText(
+                frame,
+                f"Slide {slide_num}",
+                (40, 50 + slide_num * 30),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (255, 255, 255),
+                2,
+            )
+            out.write(frame)
+
+    out.release()
+    return video_path
+
+
+def _image(value: int) -> bytes:
+    return encode_frame(np.full((60, 80, 3), value, dtype=np.uint8))
+
+
+def _pictures(path: str) -> list[tuple[bytes, int, int, int, int]]:
+    return [
+        (shape.image.blob, shape.left, shape.top, shape.width, shape.height)
+        for slide in Presentation(path).slides
+        for shape in slide.shapes
+        if shape.shape_type == MSO_SHAPE_TYPE.PICTURE
+    ]
+
+
+def test_direct_writer_output_opens_with_python_pptx(temp_dir: str) -> None:
+    """Test that a streamed deck reads back with its title, pictures and slide size."""
+    output_path = os.path.join(temp_dir, "deck.pptx")
+    images = [_image(value) for value in (20, 120, 220)]
+
+    writer = DirectPresentationWriter(output_path, SLIDE_WIDTH, SLIDE_HEIGHT)
+    writer.add_title_slide("Title & <more>", "First line\nSecond line")
+    for index, image in enumerate(images):
+        writer.add_picture_slide(image, index, 10, 1000, 500)
+    assert not os.path.exists(output_path)
+    writer.save()
+
+    prs = Presentation(output_path)
+    assert (prs.slide_width, prs.slide_height) == (SLIDE_WIDTH, SLIDE_HEIGHT)
+    assert len(prs.slides) == 4
+    assert prs.slides[0].shapes.title.text == "Title & <more>"
+    assert prs.slides[0].placeholders[1].text == "First line\nSecond line"
+    assert _pictures(output_path) == [
+        (image, index, 10, 1000, 500) for index, image in enumerate(images)
+    ]
+    assert os.listdir(temp_dir) == ["deck.pptx"]
+
+    with pytest.raises(ValueError):
+        DirectPresentationWriter(output_path, SLIDE_WIDTH, SLIDE_HEIGHT).add_picture_slide(
+            images[0], 0, 0, 1, 1, extension="gif"
+        )
+
+
+def test_direct_writer_discards_partial_file(temp_dir: str) -> None:
+    """Test that a failure while writing leaves neither the output nor the partial file."""
+    output_path = os.path.join(temp_dir, "deck.pptx")
+
+    with pytest.raises(RuntimeError):
+        with DirectPresentationWriter(output_path, SLIDE_WIDTH, SLIDE_HEIGHT) as writer:
+            writer.add_picture_slide(_image(50), 0, 0, 100, 100)
+            raise RuntimeError("extraction failed")
+
+    assert os.listdir(temp_dir) == []
+
+
+@pytest.mark.parametrize("keep_aspect_ratio", [True, False])
+def test_convert_with_direct_writer_matches_python_pptx(
+    slides_video: str, temp_dir: str, keep_aspect_ratio: bool
+) -> None:
+    """Test that both PPTX writers produce the same slides for a conversion."""
+    outputs = {}
+    for pptx_writer in ("python-pptx", "direct"):
+        converter = Video2Slides(
+            video_path=slides_video,
+            output_path=os.path.join(temp_dir, "out", f"{pptx_writer}.pptx"),
+            use_gpu=False,
+            keep_aspect_ratio=keep_aspect_ratio,
+            pptx_writer=pptx_writer,
+        )
+        converter.convert()
+        outputs[pptx_writer] = converter.output_path
+
+    direct = Presentation(outputs["direct"])
+    assert len(direct.slides) == len(Presentation(outputs["python-pptx"]).slides) == 5
+    assert direct.slides[0].shapes.title.text == "Video2Slides"
+    assert _pictures(outputs["direct"]) == _pictures(outputs["python-pptx"])
+
+
+def test_unknown_pptx_writer(slides_video: str, temp_dir: str) -> None:
+    """Test that an unknown writer name is rejected."""
+    with pytest.raises(ValueError):
+        Video2Slides(
+            video_path=slides_video,
+            output_path=os.path.join(temp_dir, "out.pptx"),
+            pptx_writer="streaming",
+        )
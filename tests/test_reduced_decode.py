@@ -0,0 +1,100 @@
+"""Unit tests for comparing reduced frames and re-decoding only kept slides."""
+
+import os
+import tempfile
+
+import cv2
+import numpy as np
+import pytest
+
+from video2slides.converter import Video2Slides
+
+
+@pytest.fixture
+def temp_dir() -> str:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+@pytest.fixture
+def slides_video(temp_dir: str) -> str:
+    """Create a video of 6 slides, each shown for 2 seconds at 5 fps."""
+    video_path = os.path.join(temp_dir, "slides.mp4")
+
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(video_path, fourcc, 5.0, (320, 240))
+
+    for slide_num in range(6):
+        for _ in range(10):
+            frame = np.full((240, 320, 3), slide_num * 40, dtype=np.uint8)
+            cv2.putText(
+                frame,
+                f"Slide {slide_num}",
+                (60, 60 + slide_num * 30),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (255, 255, 255),
+                2,
+            )
+            out.write(frame)
+
+    out.release()
+    return video_path
+
+
+def _decode(data: bytes) -> np.ndarray:
+    return cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_reduced_decode_matches_full_decode(slides_video: str, temp_dir: str, workers: int) -> None:
+    """Test that comparing reduced frames keeps the same slides and writes full frames."""
+    full = Video2Slides(
+        video_path=slides_video,
+        output_path=os.path.join(temp_dir, "full.pptx"),
+        use_gpu=False,
+    )
+    full.extract_frames()
+    full_frames = list(full.frame_numbers)
+    full_images = [_decode(full.frame_store.read(key)) for key in full.frames]
+    full.cleanup()
+
+    reduced = Video2Slides(
+        video_path=slides_video,
+        output_path=os.path.join(temp_dir, "reduced.pptx"),
+        use_gpu=False,
+        workers=workers,
+        reduced_decode=True,
+    )
+    reduced.extract_frames()
+
+    assert reduced.frame_numbers == full_frames
+    for key, expected in zip(reduced.frames, full_images, strict=True):
+        image = _decode(reduced.frame_store.read(key))
+        assert image.shape == (240, 320, 3)
+        assert np.array_equal(image, expected)
+    reduced.cleanup()
+
+
+def test_reduced_decode_queues_comparison_images(slides_video: str, temp_dir: str) -> None:
+    """Test that only reduced grayscale images reach change detection."""
+    converter = Video2Slides(
+        video_path=slides_video,
+        output_path=os.path.join(temp_dir, "out.pptx"),
+        use_gpu=False,
+        reduced_decode=True,
+    )
+    shapes: set[tuple[int, ...]] = set()
+    iter_decisions = converter._iter_decisions
+
+    def recording_iter_decisions(samples, *args, **kwargs):  # type: ignore[no-untyped-def]
+        for frame_number, frame, should_save in iter_decisions(samples, *args, **kwargs):
+            shapes.add(frame.shape)
+            yield frame_number, frame, should_save
+
+    converter._iter_decisions = recording_iter_decisions  # type: ignore[method-assign]
+    converter.extract_frames()
+
+    assert shapes == {(240, 320)}
+    converter.cleanup()
@@ -0,0 +1,90 @@
+"""Unit tests for comparison regions."""
+
+import os
+import tempfile
+
+import cv2
+import numpy as np
+import pytest
+
+from video2slides.converter import Video2Slides
+from video2slides.regions import ComparisonRegion, Rect, detect_speaker_box, parse_rect
+
+
+@pytest.fixture
+def temp_dir() -> str:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+@pytest.fixture
+def speaker_video(temp_dir: str) -> str:
+    """Create a static slide video with a moving 'speaker' box on the middle-right edge."""
+    video_path = os.path.join(temp_dir, "speaker.mp4")
+
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(video_path, fourcc, 10.0, (320, 240))
+
+    slide = np.full((240, 320, 3), 200, dtype=np.uint8)
+    cv2.putText(slide, "Slide", (40, 130), cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 0, 0), 3)
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        frame = slide.copy()
+        frame[90:150, 250:310] = rng.integers(0, 255, (60, 60, 3), dtype=np.uint8)
+        out.write(frame)
+
+    out.release()
+    return video_path
+
+
+def test_parse_rect() -> None:
+    """Test parsing of x,y,width,height rectangles."""
+    assert parse_rect("0.7, 0.6, 0.3, 0.4") == Rect(0.7, 0.6, 0.3, 0.4)
+    for text in ("0.1,0.2,0.3", "a,b,c,d", "0,0,1.5,1", "0,0,0,1"):
+        with pytest.raises(ValueError):
+            parse_rect(text)
+
+
+def test_mask_is_built_once_per_resolution() -> None:
+    """Test that masks are cached by comparison size."""
+    region = ComparisonRegion(ignore_corners=True, corner_size_percent=0.25)
+    mask = region.mask_for(100, 200)
+    assert mask is not None
+    assert region.mask_for(100, 200) is mask
+    assert region.mask_for(50, 100) is not mask
+    assert mask[0, 0] == 0 and mask[99, 199] == 0 and mask[50, 100] == 255
+
+
+def test_no_mask_without_ignored_areas() -> None:
+    """Test that nothing is allocated when no area is ignored."""
+    region = ComparisonRegion(ignore_corners=False)
+    assert region.mask_for(100, 200) is None
+
+
+def test_crop_and_ignore_rect(speaker_video: str) -> None:
+    """Test that ignored rectangles and crops exclude an overlay outside the corners."""
+    frame1 = np.full((480, 640, 3), 128, dtype=np.uint8)
+    frame2 = frame1.copy()
+    frame2[180:300, 500:620] = 255
+
+    converter = Video2Slides(video_path=speaker_video, use_gpu=False)
+    assert converter._compute_frame_similarity(frame1, frame2) < 0.99
+
+    converter.ignore_regions = [Rect(0.75, 0.35, 0.25, 0.3)]
+    assert converter._compute_frame_similarity(frame1, frame2) > 0.99
+
+    converter.ignore_regions = []
+    converter.crop_region = Rect(0.0, 0.0, 0.75, 1.0)
+    assert converter._compute_frame_similarity(frame1, frame2) > 0.99
+    assert converter._prepare_signature(frame1).image.shape == (480, 480)
+
+
+def test_detect_speaker_box(speaker_video: str) -> None:
+    """Test that a persistent moving overlay is detected."""
+    box = detect_speaker_box(speaker_video)
+    assert box is not None
+    x0, y0, x1, y1 = box.to_pixels(320, 240)
+    assert x0 <= 250 and x1 >= 305
+    assert y0 <= 90 and y1 >= 145
+    assert (x1 - x0) * (y1 - y0) < 0.2 * 320 * 240
@@ -0,0 +1,174 @@
+"""Unit tests for sparse frame sampling."""
+
+import os
+import tempfile
+
+import cv2
+import numpy as np
+import pytest
+
+from video2slides.converter import Video2Slides
+from video2slides.sampling import (
+    AdaptiveSampler,
+    FrameSampler,
+    choose_sampling_mode,
+    estimate_gop_size,
+)
+
+
+@pytest.fixture
+def temp_dir() -> str:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+@pytest.fixture
+def numbered_video(temp_dir: str) -> str:
+    """Create a 100-frame video where every frame shows its own index."""
+    video_path = os.path.join(temp_dir, "numbered.mp4")
+
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(video_path, fourcc, 10.0, (320, 240))
+
+    for i in range(100):
+        frame = np.zeros((240, 320, 3), dtype=np.uint8)
+        cv2.putText(frame, str(i), (40, 160), cv2.FONT_HERSHEY_SIMPLEX, 3, (255, 255, 255), 5)
+        out.write(frame)
+
+    out.release()
+    return video_path
+
+
+# First frames of the slides of slide_video, out of 600 frames at 10 fps
+SLIDE_STARTS = [0, 37, 95, 103, 400, 590]
+
+
+@pytest.fixture
+def slide_video(temp_dir: str) -> str:
+    """Create a 600-frame video whose slides change at SLIDE_STARTS."""
+    video_path = os.path.join(temp_dir, "slides.mp4")
+    out = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*"mp4v"), 10.0, (320, 240))
+    for i in range(600):
+        slide = sum(start <= i for start in SLIDE_STARTS) - 1
+        frame = np.full((240, 320, 3), slide * 40, dtype=np.uint8)
+        cv2.putText(
+            frame, f"Slide {slide}", (20, 60 + slide * 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (255,) * 3, 2
+        )
+        out.write(frame)
+    out.release()
+    return video_path
+
+
+def _sample(video_path: str, frame_interval: int, mode: str) -> list[tuple[int, np.ndarray]]:
+    cap = cv2.VideoCapture(video_path)
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    samples = list(FrameSampler(cap, frame_interval, mode=mode, total_frames=total_frames))
+    cap.release()
+    return samples
+
+
+@pytest.mark.parametrize("frame_interval", [1, 7, 30, 40])
+def test_sampling_modes_return_same_frames(numbered_video: str, frame_interval: int) -> None:
+    """Test that grab and seek modes yield exactly the frames decode-all yields."""
+    reference = _sample(numbered_video, frame_interval, "read")
+    assert [idx for idx, _ in reference] == list(range(0, 100, frame_interval))
+
+    for mode in ("grab", "seek", "auto"):
+        samples = _sample(numbered_video, frame_interval, mode)
+        assert [idx for idx, _ in samples] == [idx for idx, _ in reference], mode
+        for (_, expected), (_, actual) in zip(reference, samples, strict=True):
+            assert np.array_equal(expected, actual), mode
+
+
+def test_estimate_gop_size_rewinds_capture(numbered_video: str) -> None:
+    """Test that GOP probing reports a keyframe distance and leaves the capture at frame 0."""
+    cap = cv2.VideoCapture(numbered_video)
+    gop_size = estimate_gop_size(cap)
+    assert gop_size is None or gop_size >= 1
+    assert cap.get(cv2.CAP_PROP_POS_FRAMES) == 0
+    cap.release()
+
+
+def test_choose_sampling_mode() -> None:
+    """Test automatic choice between grabbing and seeking."""
+    assert choose_sampling_mode(5, 12) == "grab"
+    assert choose_sampling_mode(300, None) == "grab"
+    assert choose_sampling_mode(300, 250) == "grab"
+    assert choose_sampling_mode(300, 12) == "seek"
+
+
+def test_invalid_sampling_mode(numbered_video: str) -> None:
+    """Test that unknown sampling modes are rejected."""
+    with pytest.raises(ValueError):
+        Video2Slides(video_path=numbered_video, sampling_mode="fast", use_gpu=False)
+
+
+def test_sampler_respects_frame_range(numbered_video: str) -> None:
+    """Test that start_frame/end_frame restrict sampling to a segment of the video."""
+    for mode in ("read", "grab", "seek"):
+        cap = cv2.VideoCapture(numbered_video)
+        sampler = FrameSampler(cap, 10, mode=mode, total_frames=100, start_frame=30, end_frame=60)
+        assert [idx for idx, _ in sampler] == [30, 40, 50], mode
+        cap.release()
+
+
+def _adaptive(video_path: str, total_frames: int, **options: int) -> list[tuple[int, bool]]:
+    """Run adaptive sampling, telling slides apart by their mean brightness."""
+    cap = cv2.VideoCapture(video_path)
+    sampler = AdaptiveSampler(
+        cap,
+        lambda _, frame: round(float(frame.mean()) / 10),
+        lambda reference, brightness: reference != brightness,
+        total_frames=total_frames,
+        **options,
+    )
+    decisions = [(idx, keep) for idx, _, keep in sampler]
+    cap.release()
+    return decisions
+
+
+@pytest.mark.parametrize("total_frames", [600, 0, 5000])
+def test_adaptive_sampler_locates_changes(slide_video: str, total_frames: int) -> None:
+    """Test that adaptive sampling keeps the exact first frame of every slide."""
+    decisions = _adaptive(slide_video, total_frames, min_interval=10, max_interval=160)
+    assert [idx for idx, keep in decisions if keep] == SLIDE_STARTS
+    # Far fewer comparisons than sampling every 10 frames, even with a wrong frame count
+    assert len(decisions) < 600 // 10
+    assert all(0 <= idx < 600 for idx, _ in decisions)
+
+
+def test_adaptive_sampler_steps(slide_video: str) -> None:
+    """Test exponential steps, precision and bisection across several changes."""
+    decisions = _adaptive(slide_video, 600, min_interval=10, max_interval=40, precision=8)
+    kept = [idx for idx, keep in decisions if keep]
+    assert len(kept) == len(SLIDE_STARTS)
+    assert all(0 <= idx - start < 8 for idx, start in zip(kept, SLIDE_STARTS, strict=True))
+    # Static samples after the first slide: steps of 10, 20 and 40 frames
+    assert [idx for idx, _ in decisions[1:3]] == [10, 30]
+
+    # A single step across the whole video still finds every slide that differs from the last
+    decisions = _adaptive(slide_video, 600, min_interval=600, max_interval=600)
+    assert [idx for idx, keep in decisions if keep] == SLIDE_STARTS
+
+
+def test_adaptive_conversion(slide_video: str, temp_dir: str) -> None:
+    """Test that the converter keeps slides at their exact start with adaptive sampling."""
+    converter = Video2Slides(
+        slide_video,
+        os.path.join(temp_dir, "out.pptx"),
+        sampling_mode="adaptive",
+        max_interval=8,
+        use_gpu=False,
+    )
+    converter.convert()
+    assert converter.frame_numbers == SLIDE_STARTS
+    report = converter.run_report()
+    assert report["slide_seconds"] == [start / 10 for start in SLIDE_STARTS]
+    assert report["samples"] < 60
+    assert report["stages"]["decode"]["count"] == report["samples"]
+
+    with pytest.raises(ValueError, match="adaptive sampling cannot be combined with: workers > 1"):
+        Video2Slides(slide_video, sampling_mode="adaptive", workers=2, use_gpu=False)
+    with pytest.raises(ValueError, match="max_interval must be positive"):
+        Video2Slides(slide_video, max_interval=0, use_gpu=False)
@@ -0,0 +1,100 @@
+"""Unit tests for process-parallel segment extraction."""
+
+import os
+import tempfile
+
+import cv2
+import numpy as np
+import pytest
+
+from video2slides import segments
+from video2slides.converter import Video2Slides
+from video2slides.segments import plan_segments
+
+
+@pytest.fixture
+def temp_dir() -> str:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+@pytest.fixture
+def slides_video(temp_dir: str) -> str:
+    """Create a video of 6 slides, each shown for 2 seconds at 5 fps."""
+    video_path = os.path.join(temp_dir, "slides.mp4")
+
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(video_path, fourcc, 5.0, (320, 240))
+
+    for slide_num in range(6):
+        for _ in range(10):
+            frame = np.full((240, 320, 3), slide_num * 40, dtype=np.uint8)
+            cv2.putText(
+                frame,
+                f"Slide {slide_num}",
+                (60, 60 + slide_num * 30),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (255, 255, 255),
+                2,
+            )
+            out.write(frame)
+
+    out.release()
+    return video_path
+
+
+def _serial_frames(video_path: str, output_dir: str) -> list[int]:
+    serial = Video2Slides(
+        video_path=video_path,
+        output_path=os.path.join(output_dir, "serial.pptx"),
+        use_gpu=False,
+    )
+    serial.extract_frames()
+    serial.cleanup()
+    return serial.frame_numbers
+
+
+@pytest.mark.parametrize("workers", [2, 3, 5])
+def test_segment_extraction_matches_serial(slides_video: str, temp_dir: str, workers: int) -> None:
+    """Test that parallel segments keep exactly the frames the serial path keeps."""
+    serial_frames = _serial_frames(slides_video, temp_dir)
+
+    parallel = Video2Slides(
+        video_path=slides_video,
+        output_path=os.path.join(temp_dir, "parallel.pptx"),
+        use_gpu=False,
+        workers=workers,
+    )
+    parallel.extract_frames()
+
+    assert parallel.frame_numbers == serial_frames
+    assert len(parallel.frames) == len(serial_frames)
+    assert all(parallel.frame_store.read(key) for key in parallel.frames)
+    parallel.cleanup()
+
+
+def test_stitching_inside_a_slide_decodes_no_samples(
+    slides_video: str, temp_dir: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that segments starting inside a slide are stitched from the workers' images."""
+    serial_frames = _serial_frames(slides_video, temp_dir)
+    # Segments start at frames 15 and 45, in the middle of slides 1 and 4
+    assert [segment.start_frame for segment in plan_segments(60, 5, 4)] == [0, 15, 30, 45]
+
+    def no_sampling(*args: object, **kwargs: object) -> None:
+        raise AssertionError("samples were decoded again while stitching")
+
+    # Spawned workers import the module afresh and still sample their segments
+    monkeypatch.setattr(segments, "FrameSampler", no_sampling)
+    parallel = Video2Slides(
+        video_path=slides_video,
+        output_path=os.path.join(temp_dir, "parallel.pptx"),
+        use_gpu=False,
+        workers=4,
+    )
+    parallel.extract_frames()
+
+    assert parallel.frame_numbers == serial_frames
+    parallel.cleanup()
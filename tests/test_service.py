@@ -0,0 +1,173 @@
+"""Unit tests for the conversion service."""
+
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Iterator
+from http.client import HTTPConnection
+
+import cv2
+import numpy as np
+import pytest
+
+from video2slides.service import ConversionService, ServiceHTTPServer, make_server
+
+
+@pytest.fixture
+def temp_dir() -> str:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+def _write_video(path: str, slides: int = 4) -> str:
+    """Write a video of ``slides`` slides, each shown for 2 seconds at 5 fps."""
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(path, fourcc, 5.0, (320, 240))
+    for slide_num in range(slides):
+        for _ in range(10):
+            frame = np.full((240, 320, 3), slide_num * 50 % 256, dtype=np.uint8)
+            cv2.putText(
+                frame,
+                f"Slide {slide_num}",
+                (20, 60 + slide_num * 40),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (255, 255, 255),
+                2,
+            )
+            out.write(frame)
+    out.release()
+    return path
+
+
+@pytest.fixture
+def videos(temp_dir: str) -> list[str]:
+    """Create three short slide videos."""
+    return [_write_video(os.path.join(temp_dir, f"lecture{i}.mp4")) for i in range(3)]
+
+
+@pytest.fixture
+def server(temp_dir: str) -> Iterator[ServiceHTTPServer]:
+    """Serve a one-worker service on a free local port."""
+    with ConversionService(workers=1, output_dir=os.path.join(temp_dir, "out")) as service:
+        server = make_server(service, "127.0.0.1", 0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield server
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+def _request(
+    server: ServiceHTTPServer, method: str, path: str, body: object = None
+) -> tuple[int, dict]:
+    connection = HTTPConnection(*server.server_address[:2], timeout=120)
+    try:
+        payload = body if isinstance(body, bytes) or body is None else json.dumps(body).encode()
+        connection.request(method, path, body=payload)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+def test_service_converts_jobs(videos: list[str], temp_dir: str) -> None:
+    """Test that queued jobs are converted on the workers with bounded decoding."""
+    output_dir = os.path.join(temp_dir, "out")
+    with ConversionService(workers=2, max_decodes=1, output_dir=output_dir) as service:
+        service.warm_up()
+        first = service.submit(videos[0])
+        second = service.submit(videos[1], "named.pptx", {"similarity_threshold": "0.9"})
+        assert first.status == "queued"
+        assert second.output_path == os.path.join(output_dir, "named.pptx")
+
+        for job in (first, second):
+            service.wait(job.id, timeout=120)
+            assert job.status == "converted", job.result
+            assert job.result.slide_count == 4
+            assert job.result.stages["decode"]["count"] == 8
+            assert job.progress["stage"] == "done" and job.progress["fraction"] == 1.0
+            assert job.started_at is not None and job.finished_at >= job.started_at
+            assert os.path.exists(job.output_path)
+
+        assert service.summary()["jobs"]["converted"] == 2
+        assert [job.id for job in service.jobs()] == [first.id, second.id]
+
+
+def test_service_rejects_and_fails_jobs(videos: list[str], temp_dir: str) -> None:
+    """Test validation on submission and failures reported by workers."""
+    with ConversionService(workers=1, output_dir=temp_dir) as service:
+        with pytest.raises(FileNotFoundError):
+            service.submit(os.path.join(temp_dir, "missing.mp4"))
+        with pytest.raises(ValueError, match="Unknown option"):
+            service.submit(videos[0], options={"bogus": 1})
+
+        for output, options in [
+            ("/tmp/elsewhere.pptx", None),
+            ("../escaped.pptx", None),
+            (None, {"cache_dir": "/tmp"}),
+            (None, {"checkpoint_dir": "nested/../../up"}),
+        ]:
+            with pytest.raises(ValueError, match="output directory"):
+                service.submit(videos[0], output, options)
+        assert not service.jobs()
+
+        job = service.submit(videos[0], options={"max_dpi": 0})
+        with pytest.raises(ValueError, match="already writes"):
+            service.submit(videos[0])
+
+        service.wait(job.id, timeout=120)
+        assert job.status == "failed"
+        assert "max_dpi" in job.result.error
+        with pytest.raises(KeyError):
+            service.get("missing")
+
+    with pytest.raises(ValueError, match="max_decodes"):
+        ConversionService(workers=1, max_decodes=0)
+
+
+def test_service_cancels_queued_jobs(videos: list[str], temp_dir: str) -> None:
+    """Test that jobs still waiting in the queue can be cancelled."""
+    with ConversionService(workers=1, output_dir=temp_dir) as service:
+        service.warm_up()
+        jobs = [service.submit(video) for video in videos]
+        jobs.append(service.submit(videos[0], "again.pptx"))
+        assert service.cancel(jobs[-1].id)
+        assert jobs[-1].status == "cancelled"
+
+        for job in jobs[:-1]:
+            service.wait(job.id, timeout=120)
+            assert job.status == "converted"
+        assert not service.cancel(jobs[0].id)
+        assert not os.path.exists(jobs[-1].output_path)
+
+
+def test_http_api(server: ServiceHTTPServer, videos: list[str]) -> None:
+    """Test submitting, following and listing jobs over HTTP."""
+    status, job = _request(server, "POST", "/jobs", {"video": videos[0]})
+    assert status == 201 and job["status"] == "queued"
+
+    status, job = _request(server, "GET", f"/jobs/{job['id']}?wait=120")
+    assert status == 200
+    assert job["status"] == "converted"
+    assert job["result"]["slide_count"] == 4
+    assert os.path.exists(job["output_path"])
+
+    status, listing = _request(server, "GET", "/jobs")
+    assert status == 200 and [entry["id"] for entry in listing["jobs"]] == [job["id"]]
+    status, health = _request(server, "GET", "/health")
+    assert status == 200
+    assert health["workers"] == 1 and health["jobs"]["converted"] == 1
+
+    assert _request(server, "DELETE", f"/jobs/{job['id']}")[0] == 409
+    assert _request(server, "GET", "/jobs/missing")[0] == 404
+    assert _request(server, "GET", "/nothing")[0] == 404
+    assert _request(server, "POST", "/jobs", b"not json")[0] == 400
+    status, error = _request(server, "POST", "/jobs", {"video": videos[1], "options": {"x": 1}})
+    assert status == 400 and "Unknown option" in error["error"]
+    status, error = _request(server, "POST", "/jobs", {"video": videos[1], "output": "../x.pptx"})
+    assert status == 400 and "output directory" in error["error"]
@@ -0,0 +1,89 @@
+"""Unit tests for the OpenCV-based SSIM implementation."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+import pytest
+from skimage.metrics import structural_similarity as skimage_ssim
+
+from video2slides.ssim import (
+    SSIM_TOLERANCE,
+    compute_stats,
+    ssim_batch,
+    ssim_score,
+    structural_similarity,
+)
+
+
+def _slide(text: str, shape: tuple[int, int] = (480, 640), background: int = 30) -> np.ndarray:
+    image = np.full(shape, background, dtype=np.uint8)
+    cv2.putText(image, text, (40, shape[0] // 2), cv2.FONT_HERSHEY_SIMPLEX, 2, 230, 4)
+    return image
+
+
+@pytest.fixture
+def image_pairs() -> list[tuple[np.ndarray, np.ndarray]]:
+    """Pairs of grayscale images covering noise, slides, identical and tiny images."""
+    rng = np.random.default_rng(42)
+    noise = rng.integers(0, 256, (480, 640), dtype=np.uint8)
+    noisy = np.clip(noise.astype(np.int16) + rng.integers(-30, 30, noise.shape), 0, 255)
+    return [
+        (noise, noisy.astype(np.uint8)),
+        (_slide("Intro"), _slide("Intro")),
+        (_slide("Intro"), _slide("Results")),
+        (_slide("Intro"), _slide("Intro", background=60)),
+        (noise, _slide("Intro")),
+        (noise[:7, :7], noisy[:7, :7].astype(np.uint8)),
+        (noise[:120, :213], _slide("Intro")[:120, :213]),
+    ]
+
+
+def test_matches_skimage(image_pairs: list[tuple[np.ndarray, np.ndarray]]) -> None:
+    """Test that scores agree with scikit-image within the documented tolerance."""
+    for image1, image2 in image_pairs:
+        expected = skimage_ssim(image1, image2)
+        assert structural_similarity(image1, image2) == pytest.approx(expected, abs=SSIM_TOLERANCE)
+
+
+def test_batch_matches_individual_scores(image_pairs: list[tuple[np.ndarray, np.ndarray]]) -> None:
+    """Test that batched scoring equals scoring each candidate separately."""
+    reference = compute_stats(_slide("Intro"))
+    candidates = [
+        compute_stats(image)
+        for pair in image_pairs
+        for image in pair
+        if image.shape == reference.image.shape
+    ]
+
+    batch = ssim_batch(reference, candidates)
+    individual = [ssim_score(reference, candidate) for candidate in candidates]
+
+    assert batch.shape == (len(candidates),)
+    np.testing.assert_allclose(batch, individual, atol=1e-6)
+    assert ssim_batch(reference, []).shape == (0,)
+
+
+def test_concurrent_scoring_uses_separate_buffers() -> None:
+    """Test that per-thread work buffers keep concurrent comparisons independent."""
+    reference = compute_stats(_slide("Intro"))
+    candidates = [compute_stats(_slide(f"Slide {i}", background=10 * i)) for i in range(8)]
+    expected = [ssim_score(reference, candidate) for candidate in candidates]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for _ in range(5):
+            scores = list(pool.map(lambda c: ssim_score(reference, c), candidates))
+            assert scores == expected
+
+
+def test_invalid_inputs() -> None:
+    """Test shape validation."""
+    with pytest.raises(ValueError):
+        compute_stats(np.zeros((5, 40), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        compute_stats(np.zeros((40, 40, 3), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        ssim_score(
+            compute_stats(np.zeros((40, 40), dtype=np.uint8)),
+            compute_stats(np.zeros((40, 41), dtype=np.uint8)),
+        )
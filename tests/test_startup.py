@@ -0,0 +1,78 @@
+"""Unit tests for lazy imports and CLI startup."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import video2slides
+
+HEAVY_MODULES = ("cv2", "numpy", "pptx", "skimage", "eliot")
+
+
+def _loaded_modules(code: str) -> tuple[int, list[str]]:
+    """Run code in a fresh interpreter; return its exit code and the heavy modules it loaded."""
+    report = (
+        "import atexit, json, sys\n"
+        "atexit.register(lambda: print(json.dumps("
+        f"[m for m in {HEAVY_MODULES!r} if m in sys.modules]), file=sys.stderr))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", report + code], capture_output=True, text=True, timeout=60
+    )
+    return result.returncode, json.loads(result.stderr.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    ("args", "exit_code"),
+    [
+        (["--help"], 0),
+        (["convert", "--help"], 0),
+        (["batch", "--help"], 0),
+        (["bench", "--help"], 0),
+        # Rejected by argument validation before the command runs
+        (["convert", "--similarity", "2", "missing.mp4"], 2),
+    ],
+)
+def test_cli_startup_skips_heavy_imports(args: list[str], exit_code: int) -> None:
+    """Test that help and argument errors do not import OpenCV, NumPy or python-pptx."""
+    code = f"from video2slides.main import app\napp({args!r})"
+    assert _loaded_modules(code) == (exit_code, [])
+
+
+def test_package_import_is_lazy() -> None:
+    """Test that importing the package loads nothing heavy until a name is used."""
+    assert _loaded_modules("import video2slides") == (0, [])
+    exit_code, modules = _loaded_modules("from video2slides import Video2Slides")
+    assert exit_code == 0 and "cv2" in modules
+    # ``main`` is the CLI app, not the video2slides.main module
+    code = "import typer\nfrom video2slides import main\nassert isinstance(main, typer.Typer)"
+    assert _loaded_modules(code) == (0, [])
+
+
+def test_main_is_app_after_submodule_import() -> None:
+    """Test that importing video2slides.main first does not rebind ``main`` to the module."""
+    code = (
+        "import typer\n"
+        "import video2slides.main\n"
+        "from video2slides import main\n"
+        "assert isinstance(main, typer.Typer), main\n"
+        "import video2slides\n"
+        "assert video2slides.main is main"
+    )
+    assert _loaded_modules(code) == (0, [])
+
+
+def test_lazy_attributes() -> None:
+    """Test that the public names resolve to the objects of their modules."""
+    from video2slides.batch import convert_many
+    from video2slides.converter import Video2Slides
+    from video2slides.sweep import sweep_thresholds
+
+    assert video2slides.Video2Slides is Video2Slides
+    assert video2slides.convert_many is convert_many
+    assert video2slides.sweep_thresholds is sweep_thresholds
+    assert set(video2slides.__all__) <= set(dir(video2slides))
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        video2slides.missing  # noqa: B018
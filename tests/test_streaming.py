@@ -0,0 +1,130 @@
+"""Unit tests for building the presentation while frames are extracted."""
+
+import os
+import tempfile
+import threading
+
+import cv2
+import numpy as np
+import pytest
+from pptx import Presentation
+
+from video2slides.converter import Video2Slides
+
+
+@pytest.fixture
+def temp_dir() -> str:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+@pytest.fixture
+def slides_video(temp_dir: str) -> str:
+    """Create a video of 6 slides, each shown for 2 seconds at 5 fps."""
+    video_path = os.path.join(temp_dir, "slides.mp4")
+
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(video_path, fourcc, 5.0, (320, 240))
+
+    for slide_num in range(6):
+        for _ in range(10):
+            frame = np.full((240, 320, 3), slide_num * 40, dtype=np.uint8)
+            cv2.putText(
+                frame,
+                f"Slide {slide_num}",
+                (60, 60 + slide_num * 30),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (255, 255, 255),
+                2,
+            )
+            out.write(frame)
+
+    out.release()
+    return video_path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_convert_streams_slides_during_extraction(
+    slides_video: str, temp_dir: str, workers: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that slides streamed by convert() match a presentation generated afterwards."""
+    batch = Video2Slides(
+        video_path=slides_video,
+        output_path=os.path.join(temp_dir, "batch.pptx"),
+        use_gpu=False,
+        frame_store="memory",
+    )
+    batch.extract_frames()
+    batch.generate_ppt()
+    batch.cleanup()
+
+    streamed = Video2Slides(
+        video_path=slides_video,
+        output_path=os.path.join(temp_dir, "streamed.pptx"),
+        use_gpu=False,
+        frame_store="memory",
+        workers=workers,
+    )
+    added: list[str] = []
+    add_frame_slide = Video2Slides._add_frame_slide
+
+    def recording_add_frame_slide(self: Video2Slides, prs: object, key: str) -> None:
+        add_frame_slide(self, prs, key)  # type: ignore[arg-type]
+        added.append(key)
+
+    # Patched on the class: spawned segment workers never add slides
+    monkeypatch.setattr(Video2Slides, "_add_frame_slide", recording_add_frame_slide)
+    streamed.convert()
+
+    def pictures(path: str) -> list[bytes]:
+        return [
+            shape.image.blob
+            for slide in Presentation(path).slides
+            for shape in slide.shapes
+            if shape.shape_type == 13  # picture
+        ]
+
+    assert added == [f"frame_{i:04d}.jpg" for i in range(6)]
+    assert pictures(streamed.output_path) == pictures(batch.output_path)
+    assert len(Presentation(streamed.output_path).slides) == 7
+
+
+def test_slides_are_built_while_extraction_runs_ahead(
+    slides_video: str, temp_dir: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that extraction keeps storing frames while the first slide is still being built."""
+    converter = Video2Slides(
+        video_path=slides_video,
+        output_path=os.path.join(temp_dir, "out.pptx"),
+        use_gpu=False,
+        frame_store="memory",
+    )
+    # Set once the first slide is being built, and once two more frames are stored
+    building = threading.Event()
+    ran_ahead = threading.Event()
+    overlapped: list[bool] = []
+    put_frame = Video2Slides._put_frame
+    add_frame_slide = Video2Slides._add_frame_slide
+
+    def gated_put_frame(self: Video2Slides, index: int, data: bytes) -> None:
+        if index >= 1:
+            # Built only after extraction, no slide would start within the timeout
+            building.wait(timeout=10)
+        put_frame(self, index, data)
+        if index == 2:
+            ran_ahead.set()
+
+    def blocking_add_frame_slide(self: Video2Slides, prs: object, key: str) -> None:
+        if not building.is_set():
+            building.set()
+            overlapped.append(not ran_ahead.is_set() and ran_ahead.wait(timeout=10))
+        add_frame_slide(self, prs, key)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(Video2Slides, "_put_frame", gated_put_frame)
+    monkeypatch.setattr(Video2Slides, "_add_frame_slide", blocking_add_frame_slide)
+    converter.convert()
+
+    assert overlapped == [True]
+    assert len(Presentation(converter.output_path).slides) == 7
@@ -0,0 +1,171 @@
+"""Unit tests for the threshold sweep."""
+
+import json
+import os
+import tempfile
+
+import cv2
+import numpy as np
+import pytest
+from typer.testing import CliRunner
+
+from video2slides.converter import Video2Slides
+from video2slides.main import app
+from video2slides.sweep import SweepResult, ThresholdResult, parse_thresholds, sweep_thresholds
+
+
+@pytest.fixture
+def temp_dir() -> str:
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+@pytest.fixture
+def slides_video(temp_dir: str) -> str:
+    """Create a video of 6 slides with gradual changes, each shown for 2 seconds at 5 fps."""
+    video_path = os.path.join(temp_dir, "slides.mp4")
+
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(video_path, fourcc, 5.0, (320, 240))
+
+    for slide_num in range(6):
+        for step in range(10):
+            frame = np.full((240, 320, 3), slide_num * 40, dtype=np.uint8)
+            cv2.putText(
+                frame,
+                f"Slide {slide_num}",
+                (60, 60 + slide_num * 30),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (255, 255, 255),
+                2,
+            )
+            # A bullet point appears half way through each slide
+            if step >= 5:
+                cv2.putText(
+                    frame, "- point", (60, 220), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1
+                )
+            out.write(frame)
+
+    out.release()
+    return video_path
+
+
+def _sweep_result(counts: list[int], thresholds: list[float]) -> SweepResult:
+    return SweepResult(
+        video_path="video.mp4",
+        detector="ssim",
+        fps=1.0,
+        frame_interval=1,
+        sample_frame_numbers=[],
+        similarity_to_previous=[],
+        results=[
+            ThresholdResult(threshold, list(range(count)))
+            for threshold, count in zip(thresholds, counts, strict=True)
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"detector": "tiered", "ignore_corners": False},
+        {"detector": "hash", "compare_workers": 1},
+    ],
+)
+def test_sweep_matches_conversions(slides_video: str, temp_dir: str, options: dict) -> None:
+    """Test that every threshold keeps exactly the frames a conversion at it would keep."""
+    thresholds = [0.5, 0.8, 0.9, 0.95, 0.99, 0.999]
+    sweep = sweep_thresholds(Video2Slides(slides_video, use_gpu=False, **options), thresholds)
+
+    assert [result.threshold for result in sweep.results] == thresholds
+    assert len(sweep.sample_frame_numbers) == len(sweep.similarity_to_previous) == 12
+    assert sweep.similarity_to_previous[0] is None
+    for result in sweep.results:
+        converter = Video2Slides(
+            slides_video,
+            os.path.join(temp_dir, "out.pptx"),
+            use_gpu=False,
+            similarity_threshold=result.threshold,
+            **options,
+        )
+        converter.extract_frames()
+        converter.cleanup()
+        assert result.frame_numbers == converter.frame_numbers, result.threshold
+        assert result.timestamps == [n / 5.0 for n in converter.frame_numbers]
+
+    counts = [result.slide_count for result in sweep.results]
+    assert counts == sorted(counts) and counts[0] < counts[-1]
+
+
+def test_sweep_shares_comparisons(slides_video: str) -> None:
+    """Test that thresholds sharing a reference frame share its comparison."""
+    thresholds = parse_thresholds("0.5:0.99:0.01")
+    sweep = sweep_thresholds(Video2Slides(slides_video, use_gpu=False), thresholds)
+
+    samples = len(sweep.sample_frame_numbers)
+    # At most one comparison per distinct reference and one to the previous sample
+    assert sweep.comparisons <= samples * (sweep.results[-1].slide_count + 1)
+    assert sweep.comparisons < samples * len(thresholds) // 4
+
+
+def test_sweep_rejects_adaptive_sampling(slides_video: str) -> None:
+    """Test that sweeps refuse adaptive sampling, whose samples depend on one threshold."""
+    converter = Video2Slides(slides_video, use_gpu=False, sampling_mode="adaptive")
+    with pytest.raises(ValueError, match="Threshold sweeps need one of the sampling modes"):
+        sweep_thresholds(converter, [0.9])
+
+
+def test_parse_thresholds() -> None:
+    """Test threshold grid parsing."""
+    assert parse_thresholds("0.9,0.8, 0.9") == [0.8, 0.9]
+    assert parse_thresholds("0.5:0.6:0.05") == [0.5, 0.55, 0.6]
+    assert len(parse_thresholds("0.50:0.99:0.01")) == 50
+
+    for spec in ["", "0.5:0.4:0.1", "0.5:0.6:0", "0.5:1.2:0.1", "high", "0.1:0.2"]:
+        with pytest.raises(ValueError):
+            parse_thresholds(spec)
+
+
+def test_recommendations() -> None:
+    """Test the knee and target slide count picks."""
+    thresholds = [0.5, 0.6, 0.7, 0.8, 0.85, 0.9, 0.95, 0.99]
+    sweep = _sweep_result([8, 9, 10, 10, 10, 10, 30, 80], thresholds)
+
+    # Middle of the plateau ending at the knee
+    assert sweep.knee().threshold == 0.8
+    assert sweep.closest_to_slide_count(30).threshold == 0.95
+    assert sweep.closest_to_slide_count(11).threshold == 0.85
+    assert sweep.closest_to_slide_count(1000).threshold == 0.99
+
+    flat = _sweep_result([5, 5, 5], [0.8, 0.9, 0.95])
+    assert flat.knee().threshold == 0.9
+
+
+def test_analyze_command(slides_video: str, temp_dir: str) -> None:
+    """Test the analyze command output and JSON report."""
+    json_path = os.path.join(temp_dir, "sweep.json")
+    result = CliRunner().invoke(
+        app,
+        [
+            "analyze",
+            slides_video,
+            "--no-gpu",
+            "--thresholds",
+            "0.5,0.9,0.999",
+            "--target-slides",
+            "12",
+            "--json",
+            json_path,
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Recommended: --similarity 0.999" in result.output
+    with open(json_path) as f:
+        data = json.load(f)
+    assert data["recommended"] == 0.999
+    assert [entry["threshold"] for entry in data["results"]] == [0.5, 0.9, 0.999]
+    assert data["results"][-1]["slide_count"] == len(data["results"][-1]["timestamps"])
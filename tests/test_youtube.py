@@ -0,0 +1,148 @@
+"""Unit tests for YouTube downloads and stream selection (no network access)."""
+
+import os
+from pathlib import Path
+
+import pytest
+import yt_dlp
+
+from video2slides.main import _start_youtube_download
+from video2slides.youtube import format_options
+
+# A typical YouTube format list: one stream with audio and separate video and audio streams
+# (format_id, ext, height, vcodec, acodec, total bitrate)
+FORMATS = [
+    ("18", "mp4", 360, "avc1.42001E", "mp4a.40.2", 500),
+    ("140", "m4a", None, "none", "mp4a.40.2", 128),
+    ("134", "mp4", 360, "avc1.4d401e", "none", 300),
+    ("136", "mp4", 720, "avc1.4d401f", "none", 1500),
+    ("247", "webm", 720, "vp9", "none", 1200),
+    ("398", "mp4", 720, "av01.0.05M.08", "none", 1000),
+    ("137", "mp4", 1080, "avc1.640028", "none", 4000),
+    ("313", "webm", 2160, "vp9", "none", 15000),
+]
+
+
+def _select(options: dict[str, object], exclude: tuple[str, ...] = ()) -> str:
+    """Return the format_id yt-dlp picks with options from FORMATS, minus excluded ones."""
+    formats = [
+        {
+            "format_id": format_id,
+            "url": f"https://example.com/{format_id}",
+            "ext": ext,
+            "height": height,
+            "vcodec": vcodec,
+            "acodec": acodec,
+            "tbr": tbr,
+        }
+        for format_id, ext, height, vcodec, acodec, tbr in FORMATS
+        if format_id not in exclude
+    ]
+    info = {
+        "id": "video",
+        "title": "Lecture",
+        "formats": formats,
+        "extractor": "test",
+        "extractor_key": "Test",
+        "webpage_url": "https://example.com/video",
+    }
+    with yt_dlp.YoutubeDL({**options, "quiet": True, "simulate": True}) as ydl:
+        return ydl.process_ie_result(info, download=False)["format_id"]
+
+
+def test_format_options() -> None:
+    """Test the format selector and stream ranking built from the settings."""
+    assert format_options(720) == {
+        "format": "bv[vcodec!^=?av01]/b[vcodec!^=?av01]/b/bv*",
+        "format_sort": ["res:720", "vcodec:h264", "+size"],
+    }
+    assert format_options(None, video_only=False) == format_options(0, video_only=False)
+    assert format_options(0, video_only=False) == {
+        "format": "b[vcodec!^=?av01]/b/bv*",
+        "format_sort": ["res", "vcodec:h264", "+size"],
+    }
+
+
+@pytest.mark.parametrize(
+    ("max_height", "video_only", "exclude", "expected"),
+    [
+        # Tallest video-only stream within the limit, H.264 first
+        (720, True, (), "136"),
+        (480, True, (), "134"),
+        (None, True, (), "313"),
+        # Resolution before codec, but no AV1
+        (720, True, ("136",), "247"),
+        # The smallest stream when none is within the limit
+        (240, True, (), "134"),
+        (720, True, ("134", "136", "247", "398", "18"), "137"),
+        # Streams with audio
+        (720, False, (), "18"),
+        (240, False, (), "18"),
+        # Anything with video rather than failing
+        (720, True, ("18", "134", "136", "247", "137", "313"), "398"),
+    ],
+)
+def test_format_selection(
+    max_height: int | None, video_only: bool, exclude: tuple[str, ...], expected: str
+) -> None:
+    """Test which stream yt-dlp downloads with the options."""
+    assert _select(format_options(max_height, video_only), exclude) == expected
+
+
+class _FakeDownloader:
+    """Stands in for yt_dlp.YoutubeDL: writes part of a video, then fails if asked to."""
+
+    fail = False
+
+    def __init__(self, options: dict[str, object]) -> None:
+        self.options = options
+
+    def __enter__(self) -> "_FakeDownloader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        pass
+
+    def extract_info(self, url: str, download: bool = True) -> dict[str, str]:
+        info = {"title": "Lecture", "ext": "mp4"}
+        if download:
+            filename = self.prepare_filename(info)
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            with open(filename, "wb") as f:
+                f.write(b"first half")
+                if self.fail:
+                    raise yt_dlp.utils.DownloadError("connection reset")
+                f.write(b", second half")
+        return info
+
+    def prepare_filename(self, info: dict[str, str]) -> str:
+        return str(self.options["outtmpl"]).replace("%(title)s.%(ext)s", "Lecture.mp4")
+
+
+def test_background_download_final_name(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that only a successful download gets the final name that later runs reuse."""
+    monkeypatch.setattr(yt_dlp, "YoutubeDL", _FakeDownloader)
+    final = str(tmp_path / "Lecture.mp4")
+
+    monkeypatch.setattr(_FakeDownloader, "fail", True)
+    download = _start_youtube_download("https://example.com/v", tmp_path)
+    assert download.filename == final and download.path != final
+    with pytest.raises(yt_dlp.utils.DownloadError):
+        download.wait()
+    assert not os.path.exists(final)
+    assert open(download.path, "rb").read() == b"first half"
+
+    # The interrupted download is not reused, and the new one replaces it
+    monkeypatch.setattr(_FakeDownloader, "fail", False)
+    download = _start_youtube_download("https://example.com/v", tmp_path)
+    download.wait()
+    assert download.path == final
+    assert open(final, "rb").read() == b"first half, second half"
+    assert os.listdir(tmp_path) == ["Lecture.mp4"]
+
+    # A finished download is reused
+    download = _start_youtube_download("https://example.com/v", tmp_path)
+    assert download.is_finished() and download.path == final
@@ -1,6 +1,51 @@
 """Video2Slides - Convert videos to PowerPoint presentations."""
 
-__all__ = ["Video2Slides", "main"]
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING, Any
 
-from video2slides.converter import Video2Slides
-from video2slides.main import app as main
+__all__ = ["Video2Slides", "convert_many", "main", "sweep_thresholds"]
+
+# Public names and the (module, attribute) they are loaded from on first access (PEP 562), so
+# importing the package, e.g. to run the CLI, does not load OpenCV and python-pptx up front
+_LAZY_ATTRIBUTES = {
+    "Video2Slides": ("video2slides.converter", "Video2Slides"),
+    "convert_many": ("video2slides.batch", "convert_many"),
+    "main": ("video2slides.main", "app"),
+    "sweep_thresholds": ("video2slides.sweep", "sweep_thresholds"),
+}
+
+if TYPE_CHECKING:
+    from video2slides.batch import convert_many
+    from video2slides.converter import Video2Slides
+    from video2slides.main import app as main
+    from video2slides.sweep import sweep_thresholds
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attribute)
+    globals()[name] = value
+    return value
+
+
+class _Package(types.ModuleType):
+    """The package module, keeping ``main`` bound to the CLI app."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing the video2slides.main submodule binds it to the package as ``main``,
+        # whichever way it is imported; bind its app instead
+        if name == "main" and isinstance(value, types.ModuleType):
+            value = value.app
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,529 @@
+"""
+Compute backends for the comparison chain: reduce, mask, SSIM statistics and score.
+
+A backend works on opaque images it owns. Sampled frames are handed over once (cropped on
+the host, which is only a view), reduced to grayscale comparison images, masked and turned
+into SSIM statistics without leaving the backend; comparing two frames returns only the
+score. The CPU backend works on NumPy arrays and is what every other backend is checked
+against. The CUDA backend keeps everything in GPU memory, runs each thread's work on its
+own stream and reuses that thread's scratch buffers, so a comparison costs one upload per
+frame and one scalar download per score. The UMat backend runs the same chain through
+OpenCV's transparent API: on an OpenCL device when the stock wheel finds one, otherwise
+on the CPU with the same results.
+
+``get_accelerator`` picks a backend by name; "auto" times the available backends on a
+synthetic frame once per process and keeps the fastest.
+"""
+
+import functools
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any
+
+import cv2
+import numpy as np
+
+from video2slides.ssim import (
+    _C1,
+    _C2,
+    _COV_NORM,
+    _PAD,
+    WIN_SIZE,
+    SSIMStats,
+    compute_stats,
+    ssim_score,
+)
+
+ACCELERATOR_BACKENDS = ("auto", "cpu", "cuda", "umat")
+# OpenCV's CUDA functions and classes; the stubs of the PyPI wheels, built without CUDA, do
+# not declare them (None if OpenCV has no cuda module)
+_cuda: Any = getattr(cv2, "cuda", None)
+# Frame size and repetitions of the backend micro-benchmark
+_BENCHMARK_SIZE = (1080, 1920)
+_BENCHMARK_ROUNDS = 3
+
+
+@functools.cache
+def cuda_device_count() -> int:
+    """Number of CUDA devices OpenCV can use (detected once per process)."""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount()
+    except (AttributeError, cv2.error):
+        # OpenCV built without the cuda module, or no usable driver
+        return 0
+
+
+@functools.cache
+def opencl_available() -> bool:
+    """True if OpenCV's transparent API can run on an OpenCL device (detected once)."""
+    try:
+        return cv2.ocl.haveOpenCL()
+    except cv2.error:
+        return False
+
+
+class Accelerator(ABC):
+    """Backend running the comparison chain of sampled frames."""
+
+    name = ""
+    # Human-readable device description
+    label = ""
+    # True if images live in device memory and transfers cost time
+    is_gpu = False
+
+    @abstractmethod
+    def upload(self, image: np.ndarray) -> Any:
+        """Hand a host image to the backend."""
+
+    @abstractmethod
+    def download(self, image: Any) -> np.ndarray:
+        """Copy a backend image to the host."""
+
+    @abstractmethod
+    def shape(self, image: Any) -> tuple[int, int]:
+        """(height, width) of a backend image."""
+
+    @abstractmethod
+    def reduce(self, frame: np.ndarray, height: int) -> Any:
+        """
+        Reduce a BGR frame to its grayscale comparison image.
+
+        Args:
+            frame: Host frame in BGR format (already cropped)
+            height: Maximum height; taller frames are downscaled to it
+
+        Returns:
+            Backend image, a new buffer owned by the caller
+        """
+
+    @abstractmethod
+    def mask(self, image: Any, mask: np.ndarray | None) -> Any:
+        """Zero the ignored pixels of a comparison image in place (mask is 0 where ignored)."""
+
+    @abstractmethod
+    def stats(self, image: Any) -> Any:
+        """SSIM statistics (local means and variances) of a comparison image."""
+
+    @abstractmethod
+    def ssim(self, reference: Any, other: Any) -> float:
+        """Mean SSIM between two images given their statistics."""
+
+    def __reduce__(self) -> tuple[type, tuple[()]]:
+        # Segment workers get a fresh backend with their own buffers
+        return type(self), ()
+
+
+class CPUAccelerator(Accelerator):
+    """NumPy/OpenCV on the host; backend images are plain arrays."""
+
+    name = "cpu"
+    label = "CPU"
+
+    def upload(self, image: np.ndarray) -> np.ndarray:
+        """Hand a host image to the backend."""
+        return image
+
+    def download(self, image: np.ndarray) -> np.ndarray:
+        """Copy a backend image to the host."""
+        return image
+
+    def shape(self, image: np.ndarray) -> tuple[int, int]:
+        """(height, width) of a backend image."""
+        height, width = image.shape[:2]
+        return height, width
+
+    def reduce(self, frame: np.ndarray, height: int) -> np.ndarray:
+        """Reduce a BGR frame to its grayscale comparison image."""
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        if gray.shape[0] > height:
+            width = int(gray.shape[1] * height / gray.shape[0])
+            gray = cv2.resize(gray, (width, height))
+        return gray
+
+    def mask(self, image: np.ndarray, mask: np.ndarray | None) -> np.ndarray:
+        """Zero the ignored pixels of a comparison image in place."""
+        if mask is not None:
+            cv2.bitwise_and(image, mask, dst=image)
+        return image
+
+    def stats(self, image: np.ndarray) -> SSIMStats:
+        """SSIM statistics of a comparison image."""
+        return compute_stats(image)
+
+    def ssim(self, reference: SSIMStats, other: SSIMStats) -> float:
+        """Mean SSIM between two images given their statistics."""
+        return ssim_score(reference, other)
+
+
+class _DeviceStats:
+    """SSIM statistics held in device memory."""
+
+    __slots__ = ("shape", "image", "mean", "mean_sq", "variance")
+
+    def __init__(
+        self, shape: tuple[int, int], image: Any, mean: Any, mean_sq: Any, variance: Any
+    ) -> None:
+        self.shape = shape
+        self.image = image
+        self.mean = mean
+        self.mean_sq = mean_sq
+        self.variance = variance
+
+
+class _DeviceContext(threading.local):
+    """Per-thread CUDA stream, scratch buffers and filters."""
+
+    def __init__(self) -> None:
+        self.stream = _cuda.Stream()
+        self.buffers: dict[tuple[str, int, int, int], Any] = {}
+        self.box_filter = _cuda.createBoxFilter(cv2.CV_32FC1, cv2.CV_32FC1, (WIN_SIZE, WIN_SIZE))
+
+    def buffer(self, name: str, rows: int, cols: int, dtype: int) -> Any:
+        """Scratch buffer reused by later calls on this thread (never returned to callers)."""
+        key = (name, rows, cols, dtype)
+        if key not in self.buffers:
+            self.buffers[key] = _cuda.GpuMat(rows, cols, dtype)
+        return self.buffers[key]
+
+
+class CUDAAccelerator(Accelerator):
+    """OpenCV's CUDA module; backend images are ``cv2.cuda_GpuMat``."""
+
+    name = "cuda"
+    label = "CUDA"
+    is_gpu = True
+
+    def __init__(self) -> None:
+        """Initialize backend (the CUDA device must be available)."""
+        self._context = _DeviceContext()
+        # Masks uploaded once per (region, resolution); keyed by the host mask's identity,
+        # which the comparison region caches per resolution
+        self._masks: dict[int, tuple[np.ndarray, Any]] = {}
+        self._masks_lock = threading.Lock()
+
+    def upload(self, image: np.ndarray) -> Any:
+        """Hand a host image to the backend."""
+        context = self._context
+        device = _cuda.GpuMat()
+        device.upload(np.ascontiguousarray(image), context.stream)
+        context.stream.waitForCompletion()
+        return device
+
+    def download(self, image: Any) -> np.ndarray:
+        """Copy a backend image to the host."""
+        host: np.ndarray = image.download()
+        return host
+
+    def shape(self, image: Any) -> tuple[int, int]:
+        """(height, width) of a backend image."""
+        width, height = image.size()
+        return height, width
+
+    def reduce(self, frame: np.ndarray, height: int) -> Any:
+        """Reduce a BGR frame to its grayscale comparison image."""
+        context = self._context
+        stream = context.stream
+        rows, cols = frame.shape[:2]
+        source = context.buffer("frame", rows, cols, cv2.CV_8UC3)
+        source.upload(np.ascontiguousarray(frame), stream)
+
+        if rows > height:
+            gray = context.buffer("gray", rows, cols, cv2.CV_8UC1)
+            _cuda.cvtColor(source, cv2.COLOR_BGR2GRAY, gray, stream=stream)
+            width = int(cols * height / rows)
+            reduced = _cuda.GpuMat(height, width, cv2.CV_8UC1)
+            _cuda.resize(gray, (width, height), reduced, stream=stream)
+        else:
+            reduced = _cuda.GpuMat(rows, cols, cv2.CV_8UC1)
+            _cuda.cvtColor(source, cv2.COLOR_BGR2GRAY, reduced, stream=stream)
+        # Scratch buffers are reused by the next call on this thread
+        stream.waitForCompletion()
+        return reduced
+
+    def _device_mask(self, mask: np.ndarray) -> Any:
+        with self._masks_lock:
+            entry = self._masks.get(id(mask))
+            if entry is None or entry[0] is not mask:
+                device = _cuda.GpuMat()
+                device.upload(mask)
+                entry = self._masks[id(mask)] = (mask, device)
+            return entry[1]
+
+    def mask(self, image: Any, mask: np.ndarray | None) -> Any:
+        """Zero the ignored pixels of a comparison image in place."""
+        if mask is None:
+            return image
+        stream = self._context.stream
+        _cuda.bitwise_and(image, self._device_mask(mask), image, stream=stream)
+        stream.waitForCompletion()
+        return image
+
+    def stats(self, image: Any) -> _DeviceStats:
+        """SSIM statistics of a comparison image, computed and kept on the device."""
+        context = self._context
+        stream = context.stream
+        width, height = image.size()
+        if min(width, height) < WIN_SIZE:
+            raise ValueError(f"Image must be at least {WIN_SIZE}x{WIN_SIZE}, got {(height, width)}")
+
+        image32 = _cuda.GpuMat(height, width, cv2.CV_32FC1)
+        image.convertTo(cv2.CV_32F, stream, image32)
+        mean = _cuda.GpuMat(height, width, cv2.CV_32FC1)
+        context.box_filter.apply(image32, mean, stream)
+        mean_sq = _cuda.multiply(mean, mean, stream=stream)
+
+        squares = context.buffer("squares", height, width, cv2.CV_32FC1)
+        _cuda.multiply(image32, image32, squares, stream=stream)
+        variance = _cuda.GpuMat(height, width, cv2.CV_32FC1)
+        context.box_filter.apply(squares, variance, stream)
+        # Sample variance: (E[x^2] - E[x]^2) * N / (N - 1)
+        _cuda.addWeighted(variance, _COV_NORM, mean_sq, -_COV_NORM, 0.0, variance, stream=stream)
+        # Statistics are shared with other threads, so they must be complete when returned
+        stream.waitForCompletion()
+        return _DeviceStats((height, width), image32, mean, mean_sq, variance)
+
+    def ssim(self, reference: _DeviceStats, other: _DeviceStats) -> float:
+        """Mean SSIM computed on the device; only the sum of the SSIM map is downloaded."""
+        context = self._context
+        stream = context.stream
+        height, width = reference.shape
+        if other.shape != reference.shape:
+            raise ValueError(f"Shape mismatch: {reference.shape} vs {other.shape}")
+
+        def scratch(name: str) -> Any:
+            return context.buffer(name, height, width, cv2.CV_32FC1)
+
+        product, cross, numerator, denominator, work = (
+            scratch(name) for name in ("product", "cross", "numerator", "denominator", "work")
+        )
+        _cuda.multiply(reference.image, other.image, product, stream=stream)
+        context.box_filter.apply(product, cross, stream)
+        _cuda.multiply(reference.mean, other.mean, product, stream=stream)
+
+        # numerator = (2 mu_x mu_y + C1) * (2 cov_xy + C2)
+        _cuda.addWeighted(
+            cross, 2 * _COV_NORM, product, -2 * _COV_NORM, _C2, numerator, stream=stream
+        )
+        _cuda.addWeighted(product, 2.0, product, 0.0, _C1, work, stream=stream)
+        _cuda.multiply(numerator, work, numerator, stream=stream)
+
+        # denominator = (mu_x^2 + mu_y^2 + C1) * (var_x + var_y + C2)
+        _cuda.addWeighted(
+            reference.mean_sq, 1.0, other.mean_sq, 1.0, _C1, denominator, stream=stream
+        )
+        _cuda.addWeighted(reference.variance, 1.0, other.variance, 1.0, _C2, work, stream=stream)
+        _cuda.multiply(denominator, work, denominator, stream=stream)
+        _cuda.divide(numerator, denominator, numerator, stream=stream)
+        stream.waitForCompletion()
+
+        # Mean over the image with the filter border cropped, like the CPU implementation
+        inner = numerator.rowRange(_PAD, height - _PAD).colRange(_PAD, width - _PAD)
+        total = _cuda.sum(inner)[0]
+        return float(total / ((height - 2 * _PAD) * (width - 2 * _PAD)))
+
+
+class _UMatImage:
+    """UMat with its size, which the Python bindings do not expose."""
+
+    __slots__ = ("umat", "shape")
+
+    def __init__(self, umat: cv2.UMat, shape: tuple[int, int]) -> None:
+        self.umat = umat
+        self.shape = shape
+
+
+def _to_umat(image: np.ndarray) -> cv2.UMat:
+    # The bindings accept host arrays, but the stubs only declare UMat(UMat)
+    umat: cv2.UMat = cv2.UMat(np.ascontiguousarray(image))  # type: ignore[call-overload]
+    return umat
+
+
+def _box(src: cv2.UMat) -> cv2.UMat:
+    # Same window and border as the CPU implementation in video2slides.ssim
+    return cv2.boxFilter(
+        src, cv2.CV_32F, (WIN_SIZE, WIN_SIZE), normalize=True, borderType=cv2.BORDER_REFLECT
+    )
+
+
+class UMatAccelerator(Accelerator):
+    """
+    OpenCV's transparent API; backend images are ``cv2.UMat``.
+
+    Runs on an OpenCL device when one is available and on the CPU otherwise, so it works
+    with the stock PyPI wheel everywhere. OpenCV pools the buffers behind UMats, so
+    per-frame temporaries are recycled rather than reallocated.
+    """
+
+    name = "umat"
+
+    def __init__(self) -> None:
+        """Initialize backend; it runs on OpenCL if a device is available and enabled."""
+        # OpenCV's process-wide OpenCL switch (on by default with a device) is left alone
+        self.is_gpu = opencl_available() and cv2.ocl.useOpenCL()
+        self.label = (
+            f"OpenCL ({cv2.ocl.Device.getDefault().name()})" if self.is_gpu else "UMat on CPU"
+        )
+        # Masks uploaded once per (region, resolution), like the CUDA backend
+        self._masks: dict[int, tuple[np.ndarray, cv2.UMat]] = {}
+        self._masks_lock = threading.Lock()
+
+    def upload(self, image: np.ndarray) -> _UMatImage:
+        """Hand a host image to the backend."""
+        return _UMatImage(_to_umat(image), image.shape[:2])
+
+    def download(self, image: _UMatImage) -> np.ndarray:
+        """Copy a backend image to the host."""
+        return image.umat.get()
+
+    def shape(self, image: _UMatImage) -> tuple[int, int]:
+        """(height, width) of a backend image."""
+        return image.shape
+
+    def reduce(self, frame: np.ndarray, height: int) -> _UMatImage:
+        """Reduce a BGR frame to its grayscale comparison image."""
+        rows, cols = frame.shape[:2]
+        gray = cv2.cvtColor(_to_umat(frame), cv2.COLOR_BGR2GRAY)
+        if rows > height:
+            cols = int(cols * height / rows)
+            rows = height
+            gray = cv2.resize(gray, (cols, rows))
+        return _UMatImage(gray, (rows, cols))
+
+    def mask(self, image: _UMatImage, mask: np.ndarray | None) -> _UMatImage:
+        """Zero the ignored pixels of a comparison image in place."""
+        if mask is not None:
+            with self._masks_lock:
+                entry = self._masks.get(id(mask))
+                if entry is None or entry[0] is not mask:
+                    entry = self._masks[id(mask)] = (mask, _to_umat(mask))
+            cv2.bitwise_and(image.umat, entry[1], dst=image.umat)
+        return image
+
+    def stats(self, image: _UMatImage) -> _DeviceStats:
+        """SSIM statistics of a comparison image, kept on the device."""
+        if min(image.shape) < WIN_SIZE:
+            raise ValueError(f"Image must be at least {WIN_SIZE}x{WIN_SIZE}, got {image.shape}")
+
+        # The bindings have no UMat.convertTo; a unit weighted sum converts on the device
+        image32 = cv2.addWeighted(image.umat, 1.0, image.umat, 0.0, 0.0, dtype=cv2.CV_32F)
+        mean = _box(image32)
+        mean_sq = cv2.multiply(mean, mean)
+        variance = _box(cv2.multiply(image32, image32))
+        # Sample variance: (E[x^2] - E[x]^2) * N / (N - 1)
+        variance = cv2.addWeighted(variance, _COV_NORM, mean_sq, -_COV_NORM, 0.0)
+        return _DeviceStats(image.shape, image32, mean, mean_sq, variance)
+
+    def ssim(self, reference: _DeviceStats, other: _DeviceStats) -> float:
+        """Mean SSIM computed on the device; only the mean of the SSIM map is downloaded."""
+        height, width = reference.shape
+        if other.shape != reference.shape:
+            raise ValueError(f"Shape mismatch: {reference.shape} vs {other.shape}")
+
+        cross = _box(cv2.multiply(reference.image, other.image))
+        product = cv2.multiply(reference.mean, other.mean)
+        # numerator = (2 mu_x mu_y + C1) * (2 cov_xy + C2)
+        numerator = cv2.multiply(
+            cv2.addWeighted(cross, 2 * _COV_NORM, product, -2 * _COV_NORM, _C2),
+            cv2.addWeighted(product, 2.0, product, 0.0, _C1),
+        )
+        # denominator = (mu_x^2 + mu_y^2 + C1) * (var_x + var_y + C2)
+        denominator = cv2.multiply(
+            cv2.addWeighted(reference.mean_sq, 1.0, other.mean_sq, 1.0, _C1),
+            cv2.addWeighted(reference.variance, 1.0, other.variance, 1.0, _C2),
+        )
+        ssim_map = cv2.divide(numerator, denominator)
+        # Mean over the image with the filter border cropped, like the CPU implementation
+        inner = cv2.UMat(ssim_map, (_PAD, height - _PAD), (_PAD, width - _PAD))
+        return float(cv2.mean(inner)[0])
+
+
+CPU_ACCELERATOR = CPUAccelerator()
+
+
+@functools.cache
+def _cuda_accelerator() -> CUDAAccelerator:
+    return CUDAAccelerator()
+
+
+@functools.cache
+def _umat_accelerator() -> UMatAccelerator:
+    return UMatAccelerator()
+
+
+def benchmark(accelerator: Accelerator, rounds: int = _BENCHMARK_ROUNDS) -> float:
+    """
+    Time the comparison chain of one frame on a backend.
+
+    A synthetic 1080p frame is reduced, masked and compared against a reference, which is
+    what every sampled frame costs. The first round warms up (kernel compilation, buffer
+    pools) and is not counted.
+
+    Args:
+        accelerator: Backend to time
+        rounds: Number of timed rounds
+
+    Returns:
+        Best time of one frame in seconds
+    """
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (*_BENCHMARK_SIZE, 3), dtype=np.uint8)
+    reference = accelerator.stats(accelerator.reduce(frame, 480))
+    mask = np.full((480, 853), 255, dtype=np.uint8)
+    best = float("inf")
+    for round_index in range(rounds + 1):
+        start = time.perf_counter()
+        image = accelerator.mask(accelerator.reduce(frame, 480), mask)
+        accelerator.ssim(reference, accelerator.stats(image))
+        if round_index:
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+@functools.cache
+def select_accelerator() -> Accelerator:
+    """
+    Fastest available backend, chosen by a micro-benchmark once per process.
+
+    The UMat backend only competes when OpenCL is available (without a device it runs
+    the CPU chain with extra overhead) and CUDA only when OpenCV sees a device, so
+    machines without either skip the benchmark.
+    """
+    candidates: list[Accelerator] = [CPU_ACCELERATOR]
+    if opencl_available():
+        candidates.append(_umat_accelerator())
+    if cuda_device_count() > 0:
+        candidates.append(_cuda_accelerator())
+    if len(candidates) == 1:
+        return CPU_ACCELERATOR
+    return min(candidates, key=benchmark)
+
+
+def get_accelerator(use_gpu: bool = True, backend: str = "auto") -> Accelerator:
+    """
+    Backend for a conversion.
+
+    Backends are shared within a process; their scratch buffers are per thread.
+
+    Args:
+        use_gpu: With the "auto" backend, pick the fastest available backend (False to
+            always use the CPU)
+        backend: One of ACCELERATOR_BACKENDS
+
+    Returns:
+        Accelerator instance
+
+    Raises:
+        ValueError: If the backend is unknown, or "cuda" without a CUDA device
+    """
+    if backend not in ACCELERATOR_BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}. Expected one of {ACCELERATOR_BACKENDS}")
+    if backend == "cuda":
+        if cuda_device_count() == 0:
+            raise ValueError("The cuda backend needs OpenCV built with CUDA and a CUDA device")
+        return _cuda_accelerator()
+    if backend == "umat":
+        return _umat_accelerator()
+    if backend == "auto" and use_gpu:
+        return select_accelerator()
+    return CPU_ACCELERATOR
@@ -0,0 +1,270 @@
+"""
+Persistent cache of the comparison images of sampled frames.
+
+Change detection only ever looks at the reduced (cropped, grayscale, downscaled) image of
+each sampled frame. Those images depend on the video and the sampling settings, not on the
+similarity threshold, detector, masks or layout, so a cached run can replay the decisions
+for different settings without decoding the video again; only the frames that become
+slides are decoded at full resolution. Thumbnails or hashes alone would not do: detectors
+decide at the comparison resolution, and replaying smaller images keeps other frames.
+
+Each entry is a zip file holding one lossless PNG per sample and a JSON index. Entries are
+keyed by a content fingerprint of the video plus the sampling settings, and evicted least
+recently used first once the cache exceeds its size limit.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from collections.abc import Iterator
+from types import TracebackType
+
+import cv2
+import numpy as np
+
+from video2slides.defaults import DEFAULT_CACHE_SIZE_MB
+
+# Bump when the content or layout of entries changes
+CACHE_VERSION = 1
+# Bytes of the video read at each of the fingerprint offsets
+_FINGERPRINT_CHUNK = 64 * 1024
+_FINGERPRINT_OFFSETS = 16
+_INDEX_NAME = "index.json"
+
+
+def default_cache_dir() -> str:
+    """Per-user cache directory ($XDG_CACHE_HOME/video2slides/analysis)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "video2slides", "analysis")
+
+
+def video_fingerprint(video_path: str) -> str:
+    """
+    Fast content fingerprint of a video file.
+
+    Hashes the file size and chunks read at evenly spaced offsets, so renamed or copied
+    files share cache entries while re-encoded or edited ones do not.
+
+    Args:
+        video_path: Path to the video file
+
+    Returns:
+        Hex digest
+    """
+    size = os.path.getsize(video_path)
+    digest = hashlib.sha256(str(size).encode())
+    with open(video_path, "rb") as f:
+        for i in range(_FINGERPRINT_OFFSETS):
+            f.seek(max(0, size - _FINGERPRINT_CHUNK) * i // (_FINGERPRINT_OFFSETS - 1))
+            digest.update(f.read(_FINGERPRINT_CHUNK))
+    return digest.hexdigest()
+
+
+class SampleRecorder:
+    """Collects the comparison images of sampled frames while a video is analyzed."""
+
+    def __init__(self) -> None:
+        """Initialize an empty recorder."""
+        # frame_number -> PNG bytes; filled from several comparer threads
+        self.samples: dict[int, bytes] = {}
+
+    def record(self, frame_number: int, image: np.ndarray) -> None:
+        """Store the (not yet masked) comparison image of a sampled frame (thread-safe)."""
+        ok, buffer = cv2.imencode(".png", image)
+        if not ok:
+            raise ValueError(f"Unable to encode comparison image of frame {frame_number}")
+        self.samples[frame_number] = buffer.tobytes()
+
+
+class CachedAnalysis:
+    """A cache entry opened for reading: the comparison images of all samples, in order."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Open an entry.
+
+        Args:
+            path: Entry file path
+        """
+        self.path = path
+        self._package = zipfile.ZipFile(path)
+        index = json.loads(self._package.read(_INDEX_NAME))
+        if index.get("version") != CACHE_VERSION:
+            self._package.close()
+            raise ValueError(f"Unsupported analysis cache entry version: {index.get('version')}")
+        self.frame_numbers: list[int] = index["frame_numbers"]
+        self.metadata: dict[str, object] = index["metadata"]
+
+    def image(self, frame_number: int) -> np.ndarray:
+        """Comparison image of a sampled frame."""
+        data = self._package.read(f"{frame_number}.png")
+        image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+        if image is None:
+            raise ValueError(f"Unable to decode cached comparison image of frame {frame_number}")
+        return image
+
+    def __iter__(self) -> Iterator[tuple[int, np.ndarray]]:
+        """(frame_number, comparison image) for every sample, like a sampler yields frames."""
+        for frame_number in self.frame_numbers:
+            yield frame_number, self.image(frame_number)
+
+    def __len__(self) -> int:
+        return len(self.frame_numbers)
+
+    def close(self) -> None:
+        """Close the entry file."""
+        self._package.close()
+
+    def __enter__(self) -> "CachedAnalysis":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class AnalysisCache:
+    """Directory of analysis entries with a size limit and least-recently-used eviction."""
+
+    def __init__(
+        self, directory: str | None = None, size_limit_mb: int = DEFAULT_CACHE_SIZE_MB
+    ) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            directory: Cache directory (default: default_cache_dir())
+            size_limit_mb: Total size of all entries in megabytes; least recently used
+                entries are deleted when a new entry would exceed it
+        """
+        self.directory = directory or default_cache_dir()
+        self.size_limit = size_limit_mb * 1024 * 1024
+
+    @staticmethod
+    def key(video_path: str, **params: object) -> str:
+        """
+        Entry key of a video analyzed with the given sampling settings.
+
+        Args:
+            video_path: Path to the video file
+            **params: JSON-serializable settings the comparison images depend on
+
+        Returns:
+            Hex key
+        """
+        material = json.dumps(
+            {"version": CACHE_VERSION, "video": video_fingerprint(video_path), **params},
+            sort_keys=True,
+        )
+        return hashlib.sha256(material.encode()).hexdigest()[:32]
+
+    def path(self, key: str) -> str:
+        """File path of an entry."""
+        return os.path.join(self.directory, f"{key}.zip")
+
+    def load(self, key: str) -> CachedAnalysis | None:
+        """
+        Open an entry and mark it as recently used.
+
+        Returns:
+            The entry, or None if it does not exist or cannot be read
+        """
+        path = self.path(key)
+        try:
+            entry = CachedAnalysis(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            # Unreadable or outdated entry: drop it and analyze again
+            self._remove(path)
+            return None
+        os.utime(path)
+        return entry
+
+    def store(self, key: str, samples: dict[int, bytes], metadata: dict[str, object]) -> bool:
+        """
+        Write an entry, then evict old entries beyond the size limit.
+
+        The entry is written under a temporary name and moved into place, so concurrent
+        conversions of the same video never see a partial entry.
+
+        Args:
+            key: Entry key
+            samples: PNG-encoded comparison image per sampled frame number
+            metadata: Informational settings stored with the entry
+
+        Returns:
+            True if the entry was kept (False if it alone exceeds the size limit)
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        frame_numbers = sorted(samples)
+        index = {"version": CACHE_VERSION, "frame_numbers": frame_numbers, "metadata": metadata}
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".partial")
+        try:
+            with os.fdopen(fd, "wb") as f, zipfile.ZipFile(f, "w", zipfile.ZIP_STORED) as package:
+                package.writestr(_INDEX_NAME, json.dumps(index))
+                for frame_number in frame_numbers:
+                    package.writestr(f"{frame_number}.png", samples[frame_number])
+            if os.path.getsize(temp_path) > self.size_limit:
+                self._remove(temp_path)
+                return False
+            os.replace(temp_path, self.path(key))
+        except BaseException:
+            self._remove(temp_path)
+            raise
+
+        self.evict(keep=key)
+        return True
+
+    def entries(self) -> list[tuple[str, int, float]]:
+        """(path, size, last use) of every entry, least recently used first."""
+        entries: list[tuple[str, int, float]] = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for name in os.listdir(self.directory):
+            if not name.endswith(".zip"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def evict(self, keep: str | None = None) -> list[str]:
+        """
+        Delete least recently used entries until the cache fits its size limit.
+
+        Args:
+            keep: Key of an entry that must not be deleted
+
+        Returns:
+            Paths of the deleted entries
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        keep_path = self.path(keep) if keep is not None else None
+        evicted = []
+        for path, size, _ in entries:
+            if total <= self.size_limit:
+                break
+            if path == keep_path:
+                continue
+            self._remove(path)
+            total -= size
+            evicted.append(path)
+        return evicted
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,315 @@
+"""Convert many videos in one run, sharing a pool of warm worker processes."""
+
+import csv
+import glob
+import inspect
+import json
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from eliot import start_action
+
+from video2slides.converter import Video2Slides
+from video2slides.defaults import DEFAULT_BATCH_WORKERS
+from video2slides.regions import parse_rect
+
+VIDEO_EXTENSIONS = (".mp4", ".mkv", ".webm", ".mov", ".avi", ".m4v")
+
+# Video2Slides options that must not be set per job
+_RESERVED_OPTIONS = ("video_path", "output_path")
+
+
+@dataclass
+class BatchJob:
+    """One video to convert, with Video2Slides options overriding the batch defaults."""
+
+    video_path: str
+    output_path: str
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class JobResult:
+    """Outcome of a batch job."""
+
+    video_path: str
+    output_path: str
+    status: str  # "converted", "skipped" or "failed"
+    seconds: float = 0.0
+    slide_count: int = 0
+    error: str | None = None
+    # Per-stage busy time and call counts of a converted video (see video2slides.metrics)
+    stages: dict[str, dict[str, float]] | None = None
+
+
+def _option_defaults() -> dict[str, Any]:
+    parameters = inspect.signature(Video2Slides.__init__).parameters
+    return {
+        name: parameter.default
+        for name, parameter in parameters.items()
+        if name != "self" and name not in _RESERVED_OPTIONS
+    }
+
+
+def coerce_option(name: str, value: Any) -> Any:
+    """
+    Convert a manifest value (a string for CSV manifests) to the type of a Video2Slides option.
+
+    Args:
+        name: Video2Slides constructor argument, e.g. "similarity_threshold"
+        value: Raw value from the manifest
+
+    Returns:
+        Value of the option's type
+    """
+    defaults = _option_defaults()
+    if name not in defaults:
+        raise ValueError(f"Unknown option: {name}. Expected one of {tuple(defaults)}")
+
+    if name == "crop_region":
+        return parse_rect(value) if value else None
+    if name == "max_dpi":
+        return int(value) if value not in (None, "") else None
+    if name == "ignore_regions":
+        if isinstance(value, str):
+            value = [part for part in value.split(";") if part.strip()]
+        return [parse_rect(region) for region in value or []]
+
+    default = defaults[name]
+    if not isinstance(value, str) or isinstance(default, str) or default is None:
+        return value
+    if isinstance(default, bool):
+        if value.strip().lower() in ("1", "true", "yes", "y"):
+            return True
+        if value.strip().lower() in ("0", "false", "no", "n", ""):
+            return False
+        raise ValueError(f"Expected a boolean for {name}, got: {value}")
+    return type(default)(value)
+
+
+def default_output_path(video_path: str, output_dir: str) -> str:
+    """Output path of a video converted into ``output_dir``, named like the CLI names it."""
+    stem = Video2Slides._sanitize_filename(Path(video_path).stem)
+    return str(Path(output_dir).resolve() / f"{stem}.pptx")
+
+
+def _read_manifest(path: Path) -> list[dict[str, Any]]:
+    if path.suffix.lower() == ".csv":
+        with path.open(newline="") as f:
+            return [
+                {key: value for key, value in row.items() if key and value not in (None, "")}
+                for row in csv.DictReader(f)
+            ]
+
+    rows = []
+    with path.open() as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            if not isinstance(row, dict):
+                raise ValueError(f"{path}:{line_number}: expected a JSON object")
+            rows.append(row)
+    return rows
+
+
+def load_jobs(
+    source: str, output_dir: str = ".", pattern: str = "*", options: dict[str, Any] | None = None
+) -> list[BatchJob]:
+    """
+    Build batch jobs from a directory, a glob pattern or a manifest.
+
+    Manifests are CSV (with a header row) or JSONL files with a required "video" column, an
+    optional "output" column and any Video2Slides option (e.g. "similarity_threshold",
+    "ignore_regions") overriding ``options`` for that video. Relative paths in a manifest
+    are resolved against the manifest's directory (videos) and ``output_dir`` (outputs).
+
+    Args:
+        source: Directory of videos, glob pattern, or path to a .csv/.jsonl manifest
+        output_dir: Directory for outputs that are not given explicitly
+        pattern: File pattern of videos inside a directory source
+        options: Video2Slides options shared by all jobs
+
+    Returns:
+        Jobs in a stable order
+    """
+    shared = {name: coerce_option(name, value) for name, value in (options or {}).items()}
+    source_path = Path(source)
+    jobs: list[BatchJob] = []
+
+    if source_path.is_file() and source_path.suffix.lower() in (".csv", ".jsonl"):
+        base_dir = source_path.resolve().parent
+        for row in _read_manifest(source_path):
+            row = dict(row)
+            if "video" not in row:
+                raise ValueError(f"Manifest row without a 'video' entry: {row}")
+            video_path = str((base_dir / str(row.pop("video"))).resolve())
+            output = row.pop("output", None)
+            output_path = (
+                str((Path(output_dir) / str(output)).resolve())
+                if output
+                else default_output_path(video_path, output_dir)
+            )
+            job_options = dict(shared)
+            job_options.update({name: coerce_option(name, value) for name, value in row.items()})
+            jobs.append(BatchJob(video_path, output_path, job_options))
+    else:
+        if source_path.is_dir():
+            paths = [
+                path
+                for path in source_path.glob(pattern)
+                if path.is_file() and path.suffix.lower() in VIDEO_EXTENSIONS
+            ]
+        else:
+            paths = [Path(path) for path in glob.glob(source, recursive=True)]
+            paths = [path for path in paths if path.is_file()]
+        for path in sorted(paths):
+            video_path = str(path.resolve())
+            jobs.append(
+                BatchJob(video_path, default_output_path(video_path, output_dir), dict(shared))
+            )
+
+    outputs: dict[str, str] = {}
+    for job in jobs:
+        if job.output_path in outputs:
+            raise ValueError(
+                f"{job.video_path} and {outputs[job.output_path]} would both be written to "
+                f"{job.output_path}"
+            )
+        outputs[job.output_path] = job.video_path
+    return jobs
+
+
+def is_up_to_date(job: BatchJob) -> bool:
+    """True if the job's output exists and is newer than its video."""
+    try:
+        return os.path.getmtime(job.output_path) >= os.path.getmtime(job.video_path)
+    except OSError:
+        return False
+
+
+def run_job(job: BatchJob, converter_class: type[Video2Slides] = Video2Slides) -> JobResult:
+    """
+    Convert one video (process pool entry point).
+
+    Errors are reported in the result instead of being raised.
+
+    Args:
+        job: Job to run
+        converter_class: Video2Slides or a subclass of it running the conversion
+    """
+    start = time.perf_counter()
+    try:
+        converter = converter_class(job.video_path, job.output_path, **job.options)
+        converter.convert()
+    except Exception as e:
+        return JobResult(
+            job.video_path,
+            job.output_path,
+            "failed",
+            seconds=time.perf_counter() - start,
+            error=f"{type(e).__name__}: {e}",
+        )
+    return JobResult(
+        job.video_path,
+        job.output_path,
+        "converted",
+        seconds=time.perf_counter() - start,
+        slide_count=len(converter.frames),
+        stages=converter.timers.to_dict(),
+    )
+
+
+def convert_many(
+    jobs: Iterable[BatchJob],
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    force: bool = False,
+    on_result: Callable[[JobResult], None] | None = None,
+) -> list[JobResult]:
+    """
+    Convert several videos across a pool of worker processes.
+
+    Each worker imports OpenCV and python-pptx once and then runs jobs back to back. Unless
+    a job sets ``compare_workers`` itself, the comparison threads are divided between the
+    concurrent jobs so the machine is not oversubscribed.
+
+    Args:
+        jobs: Jobs to run
+        max_workers: Maximum number of videos converted at the same time
+        force: If True, also convert videos whose output is up to date
+        on_result: Called with each result as soon as its job finishes
+
+    Returns:
+        Results in job order
+    """
+    jobs = list(jobs)
+    max_workers = max(1, max_workers)
+    results: list[JobResult | None] = [None] * len(jobs)
+
+    def report(index: int, result: JobResult) -> None:
+        results[index] = result
+        if on_result is not None:
+            on_result(result)
+
+    with start_action(
+        action_type="convert_many", job_count=len(jobs), max_workers=max_workers
+    ) as action:
+        pending: list[tuple[int, BatchJob]] = []
+        for index, job in enumerate(jobs):
+            if not force and is_up_to_date(job):
+                report(index, JobResult(job.video_path, job.output_path, "skipped"))
+            else:
+                pending.append((index, job))
+
+        if pending:
+            threads_per_job = max(1, (os.cpu_count() or 1) // min(max_workers, len(pending)))
+            # Forking a process that already ran OpenCV's thread pool can deadlock the child
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, len(pending)),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                futures = {}
+                for index, job in pending:
+                    options = {"compare_workers": threads_per_job, **job.options}
+                    job = BatchJob(job.video_path, job.output_path, options)
+                    futures[pool.submit(run_job, job)] = index
+                for future in as_completed(futures):
+                    result = future.result()
+                    action.log(message_type="job_finished", **asdict(result))
+                    report(futures[future], result)
+
+        finished = [result for result in results if result is not None]
+        action.log(message_type="batch_complete", **summarize(finished))
+
+    return finished
+
+
+def summarize(results: list[JobResult]) -> dict[str, float]:
+    """Count results per status and add up the time spent converting."""
+    summary: dict[str, float] = {
+        status: sum(result.status == status for result in results)
+        for status in ("converted", "skipped", "failed")
+    }
+    summary["total_seconds"] = round(sum(result.seconds for result in results), 3)
+    return summary
+
+
+def write_report(results: list[JobResult], path: str) -> None:
+    """
+    Write a JSON summary of a batch run.
+
+    Args:
+        results: Results returned by convert_many
+        path: Report file path
+    """
+    report = {"summary": summarize(results), "jobs": [asdict(result) for result in results]}
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
@@ -0,0 +1,407 @@
+"""
+Benchmark suite: synthetic lecture videos, per-stage measurements and baseline comparison.
+
+``generate_lecture_video`` writes a deterministic lecture of static text slides whose
+bullet points appear one by one, with a moving speaker overlay in the bottom-right corner
+and sensor noise. ``run_benchmark`` converts it and measures each stage:
+
+- decode: sequential decoding of every frame (frames per second)
+- extract: change detection and storing kept frames (comparisons per second)
+- pptx: building and saving the presentation
+
+along with the peak resident memory during each stage. Results are plain JSON, so runs
+can be stored and diffed against a baseline with ``compare_results``.
+"""
+
+import os
+import platform
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any
+
+import cv2
+import numpy as np
+
+from video2slides.converter import Video2Slides
+from video2slides.defaults import DEFAULT_TOLERANCE
+from video2slides.metrics import peak_rss_mb
+
+# Bump when the meaning of the results changes, so old baselines are not compared
+BENCH_VERSION = 1
+BULLETS_PER_SLIDE = 3
+# Distinct noise fields cycled through the video (generating one per frame is slow)
+_NOISE_FIELDS = 8
+# Interval between two resident memory samples
+_RSS_INTERVAL = 0.01
+# Absolute changes below these never count as regressions (timer and allocator noise)
+_NOISE_FLOOR = {"seconds": 0.1, "peak_rss_mb": 16.0}
+
+
+@dataclass(frozen=True)
+class LectureSpec:
+    """Synthetic lecture video."""
+
+    duration: float = 60.0
+    width: int = 1280
+    height: int = 720
+    fps: float = 30.0
+    # Seconds each slide is shown
+    slide_seconds: float = 10.0
+    # Reveal BULLETS_PER_SLIDE bullet points one by one during each slide
+    animations: bool = True
+    # Moving speaker overlay in the bottom-right corner
+    speaker: bool = True
+    # Standard deviation of the Gaussian noise added to every frame (0 for none)
+    noise: float = 2.0
+    seed: int = 0
+
+
+def _render_slide(spec: LectureSpec, slide_num: int, bullets: int) -> np.ndarray:
+    rng = np.random.default_rng((spec.seed, slide_num))
+    w, h = spec.width, spec.height
+    background = tuple(int(c) for c in rng.integers(20, 90, 3))
+    frame = np.full((h, w, 3), background, dtype=np.uint8)
+    scale = h / 720
+    thickness = max(1, round(2 * scale))
+    cv2.putText(
+        frame,
+        f"Lecture slide {slide_num + 1}",
+        (int(w * 0.08), int(h * 0.15)),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        1.6 * scale,
+        (255, 255, 255),
+        thickness + 1,
+    )
+    # A diagram that differs between slides
+    x, y = int(w * rng.uniform(0.5, 0.6)), int(h * rng.uniform(0.25, 0.35))
+    color = tuple(int(c) for c in rng.integers(120, 256, 3))
+    cv2.rectangle(frame, (x, y), (x + int(w * 0.25), y + int(h * 0.3)), color, thickness)
+    cv2.circle(frame, (x + int(w * 0.125), y + int(h * 0.15)), int(h * 0.1), color, -1)
+    for bullet in range(bullets):
+        cv2.putText(
+            frame,
+            f"- point {bullet + 1} of slide {slide_num + 1}",
+            (int(w * 0.08), int(h * (0.35 + 0.12 * bullet))),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.9 * scale,
+            (230, 230, 230),
+            thickness,
+        )
+    return frame
+
+
+def _draw_speaker(frame: np.ndarray, index: int, fps: float) -> None:
+    h, w = frame.shape[:2]
+    box_w, box_h = int(w * 0.1), int(h * 0.1)
+    t = index / fps
+    x = int(w * 0.88 - box_w / 2 + w * 0.01 * np.sin(t * 1.3))
+    y = int(h * 0.88 - box_h / 2 + h * 0.01 * np.sin(t * 0.7))
+    cv2.rectangle(frame, (x, y), (x + box_w, y + box_h), (60, 90, 140), -1)
+    cv2.circle(frame, (x + box_w // 2, y + box_h // 3), box_h // 5, (170, 190, 220), -1)
+
+
+def generate_lecture_video(path: str, spec: LectureSpec) -> int:
+    """
+    Write a deterministic synthetic lecture video.
+
+    Args:
+        path: Output video path (mp4)
+        spec: Video to generate
+
+    Returns:
+        Number of distinct slide states (a slide with each bullet revealed counts once per
+        bullet), the ground truth for the number of slides at a strict threshold
+    """
+    frame_count = int(spec.duration * spec.fps)
+    frames_per_slide = max(1, int(spec.slide_seconds * spec.fps))
+    steps = BULLETS_PER_SLIDE + 1 if spec.animations else 1
+    frames_per_step = max(1, frames_per_slide // steps)
+
+    rng = np.random.default_rng(spec.seed)
+    # Signed noise split into saturating add and subtract terms, which OpenCV applies
+    # much faster than NumPy's int16 arithmetic
+    noise = []
+    for _ in range(_NOISE_FIELDS if spec.noise > 0 else 0):
+        field = np.rint(rng.normal(0, spec.noise, (spec.height, spec.width, 1)))
+        field = np.repeat(field, 3, axis=2)
+        noise.append(
+            (np.clip(field, 0, 255).astype(np.uint8), np.clip(-field, 0, 255).astype(np.uint8))
+        )
+    out = cv2.VideoWriter(
+        path, cv2.VideoWriter.fourcc(*"mp4v"), spec.fps, (spec.width, spec.height)
+    )
+    if not out.isOpened():
+        raise ValueError(f"Unable to write video: {path}")
+
+    # The first frame shows the first step of the first slide
+    states = {(0, 0)}
+    slide = _render_slide(spec, 0, 0)
+    try:
+        for index in range(frame_count):
+            slide_num, offset = divmod(index, frames_per_slide)
+            state = (slide_num, min(offset // frames_per_step, steps - 1))
+            if state not in states:
+                states.add(state)
+                slide = _render_slide(spec, slide_num, state[1] if spec.animations else 0)
+            frame = slide.copy()
+            if spec.speaker:
+                _draw_speaker(frame, index, spec.fps)
+            if noise:
+                added, subtracted = noise[index % len(noise)]
+                cv2.add(frame, added, dst=frame)
+                cv2.subtract(frame, subtracted, dst=frame)
+            out.write(frame)
+    finally:
+        out.release()
+    return len(states)
+
+
+class _PeakRSS:
+    """Peak resident memory of this process while the context is active."""
+
+    def __init__(self) -> None:
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @staticmethod
+    def _current() -> int:
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, AttributeError):
+            # No procfs: fall back to the process high-water mark
+            peak = peak_rss_mb()
+            return int(peak * 1024 * 1024) if peak is not None else 0
+
+    def _sample(self) -> None:
+        while not self._stop.wait(_RSS_INTERVAL):
+            self.peak_bytes = max(self.peak_bytes, self._current())
+
+    def __enter__(self) -> "_PeakRSS":
+        self.peak_bytes = self._current()
+        self._thread = threading.Thread(target=self._sample, name="rss", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.peak_bytes = max(self.peak_bytes, self._current())
+
+    @property
+    def peak_mb(self) -> float:
+        """Peak resident memory in megabytes."""
+        return round(self.peak_bytes / (1024 * 1024), 1)
+
+
+def _decode_stage(video_path: str) -> dict[str, float]:
+    with _PeakRSS() as rss:
+        cap = cv2.VideoCapture(video_path)
+        start = time.perf_counter()
+        frames = 0
+        while cap.grab():
+            cap.retrieve()
+            frames += 1
+        seconds = time.perf_counter() - start
+        cap.release()
+    return {
+        "seconds": round(seconds, 4),
+        "frames": frames,
+        "frames_per_second": round(frames / seconds, 1),
+        "peak_rss_mb": rss.peak_mb,
+    }
+
+
+def _convert_stages(
+    video_path: str, output_path: str, options: dict[str, Any]
+) -> dict[str, dict[str, float]]:
+    converter = Video2Slides(video_path, output_path, **options)
+    try:
+        with _PeakRSS() as rss:
+            start = time.perf_counter()
+            converter.extract_frames()
+            extract_seconds = time.perf_counter() - start
+        comparisons = sum(converter.detector_tiers.values())
+        extract = {
+            "seconds": round(extract_seconds, 4),
+            "comparisons": comparisons,
+            "comparisons_per_second": round(comparisons / extract_seconds, 1),
+            "slides": len(converter.frames),
+            "peak_rss_mb": rss.peak_mb,
+        }
+
+        with _PeakRSS() as rss:
+            start = time.perf_counter()
+            converter.generate_ppt()
+            pptx_seconds = time.perf_counter() - start
+        pptx = {
+            "seconds": round(pptx_seconds, 4),
+            "bytes": os.path.getsize(output_path),
+            "peak_rss_mb": rss.peak_mb,
+        }
+    finally:
+        converter.cleanup()
+    return {"extract": extract, "pptx": pptx}
+
+
+def _environment() -> dict[str, Any]:
+    try:
+        package_version = version("video2slides")
+    except PackageNotFoundError:
+        package_version = None
+    return {
+        "video2slides": package_version,
+        "python": platform.python_version(),
+        "opencv": cv2.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_benchmark(
+    spec: LectureSpec,
+    options: dict[str, Any] | None = None,
+    repeat: int = 1,
+    video_path: str | None = None,
+) -> dict[str, Any]:
+    """
+    Generate a synthetic lecture and measure every stage of converting it.
+
+    Args:
+        spec: Synthetic video to generate
+        options: Video2Slides options (e.g. similarity_threshold, detector, backend)
+        repeat: Number of runs; each stage reports its fastest run, and the lowest peak
+            memory of all runs (later runs start with the memory earlier runs left behind)
+        video_path: Benchmark this video instead of generating one (``spec`` is then only
+            recorded, not used)
+
+    Returns:
+        JSON-serializable results
+    """
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got: {repeat}")
+    options = {"use_gpu": False, **(options or {})}
+
+    with tempfile.TemporaryDirectory(prefix="video2slides-bench-") as tmp:
+        slide_states = None
+        if video_path is None:
+            video_path = os.path.join(tmp, "lecture.mp4")
+            start = time.perf_counter()
+            slide_states = generate_lecture_video(video_path, spec)
+            generate_seconds = time.perf_counter() - start
+        else:
+            generate_seconds = 0.0
+
+        stages: dict[str, dict[str, float]] = {}
+        for _ in range(repeat):
+            run = {"decode": _decode_stage(video_path)}
+            run.update(_convert_stages(video_path, os.path.join(tmp, "deck.pptx"), options))
+            for name, metrics in run.items():
+                best = stages.get(name)
+                if best is None or metrics["seconds"] < best["seconds"]:
+                    stages[name] = dict(metrics)
+                if best is not None:
+                    stages[name]["peak_rss_mb"] = min(
+                        best["peak_rss_mb"], metrics["peak_rss_mb"]
+                    )
+
+    return {
+        "version": BENCH_VERSION,
+        "spec": asdict(spec) if slide_states is not None else None,
+        "video": None if slide_states is not None else os.path.abspath(video_path),
+        "options": {name: str(value) for name, value in sorted(options.items())},
+        "slide_states": slide_states,
+        "generate_seconds": round(generate_seconds, 2),
+        "repeat": repeat,
+        "environment": _environment(),
+        "stages": stages,
+    }
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A metric that got worse than the baseline by more than the tolerance."""
+
+    stage: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change (positive = larger than the baseline)."""
+        if self.baseline == 0:
+            return float("inf") if self.current else 0.0
+        return self.current / self.baseline - 1
+
+    def __str__(self) -> str:
+        if self.metric == "slides":
+            return f"{self.stage}.{self.metric}: {self.baseline:g} -> {self.current:g}"
+        return (
+            f"{self.stage}.{self.metric}: {self.baseline:g} -> {self.current:g} "
+            f"({self.change:+.0%})"
+        )
+
+
+def _lower_is_better(metric: str) -> bool | None:
+    if metric.endswith("_per_second"):
+        return False
+    if metric in ("seconds", "peak_rss_mb"):
+        return True
+    return None
+
+
+def compare_results(
+    current: dict[str, Any], baseline: dict[str, Any], tolerance: float = DEFAULT_TOLERANCE
+) -> list[Regression]:
+    """
+    Compare benchmark results against a baseline.
+
+    Times and peak memory regress when they grow by more than ``tolerance`` (and by more
+    than a small absolute noise floor), throughputs when they drop by more than
+    ``tolerance``; a different number of kept slides is always a regression. Other metrics
+    (counts, sizes) are informational.
+
+    Args:
+        current: Results of ``run_benchmark``
+        baseline: Stored results of an earlier run with the same video and options
+        tolerance: Allowed relative change (0.2 = 20%)
+
+    Returns:
+        Regressions, empty if none
+
+    Raises:
+        ValueError: If the results were produced with another video, options or version
+    """
+    for field in ("version", "spec", "video", "options"):
+        if current.get(field) != baseline.get(field):
+            raise ValueError(
+                f"Baseline was recorded with another {field}: {baseline.get(field)!r}"
+            )
+
+    regressions = []
+    for stage, metrics in current["stages"].items():
+        for metric, value in metrics.items():
+            reference = baseline["stages"].get(stage, {}).get(metric)
+            if reference is None:
+                continue
+            lower_is_better = _lower_is_better(metric)
+            if metric == "slides":
+                worse = value != reference
+            elif lower_is_better is None:
+                continue
+            elif lower_is_better:
+                worse = value > max(
+                    reference * (1 + tolerance), reference + _NOISE_FLOOR.get(metric, 0.0)
+                )
+            else:
+                worse = value < reference * (1 - tolerance)
+            if worse:
+                regressions.append(Regression(stage, metric, reference, value))
+    return regressions
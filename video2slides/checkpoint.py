@@ -0,0 +1,145 @@
+"""
+Checkpoints of an extraction in progress, so a long conversion can resume after a crash.
+
+A checkpoint directory holds the kept frames (written as they are accepted) and a JSON
+state: the next frame to sample, the frame numbers kept so far and the comparison image
+of the last kept frame, which is the reference for the following decisions. A resumed
+extraction seeks to the next frame and keeps exactly the frames an uninterrupted run
+would have kept.
+
+The state is only written once every frame it lists is on disk, and always replaced
+atomically, so a process killed at any point leaves a consistent checkpoint behind.
+"""
+
+import json
+import os
+import shutil
+from dataclasses import dataclass, field
+
+import cv2
+import numpy as np
+
+from video2slides.frame_store import DiskFrameStore
+
+# Bump when the content or layout of checkpoints changes
+CHECKPOINT_VERSION = 1
+_STATE_NAME = "checkpoint.json"
+
+
+def default_checkpoint_dir(output_path: str) -> str:
+    """Checkpoint directory of a conversion: hidden, next to the output file."""
+    directory, name = os.path.split(output_path)
+    return os.path.join(directory, f".{name}.checkpoint")
+
+
+@dataclass
+class CheckpointState:
+    """Progress of an extraction."""
+
+    # Next frame to sample (None once every sample has been decided)
+    next_frame: int | None
+    # Frame numbers of the kept frames, in slide order
+    frame_numbers: list[int] = field(default_factory=list)
+    # Comparison image of the last kept frame (None if no frame was kept yet)
+    reference: np.ndarray | None = None
+
+
+class CheckpointFrameStore(DiskFrameStore):
+    """Kept frames written to a checkpoint directory, which outlives the conversion job."""
+
+    name = "checkpoint"
+
+    def restore(self, keys: list[str]) -> None:
+        """
+        Register frames written by an earlier run.
+
+        Raises:
+            FileNotFoundError: If a frame is missing
+        """
+        for key in keys:
+            self._sizes[key] = os.path.getsize(self.path(key))
+
+    def close(self) -> None:
+        """Forget the stored frames; the files stay until the checkpoint is removed."""
+        self._sizes.clear()
+
+
+class Checkpoint:
+    """Checkpoint directory of one conversion."""
+
+    def __init__(self, directory: str, key: str) -> None:
+        """
+        Initialize checkpoint.
+
+        Args:
+            directory: Checkpoint directory
+            key: Fingerprint of the video and of every setting the kept frames depend on;
+                checkpoints written with another key are not resumed
+        """
+        self.directory = directory
+        self.key = key
+
+    @property
+    def frames_dir(self) -> str:
+        """Directory of the kept frames."""
+        return os.path.join(self.directory, "frames")
+
+    def frame_store(self) -> CheckpointFrameStore:
+        """Frame store writing kept frames into the checkpoint."""
+        return CheckpointFrameStore(self.frames_dir)
+
+    def load(self) -> CheckpointState | None:
+        """
+        Read the checkpoint.
+
+        Returns:
+            The saved state, or None if there is none, it cannot be read or it was written
+            for another video or other settings
+        """
+        try:
+            with open(os.path.join(self.directory, _STATE_NAME)) as f:
+                data = json.load(f)
+            if data.get("version") != CHECKPOINT_VERSION or data.get("key") != self.key:
+                return None
+            reference = None
+            if data["reference"]:
+                reference = cv2.imread(
+                    os.path.join(self.directory, data["reference"]), cv2.IMREAD_GRAYSCALE
+                )
+                if reference is None:
+                    return None
+            return CheckpointState(data["next_frame"], data["frame_numbers"], reference)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def save(self, state: CheckpointState) -> None:
+        """Atomically replace the saved state (the frames it lists must already be stored)."""
+        os.makedirs(self.directory, exist_ok=True)
+        reference_name = None
+        if state.reference is not None:
+            # Named after the last kept frame, so the previous state's image stays valid
+            # until the new state replaces it
+            reference_name = f"reference_{len(state.frame_numbers)}.png"
+            self._write(reference_name, cv2.imencode(".png", state.reference)[1].tobytes())
+        data = {
+            "version": CHECKPOINT_VERSION,
+            "key": self.key,
+            "next_frame": state.next_frame,
+            "frame_numbers": state.frame_numbers,
+            "reference": reference_name,
+        }
+        self._write(_STATE_NAME, json.dumps(data).encode())
+        for name in os.listdir(self.directory):
+            if name.startswith("reference_") and name != reference_name:
+                os.remove(os.path.join(self.directory, name))
+
+    def _write(self, name: str, data: bytes) -> None:
+        path = os.path.join(self.directory, name)
+        with open(f"{path}.partial", "wb") as f:
+            f.write(data)
+        os.replace(f"{path}.partial", path)
+
+    def remove(self) -> None:
+        """Delete the checkpoint and its frames."""
+        if os.path.exists(self.directory):
+            shutil.rmtree(self.directory)
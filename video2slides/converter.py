@@ -1,48 +1,333 @@
 """Video to PowerPoint converter class."""
 
+import hashlib
+import json
+import multiprocessing
 import os
 import re
-import shutil
+import time
+import warnings
+from abc import ABC, abstractmethod
+from collections import Counter, deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import astuple
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 import cv2
 import numpy as np
-from eliot import start_action
-from pptx import Presentation
-from pptx.util import Inches
-from skimage.metrics import structural_similarity as ssim
+from eliot import Action, start_action
+from pptx import Presentation, presentation
+from pptx.util import Inches, Length
+
+from video2slides.accelerator import (
+    CPU_ACCELERATOR,
+    Accelerator,
+    _cuda,
+    cuda_device_count,
+    get_accelerator,
+)
+from video2slides.analysis_cache import (
+    AnalysisCache,
+    CachedAnalysis,
+    SampleRecorder,
+    video_fingerprint,
+)
+from video2slides.checkpoint import (
+    Checkpoint,
+    CheckpointState,
+    default_checkpoint_dir,
+)
+from video2slides.defaults import (
+    DEFAULT_CACHE_SIZE_MB,
+    DEFAULT_CHECKPOINT_INTERVAL,
+    DEFAULT_COMPARE_WORKERS,
+    DEFAULT_FOLLOW_TIMEOUT,
+    DEFAULT_JPEG_QUALITY,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MEMORY_BUDGET_MB,
+)
+from video2slides.follow import Capture, FollowingCapture
+from video2slides.frame_store import (
+    FRAME_STORES,
+    FrameStore,
+    ImageEncoding,
+    create_frame_store,
+    encode_frame,
+)
+from video2slides.metrics import StageTimers, peak_rss_mb
+from video2slides.pipeline import BoundedExecutor, BoundedProducer, OrderedConsumer
+from video2slides.pptx_writer import PPTX_WRITERS, DirectPresentationWriter
+from video2slides.regions import ComparisonRegion, Rect, detect_speaker_box
+from video2slides.sampling import (
+    ADAPTIVE_SAMPLING,
+    SAMPLING_MODES,
+    AdaptiveSampler,
+    FrameFetcher,
+    FrameSampler,
+)
+from video2slides.segments import extract_segment, plan_segments, read_frame_at, stitch_segment
+from video2slides.ssim import SSIMStats, compute_stats, ssim_score
+
+SLIDE_WIDTH = Inches(10)
+SLIDE_HEIGHT = Inches(7.5)
+# Frames are downscaled to this many lines before computing similarity
+COMPARISON_HEIGHT = 480
+
+# Downscale factor of the thumbnail used by the tiered detector's intermediate tier
+THUMBNAIL_FACTOR = 4
+# dHash grid (HASH_SIZE x HASH_SIZE bits)
+HASH_SIZE = 16
+HISTOGRAM_BINS = 64
+# Mean absolute grayscale difference below which two thumbnails count as identical
+IDENTICAL_MEAN_DIFFERENCE = 1.0
+
+
+class FrameSignature:
+    """
+    Comparison signature of a sampled frame.
+
+    Holds the prepared (cropped, downscaled, masked) grayscale image and lazily computes
+    the cheaper features detectors use, so each feature is computed at most once per frame.
+    The image may live on an accelerator device; full SSIM runs there and only the host
+    features (thumbnail, hash, histogram) download it.
+    """
+
+    __slots__ = (
+        "accelerator",
+        "_image",
+        "_device",
+        "_thumbnail",
+        "_dhash",
+        "_histogram",
+        "_stats",
+        "_thumbnail_stats",
+    )
 
+    def __init__(
+        self,
+        image: np.ndarray | None = None,
+        accelerator: Accelerator = CPU_ACCELERATOR,
+        device: object | None = None,
+    ) -> None:
+        """
+        Initialize signature.
 
-class GPUAccelerator:
-    """Manages GPU acceleration for video processing."""
+        Args:
+            image: Prepared grayscale comparison image on the host
+            accelerator: Backend computing SSIM statistics and scores
+            device: The same image already held by ``accelerator`` (instead of or with
+                ``image``)
+        """
+        if image is None and device is None:
+            raise ValueError("A signature needs a host or a device image")
+        self.accelerator = accelerator
+        self._image = image
+        self._device = device
+        self._thumbnail: np.ndarray | None = None
+        self._dhash: np.ndarray | None = None
+        self._histogram: np.ndarray | None = None
+        self._stats: object | None = None
+        self._thumbnail_stats: SSIMStats | None = None
+
+    @property
+    def image(self) -> np.ndarray:
+        """Comparison image on the host (downloaded on first use)."""
+        if self._image is None:
+            self._image = self.accelerator.download(self._device)
+        return self._image
+
+    @property
+    def device(self) -> object:
+        """Comparison image on the accelerator (uploaded on first use)."""
+        if self._device is None:
+            self._device = self.accelerator.upload(self.image)
+        return self._device
+
+    @property
+    def stats(self) -> object:
+        """SSIM statistics (local means and variances) of the image, kept on the accelerator."""
+        if self._stats is None:
+            self._stats = self.accelerator.stats(self.device)
+        return self._stats
+
+    def ssim(self, other: "FrameSignature") -> float:
+        """Full SSIM against another signature, computed on the accelerator."""
+        return self.accelerator.ssim(self.stats, other.stats)
+
+    @property
+    def thumbnail_stats(self) -> SSIMStats:
+        """SSIM statistics of the thumbnail."""
+        if self._thumbnail_stats is None:
+            self._thumbnail_stats = compute_stats(self.thumbnail)
+        return self._thumbnail_stats
+
+    @property
+    def thumbnail(self) -> np.ndarray:
+        """Image downscaled by THUMBNAIL_FACTOR."""
+        if self._thumbnail is None:
+            h, w = self.image.shape[:2]
+            size = (max(7, w // THUMBNAIL_FACTOR), max(7, h // THUMBNAIL_FACTOR))
+            self._thumbnail = cv2.resize(self.image, size, interpolation=cv2.INTER_AREA)
+        return self._thumbnail
+
+    @property
+    def dhash(self) -> np.ndarray:
+        """Difference hash: sign of horizontal gradients on a HASH_SIZE grid, bit-packed."""
+        if self._dhash is None:
+            small = cv2.resize(self.image, (HASH_SIZE + 1, HASH_SIZE), interpolation=cv2.INTER_AREA)
+            self._dhash = np.packbits(small[:, 1:] > small[:, :-1])
+        return self._dhash
+
+    @property
+    def histogram(self) -> np.ndarray:
+        """Normalized grayscale histogram."""
+        if self._histogram is None:
+            hist = cv2.calcHist([self.image], [0], None, [HISTOGRAM_BINS], [0, 256])
+            self._histogram = cv2.normalize(hist, hist).flatten()
+        return self._histogram
+
+
+def _hash_similarity(reference: FrameSignature, current: FrameSignature) -> float:
+    distance = int(np.unpackbits(np.bitwise_xor(reference.dhash, current.dhash)).sum())
+    return 1.0 - distance / (HASH_SIZE * HASH_SIZE)
+
+
+class ChangeDetector(ABC):
+    """
+    Strategy deciding how similar a frame is to the last kept frame.
+
+    ``compare`` returns the similarity together with the name of the tier that produced
+    it; a frame starts a new slide when the similarity is below the threshold.
+    """
+
+    name = "base"
+    # True if compare() scores depend on the threshold (e.g. tiers chosen around it)
+    uses_threshold = False
+
+    @abstractmethod
+    def compare(
+        self, reference: FrameSignature, current: FrameSignature, threshold: float
+    ) -> tuple[float, str]:
+        """
+        Compare two signatures.
 
-    def __init__(self) -> None:
-        """Initialize GPU accelerator and detect GPU availability."""
-        self.use_gpu = False
-        self.cuda_available = False
-        self._detect_gpu()
+        Args:
+            reference: Signature of the last kept frame
+            current: Signature of the candidate frame
+            threshold: Similarity threshold the decision will be made against
 
-    def _detect_gpu(self) -> None:
-        """Detect if GPU/CUDA is available for OpenCV."""
-        try:
-            # Check if OpenCV was built with CUDA support
-            cuda_count = cv2.cuda.getCudaEnabledDeviceCount()
-            if cuda_count > 0:
-                self.cuda_available = True
-                self.use_gpu = True
-                # Get GPU device info
-                device_info = cv2.cuda.getDevice()
-                return
-        except AttributeError:
-            # cv2.cuda module not available
-            pass
-        except Exception:
-            # Any other error during GPU detection
-            pass
+        Returns:
+            (similarity in 0-1, tier that resolved the comparison)
+        """
+
+
+class SSIMDetector(ChangeDetector):
+    """Full structural similarity on the comparison image (most accurate, slowest)."""
 
-        self.cuda_available = False
-        self.use_gpu = False
+    name = "ssim"
+
+    def compare(
+        self, reference: FrameSignature, current: FrameSignature, threshold: float
+    ) -> tuple[float, str]:
+        return reference.ssim(current), "ssim"
+
+
+class HashDetector(ChangeDetector):
+    """Fraction of matching dHash bits (very fast, coarse)."""
+
+    name = "hash"
+
+    def compare(
+        self, reference: FrameSignature, current: FrameSignature, threshold: float
+    ) -> tuple[float, str]:
+        return _hash_similarity(reference, current), "hash"
+
+
+class HistogramDetector(ChangeDetector):
+    """Grayscale histogram correlation (fast, ignores layout)."""
+
+    name = "hist"
+
+    def compare(
+        self, reference: FrameSignature, current: FrameSignature, threshold: float
+    ) -> tuple[float, str]:
+        correlation = cv2.compareHist(reference.histogram, current.histogram, cv2.HISTCMP_CORREL)
+        return max(0.0, float(correlation)), "hist"
+
+
+class TieredDetector(ChangeDetector):
+    """
+    Cheap pre-filters in front of full SSIM.
+
+    1. hash: identical dHashes with a near-zero mean absolute thumbnail difference are
+       treated as the same slide (the hash alone misses pure brightness changes).
+    2. thumbnail: SSIM on a THUMBNAIL_FACTOR-times smaller image; a score further than
+       ``band`` from the threshold is trusted.
+    3. ssim: full SSIM for the remaining ambiguous frames.
+    """
+
+    name = "tiered"
+    uses_threshold = True
+
+    def __init__(self, band: float = 0.05) -> None:
+        """
+        Initialize detector.
+
+        Args:
+            band: Half-width of the ambiguous thumbnail score band around the threshold
+        """
+        self.band = band
+
+    def compare(
+        self, reference: FrameSignature, current: FrameSignature, threshold: float
+    ) -> tuple[float, str]:
+        if (
+            np.array_equal(reference.dhash, current.dhash)
+            and cv2.norm(reference.thumbnail, current.thumbnail, cv2.NORM_L1)
+            <= IDENTICAL_MEAN_DIFFERENCE * reference.thumbnail.size
+        ):
+            return 1.0, "hash"
+
+        estimate = ssim_score(reference.thumbnail_stats, current.thumbnail_stats)
+        if abs(estimate - threshold) > self.band:
+            return estimate, "thumbnail"
+
+        return reference.ssim(current), "ssim"
+
+
+DETECTORS: dict[str, type[ChangeDetector]] = {
+    detector.name: detector
+    for detector in (SSIMDetector, HashDetector, TieredDetector, HistogramDetector)
+}
+
+
+# (frame_number, frame, signature, (similarity, tier) against the current reference)
+_PendingFrame = tuple[int, np.ndarray, Future[FrameSignature], Future[tuple[float, str]] | None]
+# Presentation being built by either PPTX writer
+_Deck = presentation.Presentation | DirectPresentationWriter
+
+
+class GPUAccelerator:
+    """
+    Deprecated: use ``video2slides.accelerator.get_accelerator`` instead.
+
+    Resizes and converts single frames on the CUDA backend when OpenCV sees a CUDA device,
+    otherwise on the CPU.
+    """
+
+    def __init__(self) -> None:
+        """Detect CUDA availability."""
+        warnings.warn(
+            "GPUAccelerator is deprecated; use video2slides.accelerator.get_accelerator",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        self.cuda_available = cuda_device_count() > 0
+        self.use_gpu = self.cuda_available
 
     def resize_frame(self, frame: np.ndarray, target_size: tuple[int, int]) -> np.ndarray:
         """
@@ -55,21 +340,8 @@ class GPUAccelerator:
         Returns:
             Resized frame
         """
-        if self.use_gpu and self.cuda_available:
-            try:
-                # Upload to GPU
-                gpu_frame = cv2.cuda_GpuMat()
-                gpu_frame.upload(frame)
-                # Resize on GPU
-                gpu_resized = cv2.cuda.resize(gpu_frame, target_size)
-                # Download from GPU
-                return gpu_resized.download()
-            except Exception:
-                # Fallback to CPU on error
-                pass
-
-        # CPU fallback
-        return cv2.resize(frame, target_size)
+        resized = self._on_gpu(lambda image: _cuda.resize(image, target_size), frame)
+        return resized if resized is not None else cv2.resize(frame, target_size)
 
     def cvt_color(self, frame: np.ndarray, conversion: int) -> np.ndarray:
         """
@@ -82,21 +354,18 @@ class GPUAccelerator:
         Returns:
             Converted frame
         """
-        if self.use_gpu and self.cuda_available:
-            try:
-                # Upload to GPU
-                gpu_frame = cv2.cuda_GpuMat()
-                gpu_frame.upload(frame)
-                # Convert color on GPU
-                gpu_converted = cv2.cuda.cvtColor(gpu_frame, conversion)
-                # Download from GPU
-                return gpu_converted.download()
-            except Exception:
-                # Fallback to CPU on error
-                pass
-
-        # CPU fallback
-        return cv2.cvtColor(frame, conversion)
+        converted = self._on_gpu(lambda image: _cuda.cvtColor(image, conversion), frame)
+        return converted if converted is not None else cv2.cvtColor(frame, conversion)
+
+    def _on_gpu(self, operation: Callable[[Any], Any], frame: np.ndarray) -> np.ndarray | None:
+        """Run a cv2.cuda operation on the CUDA backend; None to fall back to the CPU."""
+        if not self.use_gpu:
+            return None
+        accelerator = get_accelerator(backend="cuda")
+        try:
+            return accelerator.download(operation(accelerator.upload(frame)))
+        except cv2.error:
+            return None
 
 
 class Video2Slides:
@@ -132,6 +401,37 @@ class Video2Slides:
         ignore_corners: bool = True,
         corner_size_percent: float = 0.15,
         use_gpu: bool = True,
+        backend: str = "auto",
+        sampling_mode: str = "auto",
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        decode_queue_size: int = 16,
+        compare_workers: int = DEFAULT_COMPARE_WORKERS,
+        writer_workers: int = 2,
+        write_queue_size: int = 8,
+        workers: int = 1,
+        ignore_regions: list[Rect] | None = None,
+        crop_region: Rect | None = None,
+        detect_speaker: bool = False,
+        detector: str | ChangeDetector = "ssim",
+        tier_band: float = 0.05,
+        reduced_decode: bool = False,
+        frame_store: str | FrameStore = "spill",
+        memory_budget_mb: int = DEFAULT_MEMORY_BUDGET_MB,
+        pptx_writer: str = "python-pptx",
+        image_format: str = "jpeg",
+        jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+        chroma_subsampling: str = "420",
+        max_dpi: int | None = None,
+        analysis_cache: bool = False,
+        cache_dir: str | None = None,
+        cache_size_mb: int = DEFAULT_CACHE_SIZE_MB,
+        checkpoint: bool = False,
+        checkpoint_interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+        checkpoint_dir: str | None = None,
+        resume: bool = False,
+        follow: bool = False,
+        follow_timeout: float = DEFAULT_FOLLOW_TIMEOUT,
+        source_complete: Callable[[], bool] | None = None,
     ) -> None:
         """
         Initialize converter.
@@ -145,22 +445,175 @@ class Video2Slides:
             ignore_corners: If True, ignore corner regions when comparing frames (useful for speaker video)
             corner_size_percent: Size of corners to ignore as percentage of frame dimensions (0-1)
             use_gpu: If True, attempt to use GPU acceleration (will fallback to CPU if not available)
+            backend: Comparison backend: "cpu", "cuda", "umat" (OpenCV's transparent API,
+                OpenCL when available) or "auto" to pick the fastest available one by a short
+                micro-benchmark (the CPU if use_gpu is False)
+            sampling_mode: How to reach sampled frames: "read" decodes every frame, "grab" skips
+                color conversion for skipped frames, "seek" jumps between samples, "auto" picks
+                grab or seek from the interval and the codec GOP size, "adaptive" starts at
+                fps_interval and doubles the step through static stretches up to
+                max_interval, locating each change to the exact frame by binary search
+            max_interval: Longest step in seconds between samples with adaptive sampling
+            decode_queue_size: Maximum number of decoded frames buffered ahead of comparison
+            compare_workers: Number of threads computing frame similarity
+            writer_workers: Number of threads encoding and writing accepted frames
+            write_queue_size: Maximum number of accepted frames waiting to be written
+            workers: Number of processes extracting segments of the timeline in parallel
+                (1 to extract with a single capture)
+            ignore_regions: Extra rectangles to ignore when comparing frames (e.g. a webcam
+                overlay that is not in a corner), in fractions of the frame size
+            crop_region: Only compare this slide area, in fractions of the frame size
+            detect_speaker: If True, detect a moving speaker overlay from a few sample frames
+                before extraction and ignore it
+            detector: Change detection strategy ("ssim", "hash", "tiered", "hist") or a
+                ChangeDetector instance
+            tier_band: Half-width of the ambiguous band around the threshold in which the
+                tiered detector falls back to full SSIM
+            reduced_decode: If True, reduce sampled frames to their comparison image right
+                after decoding and decode kept frames again at full resolution for writing
+                (lower memory and copy bandwidth for high-resolution videos)
+            frame_store: Where encoded slide images are kept until the presentation is
+                written: "memory", "disk" (a private temporary directory), "spill" (memory up
+                to memory_budget_mb, then disk) or a FrameStore instance
+            memory_budget_mb: Memory budget of the spill frame store in megabytes
+            pptx_writer: "python-pptx", or "direct" to stream slides straight into the PPTX
+                file (faster and lighter for decks with thousands of slides)
+            image_format: Format of the embedded slide images ("jpeg" or "png")
+            jpeg_quality: JPEG quality (1-100)
+            chroma_subsampling: JPEG chroma subsampling ("444", "422" or "420")
+            max_dpi: Downscale slide images larger than the picture on the slide at this
+                many dots per inch (None to embed frames at source resolution)
+            analysis_cache: If True, cache the comparison images of all sampled frames, so
+                re-running the video with other thresholds, detectors, masks or layout
+                settings skips decoding everything but the kept frames
+            cache_dir: Analysis cache directory (default: ~/.cache/video2slides/analysis)
+            cache_size_mb: Size limit of the analysis cache in megabytes; least recently
+                used entries are evicted beyond it
+            checkpoint: If True, keep kept frames in a checkpoint directory and save the
+                extraction progress there periodically; the checkpoint is deleted once the
+                presentation is saved
+            checkpoint_interval: Seconds of extraction between two checkpoints (with
+                several workers, a checkpoint is saved after each segment instead)
+            checkpoint_dir: Checkpoint directory (default: .<output name>.checkpoint next
+                to the output file)
+            resume: If True, continue from the checkpoint of an interrupted conversion with
+                the same video and settings, if there is one (implies checkpoint)
+            follow: If True, the video is still being written (e.g. downloaded): start
+                converting what is there and follow the file as it grows. It does not need
+                to exist yet. Reads the video front to back with a single capture, so it
+                cannot be combined with seeking, several workers, reduced decoding, speaker
+                detection, the analysis cache or checkpoints
+            follow_timeout: Seconds without growth after which a followed video is
+                considered complete (when there is no source_complete)
+            source_complete: Returns True once the writer of a followed video has finished it
         """
+        if isinstance(detector, str):
+            if detector not in DETECTORS:
+                raise ValueError(
+                    f"Unknown detector: {detector}. Expected one of {tuple(DETECTORS)}"
+                )
+            detector = TieredDetector(tier_band) if detector == "tiered" else DETECTORS[detector]()
+        if isinstance(frame_store, str) and frame_store not in FRAME_STORES:
+            raise ValueError(f"Unknown frame store: {frame_store}. Expected one of {FRAME_STORES}")
+        if pptx_writer not in PPTX_WRITERS:
+            raise ValueError(f"Unknown PPTX writer: {pptx_writer}. Expected one of {PPTX_WRITERS}")
+        sampling_modes = (*SAMPLING_MODES, ADAPTIVE_SAMPLING)
+        if sampling_mode not in sampling_modes:
+            raise ValueError(
+                f"Unknown sampling mode: {sampling_mode}. Expected one of {sampling_modes}"
+            )
+        if max_dpi is not None and max_dpi <= 0:
+            raise ValueError(f"max_dpi must be positive, got: {max_dpi}")
+        if checkpoint_interval <= 0:
+            raise ValueError(f"checkpoint_interval must be positive, got: {checkpoint_interval}")
+        if follow:
+            # A growing file can only be read front to back
+            seeks = sampling_mode in ("seek", ADAPTIVE_SAMPLING)
+            self._reject_conflicts(
+                "follow",
+                {
+                    f"sampling_mode={sampling_mode!r}": seeks,
+                    "workers > 1": workers > 1,
+                    "reduced_decode": reduced_decode,
+                    "detect_speaker": detect_speaker,
+                    "analysis_cache": analysis_cache,
+                    "checkpoint": checkpoint or resume,
+                },
+            )
+        if sampling_mode == ADAPTIVE_SAMPLING:
+            # The steps depend on the decisions, so samples are neither fixed nor independent
+            self._reject_conflicts(
+                "adaptive sampling",
+                {
+                    "workers > 1": workers > 1,
+                    "reduced_decode": reduced_decode,
+                    "analysis_cache": analysis_cache,
+                    "checkpoint": checkpoint or resume,
+                },
+            )
+        if max_interval <= 0:
+            raise ValueError(f"max_interval must be positive, got: {max_interval}")
+        if follow_timeout <= 0:
+            raise ValueError(f"follow_timeout must be positive, got: {follow_timeout}")
+
         self.video_path = video_path
         self.fps_interval = fps_interval
         self.keep_aspect_ratio = keep_aspect_ratio
         self.similarity_threshold = similarity_threshold
         self.ignore_corners = ignore_corners
         self.corner_size_percent = corner_size_percent
+        self.sampling_mode = sampling_mode
+        self.max_interval = max_interval
+        self.decode_queue_size = max(1, decode_queue_size)
+        self.compare_workers = max(1, compare_workers)
+        self.writer_workers = max(1, writer_workers)
+        self.write_queue_size = max(1, write_queue_size)
+        self.workers = max(1, workers)
+        self.ignore_regions: list[Rect] = list(ignore_regions or [])
+        self.crop_region = crop_region
+        self.detect_speaker = detect_speaker
+        self._region: ComparisonRegion | None = None
+        self._region_key: tuple[object, ...] | None = None
+        self.detector = detector
+        self.detector_tiers: Counter[str] = Counter()
+        self.reduced_decode = reduced_decode
+        # Keys of the kept frames in frame_store, in slide order
         self.frames: list[str] = []
-        self.frames_dir: str | None = None
+        self.frame_numbers: list[int] = []
+        self.fps: float = 0.0
+        self.frame_store_kind = frame_store
+        self.memory_budget_mb = memory_budget_mb
+        self.pptx_writer = pptx_writer
+        self.image_encoding = ImageEncoding(image_format, jpeg_quality, chroma_subsampling)
+        self.max_dpi = max_dpi
+        # Busy time per pipeline stage, added to from decoder, comparison and writer threads
+        self.timers = StageTimers()
+        # Figures of the last extraction for the run report
+        self.extract_seconds: float = 0.0
+        self.skipped_count: int = 0
+        self.analysis_cache = analysis_cache
+        self.cache_dir = cache_dir
+        self.cache_size_mb = cache_size_mb
+        # Collects comparison images for the analysis cache while a video is analyzed
+        self._sample_recorder: SampleRecorder | None = None
+        self.checkpoint = checkpoint or resume
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_dir = checkpoint_dir
+        self.resume = resume
+        self._checkpoint: Checkpoint | None = None
+        self.follow = follow
+        self.follow_timeout = follow_timeout
+        self.source_complete = source_complete
+        self.frame_store: FrameStore | None = None
+        # Called with (index, key) whenever a kept frame has been stored, from writer threads
+        self._on_frame_stored: Callable[[int, str], None] | None = None
         self.video_width: int = 0
         self.video_height: int = 0
 
-        # Initialize GPU accelerator
-        self.gpu_accelerator = GPUAccelerator() if use_gpu else None
+        # Backend running the comparison chain
+        self.accelerator = get_accelerator(use_gpu, backend)
 
-        if not os.path.exists(video_path):
+        if not follow and not os.path.exists(video_path):
             raise FileNotFoundError(f"Video file not found: {video_path}")
 
         if output_path is None:
@@ -171,41 +624,228 @@ class Video2Slides:
         # Convert to absolute path
         self.output_path = str(Path(output_path).resolve())
 
-    def _prepare_frame_for_comparison(self, frame: np.ndarray) -> np.ndarray:
+    @staticmethod
+    def _reject_conflicts(option: str, conflicts: dict[str, bool]) -> None:
+        """Raise ValueError naming the settings an option cannot be combined with, if any."""
+        conflicting = [name for name, conflict in conflicts.items() if conflict]
+        if conflicting:
+            raise ValueError(f"{option} cannot be combined with: {', '.join(conflicting)}")
+
+    def __getstate__(self) -> dict[str, object]:
+        # Segment workers only need the settings, not the frames kept so far
+        state = self.__dict__.copy()
+        state["frame_store"] = None
+        state["frames"] = []
+        state["_on_frame_stored"] = None
+        state["timers"] = StageTimers()
+        if self._sample_recorder is not None:
+            state["_sample_recorder"] = SampleRecorder()
+        return state
+
+    def _comparison_region(self) -> ComparisonRegion:
+        """
+        Get the comparison region for the current settings.
+
+        The region (and the masks it caches per resolution) is rebuilt only when the
+        corner or region settings change.
+        """
+        key = (
+            self.ignore_corners,
+            self.corner_size_percent,
+            tuple(self.ignore_regions),
+            self.crop_region,
+        )
+        if self._region is None or self._region_key != key:
+            self._region = ComparisonRegion(
+                ignore_corners=self.ignore_corners,
+                corner_size_percent=self.corner_size_percent,
+                ignore_rects=tuple(self.ignore_regions),
+                crop=self.crop_region,
+            )
+            self._region_key = key
+        return self._region
+
+    def _reduce_on_device(self, frame: np.ndarray) -> object:
         """
-        Prepare frame for comparison by optionally masking corners and converting to grayscale.
+        Reduce a frame to its comparison image on the accelerator: cropped, grayscale, downscaled.
+
+        The slide area is cropped before any conversion, so pixels outside the crop are
+        never processed or transferred.
 
         Args:
             frame: Input frame in BGR format
 
         Returns:
-            Prepared frame for comparison
+            Accelerator image at most COMPARISON_HEIGHT lines high (not yet masked)
         """
-        # Convert to grayscale using GPU if available
-        if self.gpu_accelerator and self.gpu_accelerator.use_gpu:
-            gray = self.gpu_accelerator.cvt_color(frame, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        frame = self._comparison_region().crop_frame(frame)
+        return self.accelerator.reduce(frame, COMPARISON_HEIGHT)
+
+    def _reduce_frame(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Reduce a frame to its comparison image on the host (see ``_reduce_on_device``).
+
+        Args:
+            frame: Input frame in BGR format
+
+        Returns:
+            Grayscale image at most COMPARISON_HEIGHT lines high (not yet masked)
+        """
+        return self.accelerator.download(self._reduce_on_device(frame))
 
-        if self.ignore_corners:
-            # Create a mask to ignore corners where speaker typically appears
-            h, w = gray.shape
-            mask = np.ones((h, w), dtype=np.uint8) * 255
+    def _signature_from_reduced(self, gray: np.ndarray) -> FrameSignature:
+        """Mask a reduced comparison image (in place) and wrap it in a signature."""
+        return FrameSignature(self._comparison_region().apply_mask(gray), self.accelerator)
 
-            # Calculate corner sizes
-            corner_h = int(h * self.corner_size_percent)
-            corner_w = int(w * self.corner_size_percent)
+    def _prepare_signature(self, frame: np.ndarray) -> FrameSignature:
+        """
+        Prepare the comparison signature of a frame: cropped, downscaled, masked grayscale.
 
-            # Mask all four corners (typically bottom-right for speaker, but mask all for safety)
-            mask[0:corner_h, 0:corner_w] = 0  # Top-left
-            mask[0:corner_h, w - corner_w : w] = 0  # Top-right
-            mask[h - corner_h : h, 0:corner_w] = 0  # Bottom-left
-            mask[h - corner_h : h, w - corner_w : w] = 0  # Bottom-right
+        The frame is handed to the accelerator once; conversion, downscaling, masking and
+        the SSIM statistics stay there. The mask is applied at the comparison resolution.
+        Signatures are computed once per sampled frame; the signature of the last kept
+        frame is reused as the reference for every following comparison.
 
-            # Apply mask
-            gray = cv2.bitwise_and(gray, gray, mask=mask)
+        Args:
+            frame: Input frame in BGR format
 
-        return gray
+        Returns:
+            Signature around a grayscale image at most COMPARISON_HEIGHT lines high
+        """
+        image = self._reduce_on_device(frame)
+        mask = self._comparison_region().mask_for(*self.accelerator.shape(image))
+        return FrameSignature(
+            accelerator=self.accelerator, device=self.accelerator.mask(image, mask)
+        )
+
+    def _iter_samples(
+        self, sampler: Iterable[tuple[int, np.ndarray]]
+    ) -> Iterable[tuple[int, np.ndarray]]:
+        """
+        Sampled frames as passed to change detection.
+
+        With ``reduced_decode`` each frame is reduced to its comparison image right after
+        decoding and the full-resolution frame is dropped, so queues and the speculation
+        window only hold small grayscale images.
+        """
+        if not self.reduced_decode:
+            return sampler
+        return self._iter_reduced(sampler)
+
+    def _iter_reduced(
+        self, sampler: Iterable[tuple[int, np.ndarray]]
+    ) -> Iterator[tuple[int, np.ndarray]]:
+        for frame_number, frame in sampler:
+            start = time.perf_counter()
+            reduced = self._reduce_frame(frame)
+            # Part of preparing the sample, which is counted once in prepare_sample
+            self.timers.add("prepare", time.perf_counter() - start, count=0)
+            yield frame_number, reduced
+
+    def _encode_frame(
+        self, frame_number: int, frame: np.ndarray, fetcher: FrameFetcher | None = None
+    ) -> bytes:
+        """
+        Encode a kept frame.
+
+        Args:
+            frame_number: Index of the frame in the video
+            frame: Frame as passed through change detection
+            fetcher: Fetcher to decode the frame again at full resolution when only its
+                reduced comparison image was kept (None to encode ``frame`` as is)
+
+        Returns:
+            Encoded image bytes
+        """
+        if fetcher is not None:
+            frame = fetcher.read(frame_number)
+
+        start = time.perf_counter()
+        max_size = self._max_image_size()
+        if max_size is not None:
+            frame = self._fit_frame(frame, *max_size)
+        data = encode_frame(frame, self.image_encoding)
+        self.timers.add("encode", time.perf_counter() - start)
+        return data
+
+    @staticmethod
+    def _fit_frame(frame: np.ndarray, max_width: int, max_height: int) -> np.ndarray:
+        """
+        Downscale a frame to fit within max_width x max_height, keeping its aspect ratio.
+
+        The frame is first box-filtered by the largest integer factor (OpenCV's fast path for
+        INTER_AREA) and the remaining factor below 2 is done bilinearly, which is several
+        times faster than INTER_AREA at arbitrary ratios and just as free of aliasing.
+        """
+        height, width = frame.shape[:2]
+        scale = min(max_width / width, max_height / height)
+        if scale >= 1:
+            return frame
+
+        factor = int(1 / scale)
+        if factor >= 2:
+            # Drop the few edge pixels that keep the frame from dividing evenly
+            frame = frame[: height - height % factor, : width - width % factor]
+            frame = cv2.resize(
+                frame, (width // factor, height // factor), interpolation=cv2.INTER_AREA
+            )
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        if (frame.shape[1], frame.shape[0]) == size:
+            return frame
+        return cv2.resize(frame, size, interpolation=cv2.INTER_LINEAR)
+
+    def _max_image_size(self) -> tuple[int, int] | None:
+        """Largest useful image size (width, height) in pixels for ``max_dpi``, if set."""
+        if self.max_dpi is None:
+            return None
+        _, _, width, height = self._picture_box()
+        return round(width.inches * self.max_dpi), round(height.inches * self.max_dpi)
+
+    @property
+    def _store(self) -> FrameStore:
+        """Frame store of the running conversion."""
+        if self.frame_store is None:
+            raise RuntimeError("Frames are only stored while converting")
+        return self.frame_store
+
+    def _put_frame(self, index: int, data: bytes) -> None:
+        """Put the encoded image of the index-th kept frame into the frame store."""
+        key = self._frame_key(index)
+        with self.timers.measure("write"):
+            self._store.put(key, data)
+        if self._on_frame_stored is not None:
+            self._on_frame_stored(index, key)
+
+    def _store_frame(
+        self, index: int, frame_number: int, frame: np.ndarray, fetcher: FrameFetcher | None = None
+    ) -> None:
+        """Encode the index-th kept frame and put it into the frame store."""
+        self._put_frame(index, self._encode_frame(frame_number, frame, fetcher))
+
+    def _frame_key(self, index: int) -> str:
+        return f"frame_{index:04d}{self.image_encoding.extension}"
+
+    def _compare_signatures(
+        self, reference: FrameSignature, signature: FrameSignature
+    ) -> tuple[float, str]:
+        """
+        Compare two prepared signatures with the configured detector.
+
+        Args:
+            reference: Signature of the last kept frame
+            signature: Signature of the candidate frame
+
+        Returns:
+            (similarity score 0-1 where 1 is identical, detector tier that resolved it)
+        """
+        with self.timers.measure("similarity"):
+            return self.detector.compare(reference, signature, self.similarity_threshold)
+
+    def _score_signature(
+        self, reference: FrameSignature, signature: Future[FrameSignature]
+    ) -> tuple[float, str]:
+        """Compare a pending signature against the reference once it has been prepared."""
+        return self._compare_signatures(reference, signature.result())
 
     def _compute_frame_similarity(self, frame1: np.ndarray, frame2: np.ndarray) -> float:
         """
@@ -218,28 +858,10 @@ class Video2Slides:
         Returns:
             Similarity score (0-1, where 1 is identical)
         """
-        # Prepare frames for comparison
-        gray1 = self._prepare_frame_for_comparison(frame1)
-        gray2 = self._prepare_frame_for_comparison(frame2)
-
-        # Resize to reasonable size for faster comparison
-        target_height = 480
-        if gray1.shape[0] > target_height:
-            scale = target_height / gray1.shape[0]
-            target_width = int(gray1.shape[1] * scale)
-            
-            # Use GPU-accelerated resize if available
-            if self.gpu_accelerator and self.gpu_accelerator.use_gpu:
-                gray1 = self.gpu_accelerator.resize_frame(gray1, (target_width, target_height))
-                gray2 = self.gpu_accelerator.resize_frame(gray2, (target_width, target_height))
-            else:
-                gray1 = cv2.resize(gray1, (target_width, target_height))
-                gray2 = cv2.resize(gray2, (target_width, target_height))
-
-        # Compute SSIM
-        similarity_score = ssim(gray1, gray2)
-
-        return similarity_score
+        similarity, _ = self._compare_signatures(
+            self._prepare_signature(frame1), self._prepare_signature(frame2)
+        )
+        return similarity
 
     def _is_slide_changed(self, prev_frame: np.ndarray, current_frame: np.ndarray) -> bool:
         """
@@ -255,92 +877,626 @@ class Video2Slides:
         similarity = self._compute_frame_similarity(prev_frame, current_frame)
         return similarity < self.similarity_threshold
 
-    def extract_frames(self) -> None:
-        """Extract frames from video."""
-        with start_action(
-            action_type="extract_frames",
-            video_path=self.video_path,
-            fps_interval=self.fps_interval,
-            similarity_threshold=self.similarity_threshold,
-            ignore_corners=self.ignore_corners,
-            gpu_enabled=self.gpu_accelerator.use_gpu if self.gpu_accelerator else False,
-        ) as action:
-            # Log GPU status
-            if self.gpu_accelerator and self.gpu_accelerator.use_gpu:
-                action.log(message_type="gpu_status", status="enabled", device="CUDA")
-            else:
-                action.log(message_type="gpu_status", status="disabled", device="CPU")
+    def _sample_preparer(self, reduced: bool) -> Callable[[int, np.ndarray], FrameSignature]:
+        """
+        Function preparing the signature of a sample from (frame_number, frame).
 
-            # Create temporary directory to store frames
-            self.frames_dir = "temp_frames"
-            os.makedirs(self.frames_dir, exist_ok=True)
+        While the analysis cache is being filled, it also records the comparison image.
 
-            # Open video file
-            cap = cv2.VideoCapture(self.video_path)
+        Args:
+            reduced: If True, samples are already reduced comparison images
+        """
+        prepare = self._signature_from_reduced if reduced else self._prepare_signature
+        recorder = self._sample_recorder
+
+        def prepare_sample(frame_number: int, frame: np.ndarray) -> FrameSignature:
+            with self.timers.measure("prepare"):
+                if recorder is None:
+                    return prepare(frame)
+                # The analysis cache stores the comparison image before it is masked
+                image = frame if reduced else self._reduce_frame(frame)
+                recorder.record(frame_number, image)
+                return self._signature_from_reduced(image)
+
+        return prepare_sample
+
+    def _iter_decisions(
+        self,
+        samples: Iterable[tuple[int, np.ndarray]],
+        comparer: Executor,
+        reference: np.ndarray | None = None,
+        reduced: bool = False,
+        reference_signature: FrameSignature | None = None,
+    ) -> Generator[tuple[int, np.ndarray, bool], None, None]:
+        """
+        Decide which sampled frames start a new slide, scoring ahead on worker threads.
+
+        Every sampled frame is prepared into a signature exactly once. It is then compared
+        against the signature of the last kept frame, which is only known once all earlier
+        frames have been decided. Up to ``2 * compare_workers`` frames are therefore scored
+        speculatively against the current reference; when a frame is kept, the scores still
+        in flight are discarded and resubmitted against the new reference, reusing the
+        already prepared signatures. Slides change rarely compared to the sampling rate, so
+        almost all speculation is used.
+
+        Args:
+            samples: (frame_number, frame) tuples in decode order
+            comparer: Executor running signature preparation and comparison
+            reference: Frame kept before the first sample (None to always keep the first sample)
+            reduced: If True, samples are already reduced comparison images (see ``_iter_samples``)
+            reference_signature: Signature of the frame kept before the first sample, when
+                it is already prepared (instead of ``reference``)
+
+        Returns:
+            Generator of (frame_number, frame, should_save) in decode order
+        """
+        window = max(1, self.compare_workers) * 2
+        samples_iter = iter(samples)
+        if reference is not None:
+            reference_signature = self._prepare_signature(reference)
+        prepare_sample = self._sample_preparer(reduced)
+        pending: deque[_PendingFrame] = deque()
+        exhausted = False
+
+        def score(signature: Future[FrameSignature]) -> Future[tuple[float, str]] | None:
+            if reference_signature is None:
+                return None
+            # Signatures are submitted before their scores, so a FIFO pool never blocks on them
+            return comparer.submit(self._score_signature, reference_signature, signature)
+
+        while True:
+            while not exhausted and len(pending) < window:
+                try:
+                    frame_number, frame = next(samples_iter)
+                except StopIteration:
+                    exhausted = True
+                    break
+                signature = comparer.submit(prepare_sample, frame_number, frame)
+                pending.append((frame_number, frame, signature, score(signature)))
+
+            if not pending:
+                return
 
-            if not cap.isOpened():
-                raise ValueError(f"Unable to open video file: {self.video_path}")
+            frame_number, frame, signature, similarity = pending.popleft()
+            if similarity is None:
+                should_save = True
+            else:
+                score_value, tier = similarity.result()
+                self.detector_tiers[tier] += 1
+                should_save = score_value < self.similarity_threshold
+
+            if should_save:
+                reference_signature = signature.result()
+                # Scores still in flight were computed against the previous reference
+                rescored: deque[_PendingFrame] = deque()
+                for pending_number, pending_frame, pending_signature, stale in pending:
+                    if stale is not None:
+                        stale.cancel()
+                    rescored.append(
+                        (pending_number, pending_frame, pending_signature, score(pending_signature))
+                    )
+                pending = rescored
+
+            yield frame_number, frame, should_save
+
+    def _extract_serial(
+        self,
+        cap: Capture,
+        frame_interval: int,
+        total_frames: int,
+        action: Action,
+        cached: CachedAnalysis | None = None,
+        resumed: CheckpointState | None = None,
+    ) -> tuple[int, int]:
+        """
+        Extract frames with a single capture through the threaded pipeline.
 
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            self.video_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            self.video_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            duration = total_frames / fps if fps > 0 else 0
+        Args:
+            cached: Analysis cache entry to take the comparison images from instead of
+                decoding samples; kept frames are then decoded at full resolution
+            resumed: Checkpoint to continue from (its frames are already in ``frames``)
 
+        Returns:
+            (extracted_count, skipped_count)
+        """
+        extracted_count = len(self.frames)
+        skipped_count = 0
+        # convert only resumes extractions that have samples left
+        start_frame = (resumed.next_frame or 0) if resumed is not None else 0
+        reference_image = resumed.reference if resumed is not None else None
+        # Last kept frame as passed through change detection, reduced for the checkpoint
+        reference_frame: np.ndarray | None = None
+        next_checkpoint = time.monotonic() + self.checkpoint_interval
+
+        samples: Iterable[tuple[int, np.ndarray]] = ()
+        adaptive_sampler = None
+        if cached is None and self.sampling_mode == ADAPTIVE_SAMPLING:
+            adaptive_sampler = self._adaptive_sampler(cap, frame_interval, total_frames)
             action.log(
-                message_type="video_info",
-                fps=fps,
+                message_type="sampling_mode",
+                mode=ADAPTIVE_SAMPLING,
+                frame_interval=frame_interval,
+                max_interval=adaptive_sampler.max_interval,
+            )
+            reduced = False
+        elif cached is None:
+            sampler = FrameSampler(
+                cap,
+                frame_interval,
+                # Probing the GOP size for "auto" needs seeking, which a growing file lacks
+                mode="read" if self.follow and self.sampling_mode == "auto" else self.sampling_mode,
                 total_frames=total_frames,
-                duration=duration,
-                width=self.video_width,
-                height=self.video_height,
+                start_frame=start_frame,
+                timers=self.timers,
+            )
+            action.log(
+                message_type="sampling_mode",
+                mode=sampler.mode,
+                frame_interval=frame_interval,
+                gop_size=sampler.gop_size,
             )
+            samples = self._iter_samples(sampler)
+            reduced = self.reduced_decode
+        else:
+            samples = cached
+            reduced = True
+        action.log(
+            message_type="pipeline_config",
+            decode_queue_size=self.decode_queue_size,
+            compare_workers=self.compare_workers,
+            writer_workers=self.writer_workers,
+            write_queue_size=self.write_queue_size,
+            reduced_decode=reduced,
+        )
+
+        with (
+            FrameFetcher(self.video_path) if reduced else nullcontext() as fetcher,
+            ThreadPoolExecutor(
+                max_workers=self.compare_workers, thread_name_prefix="compare"
+            ) as comparer,
+            self._decide(
+                samples,
+                comparer,
+                reduced=reduced,
+                reference_signature=self._signature_from_reduced(reference_image)
+                if reference_image is not None
+                else None,
+                adaptive_sampler=adaptive_sampler,
+            ) as decisions,
+            BoundedExecutor(self.writer_workers, self.write_queue_size, name="writer") as writer,
+        ):
+            for frame_count, frame, should_save in decisions:
+                if not should_save:
+                    skipped_count += 1
+                    action.log(
+                        message_type="frame_skipped",
+                        frame_number=frame_count,
+                        reason="similar_to_previous",
+                    )
+                else:
+                    writer.submit(self._store_frame, extracted_count, frame_count, frame, fetcher)
+                    self.frames.append(self._frame_key(extracted_count))
+                    self.frame_numbers.append(frame_count)
+                    extracted_count += 1
+                    reference_frame = frame
+
+                    if extracted_count % 10 == 0:
+                        action.log(
+                            message_type="extraction_progress",
+                            extracted_count=extracted_count,
+                            skipped_count=skipped_count,
+                        )
 
-            frame_interval = int(fps * self.fps_interval)
-            frame_count = 0
-            extracted_count = 0
-            skipped_count = 0
-            prev_frame = None
+                if self._checkpoint is not None and time.monotonic() >= next_checkpoint:
+                    if reference_frame is not None:
+                        reference_image = (
+                            reference_frame if reduced else self._reduce_frame(reference_frame)
+                        )
+                        reference_frame = None
+                    # Every frame listed in the checkpoint must be stored first
+                    writer.wait()
+                    self._save_checkpoint(frame_count + frame_interval, reference_image, action)
+                    next_checkpoint = time.monotonic() + self.checkpoint_interval
 
-            while True:
-                ret, frame = cap.read()
+            writer.wait()
 
-                if not ret:
-                    break
+        return extracted_count, skipped_count
 
-                # Extract frames at specified intervals
-                if frame_count % frame_interval == 0:
-                    # Check if frame is different from previous
-                    should_save = True
-                    if prev_frame is not None:
-                        should_save = self._is_slide_changed(prev_frame, frame)
-                        if not should_save:
-                            skipped_count += 1
-                            action.log(
-                                message_type="frame_skipped",
-                                frame_number=frame_count,
-                                reason="similar_to_previous",
-                            )
-
-                    if should_save:
-                        frame_path = os.path.join(
-                            self.frames_dir, f"frame_{extracted_count:04d}.jpg"
-                        )
-                        cv2.imwrite(frame_path, frame)
-                        self.frames.append(frame_path)
-                        prev_frame = frame.copy()
-                        extracted_count += 1
+    @contextmanager
+    def _decide(
+        self,
+        samples: Iterable[tuple[int, np.ndarray]],
+        comparer: Executor,
+        reduced: bool = False,
+        reference_signature: FrameSignature | None = None,
+        adaptive_sampler: AdaptiveSampler[FrameSignature] | None = None,
+    ) -> Iterator[Iterator[tuple[int, np.ndarray, bool]]]:
+        """
+        Decode samples on a background thread and decide which frames to keep.
+
+        Args:
+            samples: (frame_number, frame) tuples in decode order
+            comparer: Executor running signature preparation and comparison
+            reduced: If True, samples are already reduced comparison images
+            reference_signature: Signature of the frame kept before the first sample
+            adaptive_sampler: Sampler deciding while it samples, used instead of ``samples``
+
+        Yields:
+            Iterator of (frame_number, frame, should_save) in decode order
+        """
+        if adaptive_sampler is not None:
+            # Decisions are made while sampling, on the decoder thread
+            producer = BoundedProducer(adaptive_sampler, self.decode_queue_size, name="decoder")
+            with producer as decided:
+                yield iter(decided)
+            return
+        with BoundedProducer(samples, self.decode_queue_size, name="decoder") as decoded:
+            yield self._iter_decisions(
+                decoded, comparer, reduced=reduced, reference_signature=reference_signature
+            )
+
+    def _adaptive_sampler(
+        self, cap: Capture, frame_interval: int, total_frames: int
+    ) -> AdaptiveSampler[FrameSignature]:
+        """Adaptive sampler deciding changes with the configured detector and threshold."""
+        prepare_sample = self._sample_preparer(reduced=False)
+
+        def differs(reference: FrameSignature, signature: FrameSignature) -> bool:
+            score, tier = self._compare_signatures(reference, signature)
+            self.detector_tiers[tier] += 1
+            return score < self.similarity_threshold
+
+        return AdaptiveSampler(
+            cap,
+            prepare_sample,
+            differs,
+            min_interval=frame_interval,
+            max_interval=int(self.fps * self.max_interval),
+            total_frames=total_frames,
+            timers=self.timers,
+        )
+
+    def _extract_segments(
+        self,
+        cap: Capture,
+        frame_interval: int,
+        total_frames: int,
+        action: Action,
+        resumed: CheckpointState | None = None,
+    ) -> tuple[int, int]:
+        """
+        Extract frames by running segments of the timeline in a process pool.
+
+        Each worker opens its own capture and detects changes within its segment. Segments
+        are then stitched in order, re-checking each segment start against the last frame
+        kept before it, which yields exactly the frames the serial path keeps. When
+        checkpointing, a checkpoint is saved after each stitched segment.
+
+        Args:
+            resumed: Checkpoint to continue from (its frames are already in ``frames``)
+
+        Returns:
+            (extracted_count, skipped_count)
+        """
+        start_frame = (resumed.next_frame or 0) if resumed is not None else 0
+        segments = plan_segments(total_frames, frame_interval, self.workers, start_frame)
+        action.log(
+            message_type="segments_planned",
+            workers=self.workers,
+            segments=[(seg.start_frame, seg.end_frame) for seg in segments],
+        )
+
+        sample_count = 0
+        kept_count = 0
+        # Last kept frame, the reference the next segment is stitched against
+        reference_number = self.frame_numbers[-1] if self.frame_numbers else None
+        # Forking a process that already ran OpenCV's thread pool can deadlock the child
+        with ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            futures = [
+                pool.submit(extract_segment, self, segment, frame_interval) for segment in segments
+            ]
+            for future in futures:
+                result = future.result()
+                sample_count += result.sample_count
+                if self._sample_recorder is not None:
+                    self._sample_recorder.samples.update(result.samples)
+                self.timers.merge(result.timers)
+                self.detector_tiers.update(result.tier_counts)
+
+                if reference_number is not None:
+                    reference = read_frame_at(cap, reference_number)
+                    segment_kept, rechecked, redecoded = stitch_segment(
+                        self, cap, result, reference, frame_interval
+                    )
+                else:
+                    segment_kept = [(n, result.encoded[n]) for n in result.kept_frames]
+                    rechecked = redecoded = 0
+
+                for frame_number, data in segment_kept:
+                    index = len(self.frames)
+                    self._put_frame(index, data)
+                    self.frames.append(self._frame_key(index))
+                    self.frame_numbers.append(frame_number)
+                kept_count += len(segment_kept)
+                if segment_kept:
+                    reference_number = self.frame_numbers[-1]
+
+                action.log(
+                    message_type="segment_stitched",
+                    segment=result.segment.index,
+                    worker_kept=len(result.kept_frames),
+                    kept=len(segment_kept),
+                    rechecked_samples=rechecked,
+                    redecoded_samples=redecoded,
+                )
+                if self._checkpoint is not None and result.segment.end_frame is not None:
+                    self._save_checkpoint(
+                        result.segment.end_frame,
+                        self._reduce_frame(read_frame_at(cap, reference_number))
+                        if reference_number is not None
+                        else None,
+                        action,
+                    )
+
+        return len(self.frames), sample_count - kept_count
+
+    def _analysis_cache_key(self, frame_interval: int) -> str:
+        """Analysis cache key: the video plus every setting the comparison images depend on."""
+        return AnalysisCache.key(
+            self.video_path,
+            frame_interval=frame_interval,
+            crop_region=astuple(self.crop_region) if self.crop_region is not None else None,
+            comparison_height=COMPARISON_HEIGHT,
+            backend=self.accelerator.name,
+        )
+
+    def _open_video(self, action: Action) -> tuple[Capture, int, int]:
+        """
+        Open the video, read its properties and detect the speaker overlay if enabled.
+
+        Returns:
+            (capture, frame interval between samples, total frame count)
+        """
+        cap: Capture
+        if self.follow:
+            # Waits until the file exists and can be opened
+            cap = FollowingCapture(self.video_path, self.source_complete, self.follow_timeout)
+        else:
+            cap = cv2.VideoCapture(self.video_path)
+
+        if not cap.isOpened():
+            raise ValueError(f"Unable to open video file: {self.video_path}")
+
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        self.video_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.video_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        duration = total_frames / fps if fps > 0 else 0
+
+        action.log(
+            message_type="video_info",
+            fps=fps,
+            total_frames=total_frames,
+            duration=duration,
+            width=self.video_width,
+            height=self.video_height,
+        )
+
+        if self.detect_speaker:
+            speaker_box = detect_speaker_box(self.video_path)
+            action.log(
+                message_type="speaker_box_detected",
+                box=None if speaker_box is None else astuple(speaker_box),
+            )
+            if speaker_box is not None and speaker_box not in self.ignore_regions:
+                self.ignore_regions.append(speaker_box)
+
+        self.fps = fps
+        return cap, max(1, int(fps * self.fps_interval)), total_frames
+
+    @contextmanager
+    def _analysis(self, frame_interval: int, action: Action) -> Iterator[CachedAnalysis | None]:
+        """
+        Look up the analysis cache around a pass over the video's samples.
+
+        Yields the cache entry on a hit. On a miss, the comparison images prepared inside
+        the block are recorded and stored once it completes; nothing is stored if it fails.
+        Yields None on a miss and when the cache is disabled.
+        """
+        if not self.analysis_cache:
+            yield None
+            return
+
+        cache = AnalysisCache(self.cache_dir, self.cache_size_mb)
+        key = self._analysis_cache_key(frame_interval)
+        cached = cache.load(key)
+        action.log(
+            message_type="analysis_cache",
+            key=key,
+            hit=cached is not None,
+            samples=len(cached) if cached is not None else 0,
+        )
+        if cached is not None:
+            with cached:
+                yield cached
+            return
+
+        self._sample_recorder = recorder = SampleRecorder()
+        try:
+            yield None
+        finally:
+            self._sample_recorder = None
+
+        stored = cache.store(
+            key,
+            recorder.samples,
+            metadata={
+                "video_path": self.video_path,
+                "fps_interval": self.fps_interval,
+                "frame_interval": frame_interval,
+            },
+        )
+        action.log(
+            message_type="analysis_cached", key=key, samples=len(recorder.samples), stored=stored
+        )
+
+    def _checkpoint_key(self, frame_interval: int) -> str:
+        """Checkpoint key: the video plus every setting the kept frames and images depend on."""
+        material = json.dumps(
+            {
+                "video": video_fingerprint(self.video_path),
+                "frame_interval": frame_interval,
+                "similarity_threshold": self.similarity_threshold,
+                "detector": self.detector.name,
+                "tier_band": getattr(self.detector, "band", None),
+                "region": [
+                    self.ignore_corners,
+                    self.corner_size_percent,
+                    [astuple(rect) for rect in self.ignore_regions],
+                    astuple(self.crop_region) if self.crop_region is not None else None,
+                ],
+                "comparison_height": COMPARISON_HEIGHT,
+                "backend": self.accelerator.name,
+                "image_encoding": astuple(self.image_encoding),
+                "max_image_size": self._max_image_size(),
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(material.encode()).hexdigest()[:32]
+
+    def _start_checkpoint(self, frame_interval: int, action: Action) -> CheckpointState | None:
+        """
+        Set up checkpointing and restore the progress of an interrupted run if resuming.
+
+        Kept frames are stored in the checkpoint. Frames restored from it are reported to
+        ``_on_frame_stored`` like newly stored ones.
+
+        Returns:
+            The state to continue from, or None to extract from the start
+        """
+        directory = self.checkpoint_dir or default_checkpoint_dir(self.output_path)
+        checkpoint = Checkpoint(directory, self._checkpoint_key(frame_interval))
+        store = checkpoint.frame_store()
+        state = checkpoint.load() if self.resume else None
+        if state is not None:
+            keys = [self._frame_key(index) for index in range(len(state.frame_numbers))]
+            try:
+                store.restore(keys)
+            except FileNotFoundError:
+                state = None
+        action.log(
+            message_type="checkpoint",
+            directory=directory,
+            resumed=state is not None,
+            next_frame=state.next_frame if state is not None else 0,
+            kept=len(state.frame_numbers) if state is not None else 0,
+        )
+        if state is None:
+            # Nothing to resume: start over in an empty checkpoint
+            checkpoint.remove()
+            store = checkpoint.frame_store()
+
+        self._checkpoint = checkpoint
+        self.frame_store = store
+        if state is not None:
+            self.frames = keys
+            self.frame_numbers = list(state.frame_numbers)
+            if self._on_frame_stored is not None:
+                for index, key in enumerate(keys):
+                    self._on_frame_stored(index, key)
+        return state
+
+    def _save_checkpoint(
+        self, next_frame: int | None, reference: np.ndarray | None, action: Action
+    ) -> None:
+        """
+        Save the extraction progress (all kept frames must be stored); no-op without a checkpoint.
 
-                        if extracted_count % 10 == 0:
-                            action.log(
-                                message_type="extraction_progress",
-                                extracted_count=extracted_count,
-                                skipped_count=skipped_count,
-                            )
+        Args:
+            next_frame: Next frame to sample (None once extraction is complete)
+            reference: Comparison image of the last kept frame
+            action: Action to log to
+        """
+        checkpoint = self._checkpoint
+        if checkpoint is None:
+            return
+        checkpoint.save(CheckpointState(next_frame, list(self.frame_numbers), reference))
+        action.log(message_type="checkpoint_saved", next_frame=next_frame, kept=len(self.frames))
 
-                frame_count += 1
+    def extract_frames(self) -> None:
+        """Extract frames from video."""
+        with start_action(
+            action_type="extract_frames",
+            video_path=self.video_path,
+            fps_interval=self.fps_interval,
+            similarity_threshold=self.similarity_threshold,
+            ignore_corners=self.ignore_corners,
+            sampling_mode=self.sampling_mode,
+            workers=self.workers,
+            image_format=self.image_encoding.image_format,
+            jpeg_quality=self.image_encoding.jpeg_quality,
+            chroma_subsampling=self.image_encoding.chroma_subsampling,
+            max_dpi=self.max_dpi,
+            frame_store=getattr(self.frame_store_kind, "name", self.frame_store_kind),
+            detector=self.detector.name,
+            reduced_decode=self.reduced_decode,
+            gpu_enabled=self.accelerator.is_gpu,
+            backend=self.accelerator.name,
+        ) as action:
+            action.log(
+                message_type="gpu_status",
+                status="enabled" if self.accelerator.is_gpu else "disabled",
+                device=self.accelerator.label,
+            )
+
+            cap, frame_interval, total_frames = self._open_video(action)
+            start = time.perf_counter()
+            try:
+                resumed = (
+                    self._start_checkpoint(frame_interval, action) if self.checkpoint else None
+                )
+                if self.frame_store is None:
+                    self.frame_store = (
+                        create_frame_store(self.frame_store_kind, self.memory_budget_mb)
+                        if isinstance(self.frame_store_kind, str)
+                        else self.frame_store_kind
+                    )
+
+                # The analysis cache only records complete passes over the video
+                analysis = (
+                    self._analysis(frame_interval, action) if resumed is None else nullcontext()
+                )
+                with analysis as cached:
+                    if resumed is not None and resumed.next_frame is None:
+                        # Interrupted after extraction: every frame is in the checkpoint
+                        extracted_count, skipped_count = len(self.frames), 0
+                    elif cached is not None:
+                        extracted_count, skipped_count = self._extract_serial(
+                            cap, frame_interval, total_frames, action, cached=cached
+                        )
+                    elif self.workers > 1 and total_frames > 0:
+                        extracted_count, skipped_count = self._extract_segments(
+                            cap, frame_interval, total_frames, action, resumed=resumed
+                        )
+                    else:
+                        extracted_count, skipped_count = self._extract_serial(
+                            cap, frame_interval, total_frames, action, resumed=resumed
+                        )
+                if self._checkpoint is not None:
+                    self._save_checkpoint(None, None, action)
+            finally:
+                cap.release()
+            if isinstance(cap, FollowingCapture):
+                action.log(
+                    message_type="followed_video",
+                    wait_seconds=round(cap.wait_seconds, 3),
+                    opens=cap.opens,
+                )
+            self.extract_seconds = time.perf_counter() - start
+            self.skipped_count = skipped_count
 
-            cap.release()
             action.log(
                 message_type="extraction_complete",
                 total_extracted=extracted_count,
@@ -348,8 +1504,125 @@ class Video2Slides:
                 reduction_ratio=round(skipped_count / (extracted_count + skipped_count) * 100, 2)
                 if (extracted_count + skipped_count) > 0
                 else 0,
+                detector_tiers=dict(self.detector_tiers),
+                image_bytes=self.frame_store.nbytes,
+                extract_seconds=round(self.extract_seconds, 3),
+                stages=self.timers.to_dict(),
             )
 
+    def _new_presentation(self) -> _Deck:
+        """Create a presentation containing only the title slide."""
+        title = "Video2Slides"
+        subtitle = (
+            f"Conversion time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"Source file: {os.path.basename(self.video_path)}"
+        )
+
+        if self.pptx_writer == "direct":
+            self._ensure_output_dir()
+            writer = DirectPresentationWriter(self.output_path, SLIDE_WIDTH, SLIDE_HEIGHT)
+            writer.add_title_slide(title, subtitle)
+            return writer
+
+        prs = Presentation()
+        prs.slide_width = SLIDE_WIDTH
+        prs.slide_height = SLIDE_HEIGHT
+
+        # Add title slide
+        title_slide_layout = prs.slide_layouts[0]
+        slide = prs.slides.add_slide(title_slide_layout)
+        slide.shapes.title.text = title
+        slide.placeholders[1].text = subtitle
+        return prs
+
+    def _picture_box(self) -> tuple[Length, Length, Length, Length]:
+        """
+        Position and size of the frame picture on a slide.
+
+        Returns:
+            (left, top, width, height)
+        """
+        if self.keep_aspect_ratio and self.video_width > 0 and self.video_height > 0:
+            # Calculate dimensions maintaining aspect ratio
+            slide_width = SLIDE_WIDTH.inches
+            slide_height = SLIDE_HEIGHT.inches
+            video_aspect = self.video_width / self.video_height
+            slide_aspect = slide_width / slide_height
+
+            if video_aspect > slide_aspect:
+                # Video is wider than slide
+                width = Inches(slide_width)
+                height = Inches(slide_width / video_aspect)
+                left = Inches(0)
+                top = Inches((slide_height - height.inches) / 2)
+            else:
+                # Video is taller than slide
+                height = Inches(slide_height)
+                width = Inches(slide_height * video_aspect)
+                top = Inches(0)
+                left = Inches((slide_width - width.inches) / 2)
+        else:
+            # Fill entire slide (stretch to fit)
+            left = Inches(0)
+            top = Inches(0)
+            width = SLIDE_WIDTH
+            height = SLIDE_HEIGHT
+
+        return left, top, width, height
+
+    def _add_frame_slide(self, prs: _Deck, key: str) -> None:
+        """Add a slide showing a stored frame."""
+        with self.timers.measure("slide_add"):
+            self._add_picture_slide(prs, key)
+
+    def _add_picture_slide(self, prs: _Deck, key: str) -> None:
+        left, top, width, height = self._picture_box()
+
+        if isinstance(prs, DirectPresentationWriter):
+            extension = self.image_encoding.extension.lstrip(".")
+            prs.add_picture_slide(
+                self._store.read(key), left, top, width, height, extension=extension
+            )
+            return
+
+        blank_slide_layout = prs.slide_layouts[6]  # Blank layout
+        slide = prs.slides.add_slide(blank_slide_layout)
+        slide.shapes.add_picture(self._store.picture(key), left, top, width=width, height=height)
+
+    def _ensure_output_dir(self) -> None:
+        # Create output directory if it doesn't exist
+        output_dir = Path(self.output_path).parent
+        if not output_dir.exists():
+            print(f"📁 Output directory does not exist, creating: {output_dir.absolute()}")
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+    def _save_presentation(self, prs: _Deck, action: Action) -> None:
+        """Write the presentation to output_path, creating its directory if needed."""
+        with self.timers.measure("save"):
+            if isinstance(prs, DirectPresentationWriter):
+                prs.save()
+            else:
+                self._ensure_output_dir()
+                prs.save(self.output_path)
+        action.log(
+            message_type="ppt_saved",
+            output_path=self.output_path,
+            file_bytes=os.path.getsize(self.output_path),
+            image_bytes=self.frame_store.nbytes if self.frame_store is not None else 0,
+            save_seconds=round(self.timers.seconds("save"), 3),
+        )
+        action.log(message_type="run_report", **self.run_report())
+        if self._checkpoint is not None:
+            # The presentation is complete, nothing left to resume
+            self._checkpoint.remove()
+            self._checkpoint = None
+
+    @staticmethod
+    def _discard_presentation(prs: _Deck) -> None:
+        """Delete the partial file of a presentation that will not be saved."""
+        if isinstance(prs, DirectPresentationWriter):
+            prs.discard()
+
     def generate_ppt(self) -> None:
         """Generate PowerPoint presentation."""
         with start_action(
@@ -357,90 +1630,108 @@ class Video2Slides:
             output_path=self.output_path,
             frame_count=len(self.frames),
             keep_aspect_ratio=self.keep_aspect_ratio,
+            pptx_writer=self.pptx_writer,
         ) as action:
             if not self.frames:
                 raise ValueError("No frame data available")
 
-            # Create presentation
-            prs = Presentation()
-            prs.slide_width = Inches(10)
-            prs.slide_height = Inches(7.5)
-
-            # Add title slide
-            title_slide_layout = prs.slide_layouts[0]
-            slide = prs.slides.add_slide(title_slide_layout)
-            title = slide.shapes.title
-            subtitle = slide.placeholders[1]
-
-            title.text = "Video2Slides"
-            subtitle.text = (
-                f"Conversion time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-                f"Source file: {os.path.basename(self.video_path)}"
-            )
-
-            # Add frame slides
-            blank_slide_layout = prs.slide_layouts[6]  # Blank layout
-
-            for idx, frame_path in enumerate(self.frames, 1):
-                action.log(message_type="slide_progress", current=idx, total=len(self.frames))
-
-                slide = prs.slides.add_slide(blank_slide_layout)
-
-                if self.keep_aspect_ratio and self.video_width > 0 and self.video_height > 0:
-                    # Calculate dimensions maintaining aspect ratio
-                    slide_width = prs.slide_width.inches
-                    slide_height = prs.slide_height.inches
-                    video_aspect = self.video_width / self.video_height
-                    slide_aspect = slide_width / slide_height
-
-                    if video_aspect > slide_aspect:
-                        # Video is wider than slide
-                        width = Inches(slide_width)
-                        height = Inches(slide_width / video_aspect)
-                        left = Inches(0)
-                        top = Inches((slide_height - height.inches) / 2)
-                    else:
-                        # Video is taller than slide
-                        height = Inches(slide_height)
-                        width = Inches(slide_height * video_aspect)
-                        top = Inches(0)
-                        left = Inches((slide_width - width.inches) / 2)
-                else:
-                    # Fill entire slide (stretch to fit)
-                    left = Inches(0)
-                    top = Inches(0)
-                    width = Inches(10)  # Slide width
-                    height = Inches(7.5)  # Slide height
-
-                slide.shapes.add_picture(frame_path, left, top, width=width, height=height)
-
-            # Create output directory if it doesn't exist
-            output_dir = Path(self.output_path).parent
-            if not output_dir.exists():
-                print(f"📁 Output directory does not exist, creating: {output_dir.absolute()}")
-                output_dir.mkdir(parents=True, exist_ok=True)
+            prs = self._new_presentation()
+            try:
+                for idx, key in enumerate(self.frames, 1):
+                    action.log(message_type="slide_progress", current=idx, total=len(self.frames))
+                    self._add_frame_slide(prs, key)
 
-            # Save presentation
-            prs.save(self.output_path)
-            action.log(message_type="ppt_saved", output_path=self.output_path)
+                self._save_presentation(prs, action)
+            except BaseException:
+                self._discard_presentation(prs)
+                raise
 
     def cleanup(self) -> None:
         """Clean up temporary files."""
-        with start_action(action_type="cleanup", frames_dir=self.frames_dir):
-            if self.frames_dir and os.path.exists(self.frames_dir):
-                shutil.rmtree(self.frames_dir)
+        with start_action(
+            action_type="cleanup",
+            frame_store=self.frame_store.name if self.frame_store else None,
+        ):
+            if self.frame_store is not None:
+                self.frame_store.close()
+                self.frame_store = None
 
     def convert(self) -> None:
-        """Execute full conversion process."""
+        """
+        Execute full conversion process.
+
+        Slides are added to the presentation on a background thread as soon as their frames
+        are stored, so building the presentation overlaps decoding and comparison and only
+        saving the package remains once extraction finishes.
+        """
         with start_action(
             action_type="convert_video",
             video_path=self.video_path,
             output_path=self.output_path,
             fps_interval=self.fps_interval,
             keep_aspect_ratio=self.keep_aspect_ratio,
-        ):
+        ) as action:
             try:
-                self.extract_frames()
-                self.generate_ppt()
+                prs = self._new_presentation()
+
+                def add_slide(key: str) -> None:
+                    self._add_frame_slide(prs, key)
+                    action.log(message_type="slide_added", key=key)
+
+                try:
+                    with OrderedConsumer(add_slide, name="slides") as slides:
+                        self._on_frame_stored = slides.submit
+                        try:
+                            self.extract_frames()
+                        finally:
+                            self._on_frame_stored = None
+                        slides.finish(len(self.frames))
+
+                    if not self.frames:
+                        raise ValueError("No frame data available")
+                    self._save_presentation(prs, action)
+                except BaseException:
+                    self._discard_presentation(prs)
+                    raise
             finally:
                 self.cleanup()
+
+    def run_report(self) -> dict[str, object]:
+        """
+        Machine-readable summary of the last run: counts, throughput, stages and memory.
+
+        Stage figures are busy time summed over threads and segment workers (see
+        ``video2slides.metrics``), so they can add up to more than ``extract_seconds``.
+
+        Returns:
+            JSON-serializable dict
+        """
+        frames_read = self.timers.count("decode") + self.timers.count("skip")
+        samples = len(self.frames) + self.skipped_count
+        output_exists = os.path.exists(self.output_path)
+        return {
+            "video_path": self.video_path,
+            "output_path": self.output_path,
+            "backend": self.accelerator.name,
+            "detector": self.detector.name,
+            "slides": len(self.frames),
+            # Where each slide starts in the video
+            "slide_seconds": [round(number / self.fps, 3) for number in self.frame_numbers]
+            if self.fps > 0
+            else [],
+            "samples": samples,
+            "skipped": self.skipped_count,
+            "detector_tiers": dict(self.detector_tiers),
+            "frames_read": frames_read,
+            "extract_seconds": round(self.extract_seconds, 3),
+            "frames_per_second": round(frames_read / self.extract_seconds, 1)
+            if self.extract_seconds > 0
+            else None,
+            "samples_per_second": round(samples / self.extract_seconds, 1)
+            if self.extract_seconds > 0
+            else None,
+            "stages": self.timers.to_dict(),
+            "image_bytes": self.frame_store.nbytes if self.frame_store is not None else 0,
+            "file_bytes": os.path.getsize(self.output_path) if output_exists else None,
+            "peak_rss_mb": peak_rss_mb(),
+        }
@@ -0,0 +1,34 @@
+"""
+Default settings shared by the library and the CLI.
+
+Kept free of heavy imports (OpenCV, NumPy, python-pptx) so the CLI can declare its options,
+print ``--help`` and reject bad arguments without loading them.
+"""
+
+import os
+
+# Maximum size of the analysis cache directory
+DEFAULT_CACHE_SIZE_MB = 2048
+# Videos converted at the same time by the batch command
+DEFAULT_BATCH_WORKERS = max(1, min(4, (os.cpu_count() or 1) // 2))
+# Relative slowdown of a benchmark stage reported as a regression
+DEFAULT_TOLERANCE = 0.2
+# Seconds of extraction between two checkpoints
+DEFAULT_CHECKPOINT_INTERVAL = 60.0
+DEFAULT_COMPARE_WORKERS = min(8, os.cpu_count() or 1)
+# OpenCV's default JPEG quality
+DEFAULT_JPEG_QUALITY = 95
+# Encoded frames kept in memory by the spill store before it writes to disk
+DEFAULT_MEMORY_BUDGET_MB = 512
+# Similarity thresholds swept by the analyze command, start:stop:step, inclusive
+DEFAULT_THRESHOLDS = "0.50:0.99:0.01"
+# Address the serve command listens on
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Seconds without growth after which a followed video file is considered complete
+DEFAULT_FOLLOW_TIMEOUT = 10.0
+# Tallest YouTube stream downloaded for conversion; slides are compared at 480 lines and 720
+# keeps slide text legible on a 10x7.5 inch slide
+DEFAULT_MAX_HEIGHT = 720
+# Longest step in seconds between samples through static stretches with adaptive sampling
+DEFAULT_MAX_INTERVAL = 30.0
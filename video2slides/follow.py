@@ -0,0 +1,171 @@
+"""Read a video file while it is still being written, e.g. downloaded."""
+
+import os
+import time
+from collections.abc import Callable
+
+import cv2
+import numpy as np
+
+from video2slides.defaults import DEFAULT_FOLLOW_TIMEOUT
+
+# Seconds between two checks of the file size while waiting for more data
+DEFAULT_POLL_INTERVAL = 0.5
+
+
+class FollowingCapture:
+    """
+    Sequential video capture over a file that is still growing.
+
+    Reads like a ``cv2.VideoCapture`` from front to back. When decoding reaches the end of
+    the data written so far, it waits for the file to grow, reopens it and seeks back to
+    where it stopped. The frame decoded last before the end of the data may be cut off, so
+    a frame is only returned once the frame after it has been decoded, or once the file is
+    complete and has been read to its end.
+
+    The file is complete when ``is_complete`` returns True or, without it, when it has not
+    grown for ``timeout`` seconds. Containers that keep their index at the end (MP4 without
+    "faststart", as written by OpenCV) can only be opened once complete; AVI, MKV, MPEG-TS
+    and faststart MP4 are read as they grow.
+    """
+
+    def __init__(
+        self,
+        video_path: str,
+        is_complete: Callable[[], bool] | None = None,
+        timeout: float = DEFAULT_FOLLOW_TIMEOUT,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        """
+        Wait for the file to become readable and open it.
+
+        Args:
+            video_path: Path to the video file, which does not need to exist yet
+            is_complete: Returns True once the writer has finished the file (None to
+                detect completion by the timeout)
+            timeout: Seconds without growth after which the file is considered complete
+                when there is no ``is_complete``
+            poll_interval: Seconds between two checks of the file size
+        """
+        self.video_path = video_path
+        self.is_complete = is_complete
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        # Time spent waiting for the file to grow and number of times it was opened
+        self.wait_seconds = 0.0
+        self.opens = 0
+        self._cap: cv2.VideoCapture | None = None
+        # File size when the capture was opened, and last size seen while polling
+        self._opened_size = 0
+        self._seen_size = -1
+        self._last_growth = time.monotonic()
+        # Index of the next frame the capture decodes
+        self._position = 0
+        # Decoded frame not returned yet, because it may be cut off
+        self._held: np.ndarray | None = None
+        self._frame: np.ndarray | None = None
+        self._open()
+
+    def isOpened(self) -> bool:  # noqa: N802 - mirrors cv2.VideoCapture
+        return self._cap is not None
+
+    def get(self, prop_id: int) -> float:
+        """Return a property of the underlying capture; the frame count is 0 (unknown)."""
+        if self._cap is None or prop_id == cv2.CAP_PROP_FRAME_COUNT:
+            return 0.0
+        return float(self._cap.get(prop_id))
+
+    def read(self) -> tuple[bool, np.ndarray | None]:
+        if not self.grab():
+            return False, None
+        return self.retrieve()
+
+    def grab(self) -> bool:
+        """Advance to the next frame, waiting for the file to grow; False at its end."""
+        self._frame = None
+        while self._cap is not None:
+            ret, frame = self._cap.read()
+            if ret:
+                self._position += 1
+                held, self._held = self._held, frame
+                if held is not None:
+                    self._frame = held
+                    return True
+                continue
+
+            if not self._wait_for_growth():
+                # Complete, and read up to its end: the held frame is whole
+                self._frame, self._held = self._held, None
+                return self._frame is not None
+
+            # Decode the held frame again from the grown file
+            if self._held is not None:
+                self._held = None
+                self._position -= 1
+            self._open()
+        return False
+
+    def set(self, prop_id: int, value: float) -> bool:
+        """Seeking a growing file is not supported; returns False like an unsupported property."""
+        return False
+
+    def retrieve(self) -> tuple[bool, np.ndarray | None]:
+        return self._frame is not None, self._frame
+
+    def release(self) -> None:
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+    def _complete(self) -> bool:
+        if self.is_complete is not None:
+            return self.is_complete()
+        return time.monotonic() - self._last_growth >= self.timeout
+
+    def _file_size(self) -> int:
+        try:
+            size = os.path.getsize(self.video_path)
+        except OSError:
+            size = 0
+        if size != self._seen_size:
+            self._seen_size = size
+            self._last_growth = time.monotonic()
+        return size
+
+    def _wait_for_growth(self) -> bool:
+        """
+        Wait until the file is larger than when the capture was opened.
+
+        Returns:
+            True once it grew, False if it is complete without having grown
+        """
+        start = time.monotonic()
+        try:
+            while True:
+                # Checked first, so data written before completion is seen below
+                complete = self._complete()
+                if self._file_size() > self._opened_size:
+                    return True
+                if complete:
+                    return False
+                time.sleep(self.poll_interval)
+        finally:
+            self.wait_seconds += time.monotonic() - start
+
+    def _open(self) -> None:
+        """(Re)open the file at the current position, waiting until it can be opened."""
+        self.release()
+        while self._wait_for_growth():
+            self._opened_size = self._file_size()
+            cap = cv2.VideoCapture(self.video_path)
+            if cap.isOpened():
+                if self._position > 0:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, self._position)
+                self._cap = cap
+                self.opens += 1
+                return
+            cap.release()
+
+
+# Capture the converter reads from: OpenCV's, or one following a growing file
+Capture = cv2.VideoCapture | FollowingCapture
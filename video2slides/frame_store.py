@@ -0,0 +1,281 @@
+"""Storage for the encoded slide images between extraction and presentation generation."""
+
+import os
+import shutil
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from io import BytesIO
+from typing import IO
+
+import cv2
+import numpy as np
+
+from video2slides.defaults import DEFAULT_JPEG_QUALITY, DEFAULT_MEMORY_BUDGET_MB
+
+FRAME_STORES = ("memory", "disk", "spill")
+
+
+# Formats PowerPoint embeds natively (python-pptx rejects WebP)
+IMAGE_FORMATS = ("jpeg", "png")
+# JPEG chroma subsampling: 4:4:4 keeps thin colored text sharp, 4:2:0 is smallest
+CHROMA_SUBSAMPLINGS = ("444", "422", "420")
+
+_SAMPLING_FACTORS = {
+    "444": cv2.IMWRITE_JPEG_SAMPLING_FACTOR_444,
+    "422": cv2.IMWRITE_JPEG_SAMPLING_FACTOR_422,
+    "420": cv2.IMWRITE_JPEG_SAMPLING_FACTOR_420,
+}
+
+
+@dataclass(frozen=True)
+class ImageEncoding:
+    """How kept frames are encoded for the presentation."""
+
+    image_format: str = "jpeg"
+    jpeg_quality: int = DEFAULT_JPEG_QUALITY
+    chroma_subsampling: str = "420"
+
+    def __post_init__(self) -> None:
+        if self.image_format not in IMAGE_FORMATS:
+            raise ValueError(
+                f"Unknown image format: {self.image_format}. Expected one of {IMAGE_FORMATS}"
+            )
+        if self.chroma_subsampling not in CHROMA_SUBSAMPLINGS:
+            raise ValueError(
+                f"Unknown chroma subsampling: {self.chroma_subsampling}. "
+                f"Expected one of {CHROMA_SUBSAMPLINGS}"
+            )
+        if not 1 <= self.jpeg_quality <= 100:
+            raise ValueError(f"JPEG quality must be between 1 and 100, got: {self.jpeg_quality}")
+
+    @property
+    def extension(self) -> str:
+        """File extension of encoded images."""
+        return ".jpg" if self.image_format == "jpeg" else ".png"
+
+    def params(self) -> list[int]:
+        """Encoder parameters for ``cv2.imencode``."""
+        if self.image_format != "jpeg":
+            return []
+        return [
+            cv2.IMWRITE_JPEG_QUALITY,
+            self.jpeg_quality,
+            cv2.IMWRITE_JPEG_SAMPLING_FACTOR,
+            _SAMPLING_FACTORS[self.chroma_subsampling],
+        ]
+
+
+def encode_frame(frame: np.ndarray, encoding: ImageEncoding | None = None) -> bytes:
+    """
+    Encode a BGR frame as an image file.
+
+    Args:
+        frame: Frame in BGR format
+        encoding: Image format and settings (default: JPEG with OpenCV's defaults)
+
+    Returns:
+        Encoded image bytes
+    """
+    encoding = encoding or ImageEncoding()
+    ok, buffer = cv2.imencode(encoding.extension, frame, encoding.params())
+    if not ok:
+        raise ValueError(f"Unable to encode frame as {encoding.image_format}")
+    return buffer.tobytes()
+
+
+class FrameStore(ABC):
+    """Keyed storage of encoded frames, owned by one conversion job."""
+
+    name = ""
+
+    @abstractmethod
+    def put(self, key: str, data: bytes) -> None:
+        """Store encoded image bytes under a key (thread-safe)."""
+
+    @abstractmethod
+    def read(self, key: str) -> bytes:
+        """Return the encoded image bytes stored under a key."""
+
+    def picture(self, key: str) -> str | IO[bytes]:
+        """Image source for python-pptx's ``add_picture``: a file path or a binary stream."""
+        return BytesIO(self.read(key))
+
+    @property
+    @abstractmethod
+    def nbytes(self) -> int:
+        """Total size of the stored images."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release everything the store holds (files are deleted)."""
+
+
+class MemoryFrameStore(FrameStore):
+    """Encoded frames kept in memory; nothing touches the disk."""
+
+    name = "memory"
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._data: dict[str, bytes] = {}
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store encoded image bytes under a key (thread-safe)."""
+        self._data[key] = data
+
+    def read(self, key: str) -> bytes:
+        """Return the encoded image bytes stored under a key."""
+        return self._data[key]
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the stored images."""
+        return sum(len(data) for data in list(self._data.values()))
+
+    def close(self) -> None:
+        """Drop all stored images."""
+        self._data.clear()
+
+
+class DiskFrameStore(FrameStore):
+    """Encoded frames written as files to a private directory."""
+
+    name = "disk"
+
+    def __init__(self, directory: str | None = None) -> None:
+        """
+        Initialize store.
+
+        Args:
+            directory: Directory to write frames to, removed on close (default: a new
+                temporary directory, so concurrent jobs never share one)
+        """
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="video2slides_frames_")
+        else:
+            os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self._sizes: dict[str, int] = {}
+
+    def path(self, key: str) -> str:
+        """File path of a stored frame."""
+        return os.path.join(self.directory, key)
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store encoded image bytes under a key (thread-safe)."""
+        with open(self.path(key), "wb") as f:
+            f.write(data)
+        self._sizes[key] = len(data)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._sizes
+
+    def read(self, key: str) -> bytes:
+        """Return the encoded image bytes stored under a key."""
+        with open(self.path(key), "rb") as f:
+            return f.read()
+
+    def picture(self, key: str) -> str | IO[bytes]:
+        """Image source for python-pptx's ``add_picture``: the frame's file path."""
+        return self.path(key)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the stored images."""
+        return sum(list(self._sizes.values()))
+
+    def close(self) -> None:
+        """Delete the directory and all frames in it."""
+        self._sizes.clear()
+        if os.path.exists(self.directory):
+            shutil.rmtree(self.directory)
+
+
+class SpillFrameStore(FrameStore):
+    """
+    Encoded frames kept in memory up to a budget; later frames are written to disk.
+
+    Typical talks produce a few dozen slides and never leave memory, while very long videos
+    with many slides are bounded in memory. The temporary directory is only created once
+    the budget is exceeded.
+    """
+
+    name = "spill"
+
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET_MB * 1024 * 1024) -> None:
+        """
+        Initialize store.
+
+        Args:
+            memory_budget: Maximum total size (bytes) of the frames kept in memory
+        """
+        self.memory_budget = memory_budget
+        self._memory = MemoryFrameStore()
+        self._disk: DiskFrameStore | None = None
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+    def _store_for(self, key: str) -> FrameStore:
+        if self._disk is not None and key in self._disk:
+            return self._disk
+        return self._memory
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store encoded image bytes under a key (thread-safe)."""
+        with self._lock:
+            if self._memory_bytes + len(data) <= self.memory_budget:
+                self._memory_bytes += len(data)
+                store: FrameStore = self._memory
+            else:
+                if self._disk is None:
+                    self._disk = DiskFrameStore()
+                store = self._disk
+        store.put(key, data)
+
+    def read(self, key: str) -> bytes:
+        """Return the encoded image bytes stored under a key."""
+        return self._store_for(key).read(key)
+
+    def picture(self, key: str) -> str | IO[bytes]:
+        """Image source for python-pptx's ``add_picture``."""
+        return self._store_for(key).picture(key)
+
+    @property
+    def spilled(self) -> bool:
+        """True if frames had to be written to disk."""
+        return self._disk is not None
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the stored images."""
+        return self._memory.nbytes + (self._disk.nbytes if self._disk is not None else 0)
+
+    def close(self) -> None:
+        """Drop frames held in memory and delete spilled files."""
+        self._memory.close()
+        self._memory_bytes = 0
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+
+def create_frame_store(kind: str, memory_budget_mb: int = DEFAULT_MEMORY_BUDGET_MB) -> FrameStore:
+    """
+    Create a frame store by name.
+
+    Args:
+        kind: One of FRAME_STORES
+        memory_budget_mb: Memory budget of the spill store in megabytes
+
+    Returns:
+        New, empty frame store
+    """
+    if kind == "memory":
+        return MemoryFrameStore()
+    if kind == "disk":
+        return DiskFrameStore()
+    if kind == "spill":
+        return SpillFrameStore(memory_budget_mb * 1024 * 1024)
+    raise ValueError(f"Unknown frame store: {kind}. Expected one of {FRAME_STORES}")
@@ -1,17 +1,38 @@
 """CLI interface for Video2Slides using Typer."""
 
+import contextlib
+import json
 import os
+import threading
 from pathlib import Path
+from typing import Any
 
 import typer
-from eliot import start_action
 
-from video2slides.converter import Video2Slides
+# Only lightweight modules are imported here; OpenCV, python-pptx and eliot are loaded inside
+# the commands, so --help and argument errors return without paying for them
+from video2slides.defaults import (
+    DEFAULT_BATCH_WORKERS,
+    DEFAULT_CACHE_SIZE_MB,
+    DEFAULT_CHECKPOINT_INTERVAL,
+    DEFAULT_COMPARE_WORKERS,
+    DEFAULT_FOLLOW_TIMEOUT,
+    DEFAULT_HOST,
+    DEFAULT_JPEG_QUALITY,
+    DEFAULT_MAX_HEIGHT,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MEMORY_BUDGET_MB,
+    DEFAULT_PORT,
+    DEFAULT_THRESHOLDS,
+    DEFAULT_TOLERANCE,
+)
 
 app = typer.Typer(
     name="video2slides",
     help="Convert video files to PowerPoint presentations",
     add_completion=False,
+    # Plain click help and errors: formatting them with rich costs more than the rest of startup
+    rich_markup_mode=None,
 )
 
 
@@ -69,11 +90,182 @@ def convert(
         min=0.0,
         max=0.5,
     ),
+    ignore_region: list[str] | None = typer.Option(
+        None,
+        "--ignore-region",
+        help="Extra area to ignore when comparing frames as x,y,width,height fractions (e.g. 0.75,0.3,0.25,0.4); repeatable",
+    ),
+    crop: str | None = typer.Option(
+        None,
+        "--crop",
+        help="Only compare this slide area, as x,y,width,height fractions of the frame",
+    ),
+    detect_speaker: bool = typer.Option(
+        False,
+        "--detect-speaker/--no-detect-speaker",
+        help="Detect a moving speaker overlay from sample frames and ignore it",
+    ),
+    detector: str = typer.Option(
+        "ssim",
+        "--detector",
+        help="Change detector: ssim (accurate), hash (dHash), hist (histogram) or tiered (hash and thumbnail pre-filters before SSIM)",
+    ),
+    tier_band: float = typer.Option(
+        0.05,
+        "--tier-band",
+        help="Width of the band around the similarity threshold in which the tiered detector runs full SSIM",
+        min=0.0,
+        max=1.0,
+    ),
     use_gpu: bool = typer.Option(
         True,
         "--gpu/--no-gpu",
         help="Use GPU acceleration if available (default: True, will fallback to CPU if not available)",
     ),
+    backend: str = typer.Option(
+        "auto",
+        "--backend",
+        help="Comparison backend: auto (fastest available, by a short benchmark; cpu with --no-gpu), cpu, cuda or umat (OpenCV transparent API, OpenCL when available)",
+    ),
+    sampling: str = typer.Option(
+        "auto",
+        "--sampling",
+        help="Frame sampling mode: auto, read (decode every frame), grab (skip without color conversion), seek (jump between samples) or adaptive (longer steps through static stretches, changes located to the exact frame; only pays off when slides stay up long, frequent changes cost more comparisons than fixed sampling)",
+    ),
+    max_interval: float = typer.Option(
+        DEFAULT_MAX_INTERVAL,
+        "--max-interval",
+        help="Longest step in seconds between samples through static stretches with --sampling adaptive",
+        min=0.1,
+    ),
+    reduced_decode: bool = typer.Option(
+        False,
+        "--reduced-decode/--full-decode",
+        help="Keep only reduced grayscale copies of sampled frames for comparison and decode kept slides again at full resolution (saves memory on 4K videos)",
+    ),
+    frame_store: str = typer.Option(
+        "spill",
+        "--frame-store",
+        help="Where slide images are kept until the PPTX is written: memory, disk (private temporary directory) or spill (memory up to --memory-budget, then disk)",
+    ),
+    memory_budget: int = typer.Option(
+        DEFAULT_MEMORY_BUDGET_MB,
+        "--memory-budget",
+        help="Megabytes of slide images the spill frame store keeps in memory",
+        min=0,
+    ),
+    pptx_writer: str = typer.Option(
+        "python-pptx",
+        "--pptx-writer",
+        help="How the PPTX is written: python-pptx, or direct (streams slides into the file; faster and lighter for decks with thousands of slides)",
+    ),
+    image_format: str = typer.Option(
+        "jpeg",
+        "--image-format",
+        help="Format of the slide images: jpeg or png (lossless, larger)",
+    ),
+    jpeg_quality: int = typer.Option(
+        DEFAULT_JPEG_QUALITY,
+        "--jpeg-quality",
+        help="JPEG quality of the slide images",
+        min=1,
+        max=100,
+    ),
+    chroma_subsampling: str = typer.Option(
+        "420",
+        "--chroma-subsampling",
+        help="JPEG chroma subsampling: 444 (sharpest colored text), 422 or 420 (smallest)",
+    ),
+    max_dpi: int | None = typer.Option(
+        None,
+        "--max-dpi",
+        help="Downscale slide images to this many dots per inch of the 10x7.5 inch slide (e.g. 150 shrinks 4K frames to 1500 pixels wide; default: source resolution)",
+        min=1,
+    ),
+    analysis_cache: bool = typer.Option(
+        False,
+        "--analysis-cache/--no-analysis-cache",
+        help="Cache the comparison images of all sampled frames so re-runs with another --similarity, --detector, masks or layout skip decoding",
+    ),
+    cache_dir: Path | None = typer.Option(
+        None,
+        "--cache-dir",
+        help="Analysis cache directory (default: ~/.cache/video2slides/analysis)",
+    ),
+    cache_size: int = typer.Option(
+        DEFAULT_CACHE_SIZE_MB,
+        "--cache-size",
+        help="Analysis cache size limit in megabytes; least recently used entries are evicted",
+        min=1,
+    ),
+    checkpoint: bool = typer.Option(
+        False,
+        "--checkpoint/--no-checkpoint",
+        help="Save extraction progress and kept frames periodically next to the output, so an interrupted conversion can be resumed",
+    ),
+    checkpoint_interval: float = typer.Option(
+        DEFAULT_CHECKPOINT_INTERVAL,
+        "--checkpoint-interval",
+        help="Seconds of extraction between two checkpoints (with --workers, a checkpoint is saved after each segment)",
+        min=1.0,
+    ),
+    checkpoint_dir: Path | None = typer.Option(
+        None,
+        "--checkpoint-dir",
+        help="Checkpoint directory (default: .<output name>.checkpoint next to the output)",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Continue an interrupted conversion from its checkpoint, if any (implies --checkpoint)",
+    ),
+    follow: bool = typer.Option(
+        False,
+        "--follow",
+        help="The video is still being written (e.g. downloaded): convert what is there and follow the file until it stops growing",
+    ),
+    follow_timeout: float = typer.Option(
+        DEFAULT_FOLLOW_TIMEOUT,
+        "--follow-timeout",
+        help="Seconds without growth after which a followed video is considered complete",
+        min=0.1,
+    ),
+    decode_queue_size: int = typer.Option(
+        16,
+        "--decode-queue-size",
+        help="Maximum number of decoded frames buffered ahead of comparison",
+        min=1,
+    ),
+    compare_workers: int = typer.Option(
+        DEFAULT_COMPARE_WORKERS,
+        "--compare-workers",
+        help="Number of threads computing frame similarity",
+        min=1,
+    ),
+    writer_workers: int = typer.Option(
+        2,
+        "--writer-workers",
+        help="Number of threads writing extracted frames",
+        min=1,
+    ),
+    write_queue_size: int = typer.Option(
+        8,
+        "--write-queue-size",
+        help="Maximum number of extracted frames waiting to be written",
+        min=1,
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        help="Number of processes extracting segments of the video in parallel (1 = single capture)",
+        min=1,
+    ),
+    report: Path | None = typer.Option(
+        None,
+        "--report",
+        help="Write a JSON run report with per-stage timings, frames/sec and peak memory",
+    ),
     log_file: Path | None = typer.Option(
         None,
         "--log-file",
@@ -112,6 +304,15 @@ def convert(
 
         # With detailed logging to file
         video2slides input_video.mp4 -l conversion.log
+
+        # Write per-stage timings, frames/sec and peak memory as JSON
+        video2slides input_video.mp4 --report report.json
+
+        # Convert a video while it is still being downloaded or recorded
+        video2slides input_video.mkv --follow
+
+        # Sample static stretches sparsely and place each slide on its exact first frame
+        video2slides input_video.mp4 --sampling adaptive
     """
     # Setup eliot logging only if requested
     if log_file:
@@ -125,6 +326,9 @@ def convert(
 
         add_destinations(FileDestination(file=sys.stdout))
 
+    from video2slides.converter import Video2Slides
+    from video2slides.regions import parse_rect
+
     try:
         video_path_abs = str(video.resolve())
         
@@ -170,6 +374,36 @@ def convert(
             ignore_corners=ignore_corners,
             corner_size_percent=corner_size,
             use_gpu=use_gpu,
+            backend=backend,
+            sampling_mode=sampling,
+            max_interval=max_interval,
+            decode_queue_size=decode_queue_size,
+            compare_workers=compare_workers,
+            writer_workers=writer_workers,
+            write_queue_size=write_queue_size,
+            workers=workers,
+            ignore_regions=[parse_rect(region) for region in ignore_region or []],
+            crop_region=parse_rect(crop) if crop else None,
+            detect_speaker=detect_speaker,
+            detector=detector,
+            tier_band=tier_band,
+            reduced_decode=reduced_decode,
+            frame_store=frame_store,
+            memory_budget_mb=memory_budget,
+            pptx_writer=pptx_writer,
+            image_format=image_format,
+            jpeg_quality=jpeg_quality,
+            chroma_subsampling=chroma_subsampling,
+            max_dpi=max_dpi,
+            analysis_cache=analysis_cache,
+            cache_dir=str(cache_dir) if cache_dir else None,
+            cache_size_mb=cache_size,
+            checkpoint=checkpoint,
+            checkpoint_interval=checkpoint_interval,
+            checkpoint_dir=str(checkpoint_dir) if checkpoint_dir else None,
+            resume=resume,
+            follow=follow,
+            follow_timeout=follow_timeout,
         )
         pptx_path_abs = Path(converter.output_path).absolute()
 
@@ -180,8 +414,8 @@ def convert(
             typer.echo(f"🎯 Similarity threshold: {similarity}")
             
             # Display GPU status
-            if converter.gpu_accelerator and converter.gpu_accelerator.use_gpu:
-                typer.echo("⚡ GPU acceleration: Enabled (CUDA)")
+            if converter.accelerator.is_gpu:
+                typer.echo(f"⚡ GPU acceleration: Enabled ({converter.accelerator.label})")
             else:
                 typer.echo("💻 GPU acceleration: Disabled (CPU only)")
             
@@ -189,22 +423,24 @@ def convert(
                 typer.echo("📐 Maintaining aspect ratio: Yes")
             if ignore_corners:
                 typer.echo(f"🔲 Ignoring corners: Yes ({corner_size * 100:.0f}% of frame)")
+            if crop:
+                typer.echo(f"✂️  Comparing slide area: {crop}")
+            for region in ignore_region or []:
+                typer.echo(f"🔲 Ignoring region: {region}")
 
         if not verbose:
-            typer.echo("📹 Extracting frames...")
+            typer.echo("📹 Extracting frames and building slides...")
 
-        converter.extract_frames()
+        # Slides are added while frames are still being extracted; temporary frames are removed
+        converter.convert()
 
         if not verbose:
             typer.echo(f"✅ Extracted {len(converter.frames)} unique frames")
-            typer.echo("📊 Generating PowerPoint presentation...")
 
-        converter.generate_ppt()
-
-        if not verbose:
-            typer.echo("🧹 Cleaning up temporary files...")
-
-        converter.cleanup()
+        if report:
+            with open(report, "w") as f:
+                json.dump(converter.run_report(), f, indent=2)
+            typer.echo(f"📝 Report: {report.absolute()}")
 
         typer.echo(f"✅ Conversion completed successfully: {Path(converter.output_path).absolute()}")
 
@@ -263,11 +499,176 @@ def youtube(
         min=0.0,
         max=0.5,
     ),
+    ignore_region: list[str] | None = typer.Option(
+        None,
+        "--ignore-region",
+        help="Extra area to ignore when comparing frames as x,y,width,height fractions (e.g. 0.75,0.3,0.25,0.4); repeatable",
+    ),
+    crop: str | None = typer.Option(
+        None,
+        "--crop",
+        help="Only compare this slide area, as x,y,width,height fractions of the frame",
+    ),
+    detect_speaker: bool = typer.Option(
+        False,
+        "--detect-speaker/--no-detect-speaker",
+        help="Detect a moving speaker overlay from sample frames and ignore it",
+    ),
+    detector: str = typer.Option(
+        "ssim",
+        "--detector",
+        help="Change detector: ssim (accurate), hash (dHash), hist (histogram) or tiered (hash and thumbnail pre-filters before SSIM)",
+    ),
+    tier_band: float = typer.Option(
+        0.05,
+        "--tier-band",
+        help="Width of the band around the similarity threshold in which the tiered detector runs full SSIM",
+        min=0.0,
+        max=1.0,
+    ),
     use_gpu: bool = typer.Option(
         True,
         "--gpu/--no-gpu",
         help="Use GPU acceleration if available (default: True, will fallback to CPU if not available)",
     ),
+    backend: str = typer.Option(
+        "auto",
+        "--backend",
+        help="Comparison backend: auto (fastest available, by a short benchmark; cpu with --no-gpu), cpu, cuda or umat (OpenCV transparent API, OpenCL when available)",
+    ),
+    sampling: str = typer.Option(
+        "auto",
+        "--sampling",
+        help="Frame sampling mode: auto, read (decode every frame), grab (skip without color conversion), seek (jump between samples) or adaptive (longer steps through static stretches, changes located to the exact frame; only pays off when slides stay up long, frequent changes cost more comparisons than fixed sampling)",
+    ),
+    max_interval: float = typer.Option(
+        DEFAULT_MAX_INTERVAL,
+        "--max-interval",
+        help="Longest step in seconds between samples through static stretches with --sampling adaptive",
+        min=0.1,
+    ),
+    reduced_decode: bool = typer.Option(
+        False,
+        "--reduced-decode/--full-decode",
+        help="Keep only reduced grayscale copies of sampled frames for comparison and decode kept slides again at full resolution (saves memory on 4K videos)",
+    ),
+    frame_store: str = typer.Option(
+        "spill",
+        "--frame-store",
+        help="Where slide images are kept until the PPTX is written: memory, disk (private temporary directory) or spill (memory up to --memory-budget, then disk)",
+    ),
+    memory_budget: int = typer.Option(
+        DEFAULT_MEMORY_BUDGET_MB,
+        "--memory-budget",
+        help="Megabytes of slide images the spill frame store keeps in memory",
+        min=0,
+    ),
+    pptx_writer: str = typer.Option(
+        "python-pptx",
+        "--pptx-writer",
+        help="How the PPTX is written: python-pptx, or direct (streams slides into the file; faster and lighter for decks with thousands of slides)",
+    ),
+    image_format: str = typer.Option(
+        "jpeg",
+        "--image-format",
+        help="Format of the slide images: jpeg or png (lossless, larger)",
+    ),
+    jpeg_quality: int = typer.Option(
+        DEFAULT_JPEG_QUALITY,
+        "--jpeg-quality",
+        help="JPEG quality of the slide images",
+        min=1,
+        max=100,
+    ),
+    chroma_subsampling: str = typer.Option(
+        "420",
+        "--chroma-subsampling",
+        help="JPEG chroma subsampling: 444 (sharpest colored text), 422 or 420 (smallest)",
+    ),
+    max_dpi: int | None = typer.Option(
+        None,
+        "--max-dpi",
+        help="Downscale slide images to this many dots per inch of the 10x7.5 inch slide (e.g. 150 shrinks 4K frames to 1500 pixels wide; default: source resolution)",
+        min=1,
+    ),
+    analysis_cache: bool = typer.Option(
+        False,
+        "--analysis-cache/--no-analysis-cache",
+        help="Cache the comparison images of all sampled frames so re-runs with another --similarity, --detector, masks or layout skip decoding",
+    ),
+    cache_dir: Path | None = typer.Option(
+        None,
+        "--cache-dir",
+        help="Analysis cache directory (default: ~/.cache/video2slides/analysis)",
+    ),
+    cache_size: int = typer.Option(
+        DEFAULT_CACHE_SIZE_MB,
+        "--cache-size",
+        help="Analysis cache size limit in megabytes; least recently used entries are evicted",
+        min=1,
+    ),
+    checkpoint: bool = typer.Option(
+        False,
+        "--checkpoint/--no-checkpoint",
+        help="Save extraction progress and kept frames periodically next to the output, so an interrupted conversion can be resumed",
+    ),
+    checkpoint_interval: float = typer.Option(
+        DEFAULT_CHECKPOINT_INTERVAL,
+        "--checkpoint-interval",
+        help="Seconds of extraction between two checkpoints (with --workers, a checkpoint is saved after each segment)",
+        min=1.0,
+    ),
+    checkpoint_dir: Path | None = typer.Option(
+        None,
+        "--checkpoint-dir",
+        help="Checkpoint directory (default: .<output name>.checkpoint next to the output)",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Continue an interrupted conversion from its checkpoint, if any (implies --checkpoint)",
+    ),
+    follow: bool = typer.Option(
+        False,
+        "--follow",
+        help="Convert while the video downloads instead of after the download",
+    ),
+    decode_queue_size: int = typer.Option(
+        16,
+        "--decode-queue-size",
+        help="Maximum number of decoded frames buffered ahead of comparison",
+        min=1,
+    ),
+    compare_workers: int = typer.Option(
+        DEFAULT_COMPARE_WORKERS,
+        "--compare-workers",
+        help="Number of threads computing frame similarity",
+        min=1,
+    ),
+    writer_workers: int = typer.Option(
+        2,
+        "--writer-workers",
+        help="Number of threads writing extracted frames",
+        min=1,
+    ),
+    write_queue_size: int = typer.Option(
+        8,
+        "--write-queue-size",
+        help="Maximum number of extracted frames waiting to be written",
+        min=1,
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        help="Number of processes extracting segments of the video in parallel (1 = single capture)",
+        min=1,
+    ),
+    report: Path | None = typer.Option(
+        None,
+        "--report",
+        help="Write a JSON run report with per-stage timings, frames/sec and peak memory",
+    ),
     log_file: Path | None = typer.Option(
         None,
         "--log-file",
@@ -290,6 +691,17 @@ def youtube(
         "--force",
         help="Force re-download even if video already exists",
     ),
+    max_height: int = typer.Option(
+        DEFAULT_MAX_HEIGHT,
+        "--max-height",
+        help="Download the best stream up to this many lines, or the smallest one if there is none (0 = no limit)",
+        min=0,
+    ),
+    video_only: bool = typer.Option(
+        True,
+        "--video-only/--with-audio",
+        help="Prefer streams without audio (smaller, and no ffmpeg needed to merge them)",
+    ),
 ) -> None:
     """
     Download a YouTube video and convert it to a PowerPoint presentation in one go.
@@ -310,9 +722,15 @@ def youtube(
 
         # Delete the downloaded video file after conversion (by default videos are kept)
         video2slides youtube https://www.youtube.com/watch?v=iHDauMATkr0 --delete-video
-        
+
         # Force re-download even if video already exists
         video2slides youtube https://www.youtube.com/watch?v=iHDauMATkr0 --force
+
+        # Download at most 1080p, with audio (e.g. to keep the video for watching)
+        video2slides youtube https://www.youtube.com/watch?v=iHDauMATkr0 --max-height 1080 --with-audio
+
+        # Convert while the video downloads
+        video2slides youtube https://www.youtube.com/watch?v=iHDauMATkr0 --follow
     """
     try:
         import yt_dlp  # type: ignore[import-untyped]
@@ -336,6 +754,10 @@ def youtube(
 
         add_destinations(FileDestination(file=sys.stdout))
 
+    from video2slides.converter import Video2Slides
+    from video2slides.regions import parse_rect
+    from video2slides.youtube import format_options
+
     try:
         if not verbose:
             typer.echo(f"📥 Downloading YouTube video: {url}")
@@ -343,13 +765,23 @@ def youtube(
         # Determine base directory for both video and PPTX
         base_dir = Path(output_dir).resolve() if output_dir else Path.cwd()
 
-        # Download the video
-        video_path = _download_youtube_video(
-            url,
-            base_dir,
-            verbose=verbose,
-            force=force,
-        )
+        stream_format = format_options(max_height, video_only)
+
+        # Download the video, or start downloading it to convert it while it downloads
+        download = None
+        if follow:
+            download = _start_youtube_download(
+                url, base_dir, verbose=verbose, force=force, stream_format=stream_format
+            )
+            video_path = download.path
+        else:
+            video_path = _download_youtube_video(
+                url,
+                base_dir,
+                verbose=verbose,
+                force=force,
+                stream_format=stream_format,
+            )
 
         video_path_abs = Path(video_path).absolute()
 
@@ -392,19 +824,50 @@ def youtube(
             ignore_corners=ignore_corners,
             corner_size_percent=corner_size,
             use_gpu=use_gpu,
+            backend=backend,
+            sampling_mode=sampling,
+            max_interval=max_interval,
+            decode_queue_size=decode_queue_size,
+            compare_workers=compare_workers,
+            writer_workers=writer_workers,
+            write_queue_size=write_queue_size,
+            workers=workers,
+            ignore_regions=[parse_rect(region) for region in ignore_region or []],
+            crop_region=parse_rect(crop) if crop else None,
+            detect_speaker=detect_speaker,
+            detector=detector,
+            tier_band=tier_band,
+            reduced_decode=reduced_decode,
+            frame_store=frame_store,
+            memory_budget_mb=memory_budget,
+            pptx_writer=pptx_writer,
+            image_format=image_format,
+            jpeg_quality=jpeg_quality,
+            chroma_subsampling=chroma_subsampling,
+            max_dpi=max_dpi,
+            analysis_cache=analysis_cache,
+            cache_dir=str(cache_dir) if cache_dir else None,
+            cache_size_mb=cache_size,
+            checkpoint=checkpoint,
+            checkpoint_interval=checkpoint_interval,
+            checkpoint_dir=str(checkpoint_dir) if checkpoint_dir else None,
+            resume=resume,
+            follow=download is not None,
+            source_complete=download.is_finished if download is not None else None,
         )
         pptx_path_abs = Path(converter.output_path).absolute()
 
         if not verbose:
-            typer.echo(f"✅ Downloaded: {video_path_abs}")
+            if download is None:
+                typer.echo(f"✅ Downloaded: {video_path_abs}")
             typer.echo(f"🎬 Video: {video_path_abs}")
             typer.echo(f"📊 Output: {pptx_path_abs}")
             typer.echo(f"⏱️  Frame interval: {interval} second(s)")
             typer.echo(f"🎯 Similarity threshold: {similarity}")
             
             # Display GPU status
-            if converter.gpu_accelerator and converter.gpu_accelerator.use_gpu:
-                typer.echo("⚡ GPU acceleration: Enabled (CUDA)")
+            if converter.accelerator.is_gpu:
+                typer.echo(f"⚡ GPU acceleration: Enabled ({converter.accelerator.label})")
             else:
                 typer.echo("💻 GPU acceleration: Disabled (CPU only)")
             
@@ -412,22 +875,25 @@ def youtube(
                 typer.echo("📐 Maintaining aspect ratio: Yes")
             if ignore_corners:
                 typer.echo(f"🔲 Ignoring corners: Yes ({corner_size * 100:.0f}% of frame)")
+            if crop:
+                typer.echo(f"✂️  Comparing slide area: {crop}")
+            for region in ignore_region or []:
+                typer.echo(f"🔲 Ignoring region: {region}")
 
         if not verbose:
-            typer.echo("📹 Extracting frames...")
+            typer.echo("📹 Extracting frames and building slides...")
 
-        converter.extract_frames()
+        # Slides are added while frames are still being extracted; temporary frames are removed
+        converter.convert()
+        if download is not None:
+            # Raises if the download failed, after converting what was downloaded; otherwise
+            # moves the video to its final name
+            download.wait()
+            video_path = download.filename
+            converter.video_path = os.path.abspath(video_path)
 
         if not verbose:
             typer.echo(f"✅ Extracted {len(converter.frames)} unique frames")
-            typer.echo("📊 Generating PowerPoint presentation...")
-
-        converter.generate_ppt()
-
-        if not verbose:
-            typer.echo("🧹 Cleaning up temporary files...")
-
-        converter.cleanup()
 
         # Optionally remove downloaded video (only if user explicitly requested deletion)
         if not keep_video and video_path and os.path.exists(video_path):
@@ -435,6 +901,11 @@ def youtube(
             if not verbose:
                 typer.echo(f"🗑️  Removed downloaded video: {os.path.basename(video_path)}")
 
+        if report:
+            with open(report, "w") as f:
+                json.dump(converter.run_report(), f, indent=2)
+            typer.echo(f"📝 Report: {report.absolute()}")
+
         typer.echo(f"✅ Conversion completed successfully: {Path(converter.output_path).absolute()}")
 
     except Exception as e:
@@ -442,7 +913,721 @@ def youtube(
         raise typer.Exit(code=1) from e
 
 
-def _download_youtube_video(url: str, output_dir: Path, verbose: bool = False, force: bool = False) -> str:
+@app.command()
+def batch(
+    source: str = typer.Argument(
+        ...,
+        help="Directory of videos, glob pattern (quoted, e.g. 'lectures/**/*.mp4') or .csv/.jsonl manifest",
+    ),
+    output_dir: Path = typer.Option(
+        Path("."),
+        "--output-dir",
+        help="Directory for PPTX files not named in the manifest (default: current directory)",
+    ),
+    pattern: str = typer.Option(
+        "*",
+        "--pattern",
+        help="File pattern of videos when SOURCE is a directory",
+    ),
+    jobs: int = typer.Option(
+        DEFAULT_BATCH_WORKERS,
+        "--jobs",
+        "-j",
+        help="Maximum number of videos converted at the same time",
+        min=1,
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Convert videos even if their PPTX is newer than the video",
+    ),
+    report: Path | None = typer.Option(
+        None,
+        "--report",
+        help="Write a JSON report with per-video status and timings",
+    ),
+    interval: int = typer.Option(
+        1,
+        "--interval",
+        "-i",
+        help="Frame extraction interval in seconds",
+        min=1,
+    ),
+    keep_aspect: bool = typer.Option(
+        False,
+        "--keep-aspect",
+        "-k",
+        help="Maintain video aspect ratio in slides (otherwise stretch to fill)",
+    ),
+    similarity: float = typer.Option(
+        0.95,
+        "--similarity",
+        "-s",
+        help="Similarity threshold (0-1) for detecting slide changes (higher = more strict, fewer frames)",
+        min=0.0,
+        max=1.0,
+    ),
+    ignore_corners: bool = typer.Option(
+        True,
+        "--ignore-corners/--no-ignore-corners",
+        help="Ignore corner regions when comparing frames (useful for speaker video)",
+    ),
+    corner_size: float = typer.Option(
+        0.15,
+        "--corner-size",
+        help="Size of corners to ignore as percentage (0-1) when ignore-corners is enabled",
+        min=0.0,
+        max=0.5,
+    ),
+    detector: str = typer.Option(
+        "ssim",
+        "--detector",
+        help="Change detector: ssim (accurate), hash (dHash), hist (histogram) or tiered (hash and thumbnail pre-filters before SSIM)",
+    ),
+    use_gpu: bool = typer.Option(
+        False,
+        "--gpu/--no-gpu",
+        help="Use GPU acceleration if available (default: False, concurrent jobs would share one GPU)",
+    ),
+    backend: str = typer.Option(
+        "auto",
+        "--backend",
+        help="Comparison backend: auto (fastest available, by a short benchmark; cpu with --no-gpu), cpu, cuda or umat (OpenCV transparent API, OpenCL when available)",
+    ),
+    analysis_cache: bool = typer.Option(
+        False,
+        "--analysis-cache/--no-analysis-cache",
+        help="Cache the comparison images of all sampled frames so re-runs with another --similarity, --detector, masks or layout skip decoding",
+    ),
+    cache_dir: Path | None = typer.Option(
+        None,
+        "--cache-dir",
+        help="Analysis cache directory (default: ~/.cache/video2slides/analysis)",
+    ),
+    cache_size: int = typer.Option(
+        DEFAULT_CACHE_SIZE_MB,
+        "--cache-size",
+        help="Analysis cache size limit in megabytes; least recently used entries are evicted",
+        min=1,
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Checkpoint every conversion next to its output and continue interrupted ones",
+    ),
+    checkpoint_interval: float = typer.Option(
+        DEFAULT_CHECKPOINT_INTERVAL,
+        "--checkpoint-interval",
+        help="Seconds of extraction between two checkpoints",
+        min=1.0,
+    ),
+    log_file: Path | None = typer.Option(
+        None,
+        "--log-file",
+        "-l",
+        help="Path to eliot JSON log file (optional)",
+    ),
+) -> None:
+    """
+    Convert many videos with a shared pool of worker processes.
+
+    Options given here apply to every video; manifest columns named after
+    Video2Slides arguments (e.g. similarity_threshold, ignore_regions) override
+    them per video. Videos whose PPTX is newer than the video are skipped.
+
+    Examples:
+
+        # Convert every video in a directory, 4 at a time
+        video2slides batch lectures/ --output-dir slides/ -j 4
+
+        # Convert videos listed in a manifest and write a report
+        video2slides batch manifest.csv --report report.json
+    """
+    if log_file:
+        from eliot import to_file
+
+        to_file(open(str(log_file), "w"))
+
+    from video2slides.batch import JobResult, convert_many, load_jobs, summarize, write_report
+
+    try:
+        batch_jobs = load_jobs(
+            source,
+            output_dir=str(output_dir),
+            pattern=pattern,
+            options={
+                "fps_interval": interval,
+                "keep_aspect_ratio": keep_aspect,
+                "similarity_threshold": similarity,
+                "ignore_corners": ignore_corners,
+                "corner_size_percent": corner_size,
+                "detector": detector,
+                "use_gpu": use_gpu,
+                "backend": backend,
+                "analysis_cache": analysis_cache,
+                "cache_dir": str(cache_dir) if cache_dir else None,
+                "cache_size_mb": cache_size,
+                "resume": resume,
+                "checkpoint_interval": checkpoint_interval,
+            },
+        )
+    except (OSError, ValueError) as e:
+        typer.echo(f"❌ Error: {e}", err=True)
+        raise typer.Exit(code=1) from e
+
+    if not batch_jobs:
+        typer.echo(f"❌ Error: No videos found in {source}", err=True)
+        raise typer.Exit(code=1)
+
+    typer.echo(f"🎬 Videos: {len(batch_jobs)} ({jobs} at a time)")
+
+    def echo_result(result: JobResult) -> None:
+        name = os.path.basename(result.video_path)
+        if result.status == "converted":
+            typer.echo(f"✅ {name}: {result.slide_count} slides in {result.seconds:.1f}s")
+        elif result.status == "skipped":
+            typer.echo(f"⏭️  {name}: up to date")
+        else:
+            typer.echo(f"❌ {name}: {result.error}", err=True)
+
+    results = convert_many(batch_jobs, max_workers=jobs, force=force, on_result=echo_result)
+    summary = summarize(results)
+
+    if report:
+        write_report(results, str(report))
+        typer.echo(f"📝 Report: {report.absolute()}")
+
+    typer.echo(
+        f"📊 Converted: {summary['converted']:.0f}, skipped: {summary['skipped']:.0f}, "
+        f"failed: {summary['failed']:.0f} ({summary['total_seconds']:.1f}s of conversion time)"
+    )
+    if summary["failed"]:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def analyze(
+    video: Path = typer.Argument(
+        ...,
+        help="Path to input video file",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        readable=True,
+    ),
+    thresholds: str = typer.Option(
+        DEFAULT_THRESHOLDS,
+        "--thresholds",
+        help="Similarity thresholds to evaluate, as start:stop:step (inclusive) or a comma-separated list",
+    ),
+    target_slides: int | None = typer.Option(
+        None,
+        "--target-slides",
+        help="Recommend the threshold giving closest to this many slides (default: knee of the slide count curve)",
+        min=1,
+    ),
+    json_path: Path | None = typer.Option(
+        None,
+        "--json",
+        help="Write slide counts and kept timestamps per threshold and the similarity time series as JSON",
+    ),
+    interval: int = typer.Option(
+        1,
+        "--interval",
+        "-i",
+        help="Frame extraction interval in seconds",
+        min=1,
+    ),
+    ignore_corners: bool = typer.Option(
+        True,
+        "--ignore-corners/--no-ignore-corners",
+        help="Ignore corner regions when comparing frames (useful for speaker video)",
+    ),
+    corner_size: float = typer.Option(
+        0.15,
+        "--corner-size",
+        help="Size of corners to ignore as percentage (0-1) when ignore-corners is enabled",
+        min=0.0,
+        max=0.5,
+    ),
+    ignore_region: list[str] | None = typer.Option(
+        None,
+        "--ignore-region",
+        help="Extra area to ignore when comparing frames as x,y,width,height fractions (e.g. 0.75,0.3,0.25,0.4); repeatable",
+    ),
+    crop: str | None = typer.Option(
+        None,
+        "--crop",
+        help="Only compare this slide area, as x,y,width,height fractions of the frame",
+    ),
+    detect_speaker: bool = typer.Option(
+        False,
+        "--detect-speaker/--no-detect-speaker",
+        help="Detect a moving speaker overlay from sample frames and ignore it",
+    ),
+    detector: str = typer.Option(
+        "ssim",
+        "--detector",
+        help="Change detector: ssim (accurate), hash (dHash), hist (histogram) or tiered (hash and thumbnail pre-filters before SSIM)",
+    ),
+    tier_band: float = typer.Option(
+        0.05,
+        "--tier-band",
+        help="Width of the band around the similarity threshold in which the tiered detector runs full SSIM",
+        min=0.0,
+        max=1.0,
+    ),
+    use_gpu: bool = typer.Option(
+        True,
+        "--gpu/--no-gpu",
+        help="Use GPU acceleration if available (default: True, will fallback to CPU if not available)",
+    ),
+    backend: str = typer.Option(
+        "auto",
+        "--backend",
+        help="Comparison backend: auto (fastest available, by a short benchmark; cpu with --no-gpu), cpu, cuda or umat (OpenCV transparent API, OpenCL when available)",
+    ),
+    sampling: str = typer.Option(
+        "auto",
+        "--sampling",
+        help="Frame sampling mode: auto, read (decode every frame), grab (skip without color conversion) or seek (jump between samples)",
+    ),
+    reduced_decode: bool = typer.Option(
+        False,
+        "--reduced-decode/--full-decode",
+        help="Keep only reduced grayscale copies of sampled frames for comparison (saves memory on 4K videos)",
+    ),
+    compare_workers: int = typer.Option(
+        DEFAULT_COMPARE_WORKERS,
+        "--compare-workers",
+        help="Number of threads computing frame similarity",
+        min=1,
+    ),
+    analysis_cache: bool = typer.Option(
+        False,
+        "--analysis-cache/--no-analysis-cache",
+        help="Cache the comparison images of all sampled frames so the following convert skips decoding them",
+    ),
+    cache_dir: Path | None = typer.Option(
+        None,
+        "--cache-dir",
+        help="Analysis cache directory (default: ~/.cache/video2slides/analysis)",
+    ),
+    cache_size: int = typer.Option(
+        DEFAULT_CACHE_SIZE_MB,
+        "--cache-size",
+        help="Analysis cache size limit in megabytes; least recently used entries are evicted",
+        min=1,
+    ),
+    log_file: Path | None = typer.Option(
+        None,
+        "--log-file",
+        "-l",
+        help="Path to eliot JSON log file (optional)",
+    ),
+) -> None:
+    """
+    Sweep similarity thresholds in one pass and recommend one.
+
+    The video is decoded once and every threshold is evaluated exactly as a
+    conversion with that --similarity would be. Other options must match the
+    convert options you intend to use; adaptive sampling cannot be swept.
+
+    Examples:
+
+        # Slide counts for thresholds 0.50-0.99 and a recommended threshold
+        video2slides analyze input_video.mp4
+
+        # Pick the threshold giving about 40 slides, save the details
+        video2slides analyze input_video.mp4 --target-slides 40 --json sweep.json
+    """
+    if log_file:
+        from eliot import to_file
+
+        to_file(open(str(log_file), "w"))
+
+    from video2slides.converter import Video2Slides
+    from video2slides.regions import parse_rect
+    from video2slides.sweep import ThresholdResult, parse_thresholds, sweep_thresholds
+
+    try:
+        grid = parse_thresholds(thresholds)
+        converter = Video2Slides(
+            str(video.resolve()),
+            fps_interval=interval,
+            ignore_corners=ignore_corners,
+            corner_size_percent=corner_size,
+            use_gpu=use_gpu,
+            backend=backend,
+            sampling_mode=sampling,
+            compare_workers=compare_workers,
+            ignore_regions=[parse_rect(region) for region in ignore_region or []],
+            crop_region=parse_rect(crop) if crop else None,
+            detect_speaker=detect_speaker,
+            detector=detector,
+            tier_band=tier_band,
+            reduced_decode=reduced_decode,
+            analysis_cache=analysis_cache,
+            cache_dir=str(cache_dir) if cache_dir else None,
+            cache_size_mb=cache_size,
+        )
+        typer.echo(f"🎬 Video: {converter.video_path}")
+        typer.echo(f"🔍 Evaluating {len(grid)} thresholds ({detector})...")
+        sweep = sweep_thresholds(converter, grid)
+    except Exception as e:
+        typer.echo(f"❌ Error: {e}", err=True)
+        raise typer.Exit(code=1) from e
+
+    typer.echo(f"📊 {len(sweep.sample_frame_numbers)} samples, {sweep.comparisons} comparisons")
+    typer.echo(f"{'similarity':>14}  slides")
+    # Thresholds giving the same slides count are shown as one range
+    runs: list[list[ThresholdResult]] = []
+    for result in sweep.results:
+        if runs and runs[-1][0].slide_count == result.slide_count:
+            runs[-1].append(result)
+        else:
+            runs.append([result])
+    for run in runs:
+        low, high = run[0].threshold, run[-1].threshold
+        span = f"{low:.3g}" if low == high else f"{low:.3g}-{high:.3g}"
+        typer.echo(f"{span:>14}  {run[0].slide_count}")
+
+    pick = sweep.closest_to_slide_count(target_slides) if target_slides else sweep.knee()
+    reason = f"closest to {target_slides} slides" if target_slides else "knee of the curve"
+    typer.echo(
+        f"🎯 Recommended: --similarity {pick.threshold:.3g} ({reason}, {pick.slide_count} slides)"
+    )
+    typer.echo(
+        "🕒 Slides at: "
+        + ", ".join(f"{int(t // 60):02d}:{int(t % 60):02d}" for t in pick.timestamps)
+    )
+    typer.echo(f"   video2slides convert {video} -i {interval} -s {pick.threshold:.3g}")
+
+    if json_path:
+        data = sweep.to_dict()
+        data["recommended"] = pick.threshold
+        with open(json_path, "w") as f:
+            json.dump(data, f, indent=2)
+        typer.echo(f"📝 Sweep: {json_path.absolute()}")
+
+
+@app.command()
+def bench(
+    duration: float = typer.Option(
+        60.0,
+        "--duration",
+        help="Synthetic video length in seconds",
+        min=1.0,
+    ),
+    width: int = typer.Option(
+        1280,
+        "--width",
+        help="Synthetic video width",
+        min=64,
+    ),
+    height: int = typer.Option(
+        720,
+        "--height",
+        help="Synthetic video height",
+        min=64,
+    ),
+    fps: float = typer.Option(
+        30.0,
+        "--fps",
+        help="Synthetic video frame rate",
+        min=1.0,
+    ),
+    slide_seconds: float = typer.Option(
+        10.0,
+        "--slide-seconds",
+        help="Seconds each synthetic slide is shown",
+        min=1.0,
+    ),
+    animations: bool = typer.Option(
+        True,
+        "--animations/--no-animations",
+        help="Reveal bullet points one by one on each slide",
+    ),
+    speaker: bool = typer.Option(
+        True,
+        "--speaker/--no-speaker",
+        help="Add a moving speaker overlay in the bottom-right corner",
+    ),
+    noise: float = typer.Option(
+        2.0,
+        "--noise",
+        help="Standard deviation of the Gaussian noise added to every frame",
+        min=0.0,
+    ),
+    seed: int = typer.Option(
+        0,
+        "--seed",
+        help="Seed of the synthetic video",
+    ),
+    video: Path | None = typer.Option(
+        None,
+        "--video",
+        help="Benchmark this video instead of a synthetic one",
+        exists=True,
+        dir_okay=False,
+        readable=True,
+    ),
+    interval: int = typer.Option(
+        1,
+        "--interval",
+        "-i",
+        help="Frame extraction interval in seconds",
+        min=1,
+    ),
+    similarity: float = typer.Option(
+        0.95,
+        "--similarity",
+        "-s",
+        help="Similarity threshold (0-1) for detecting slide changes",
+        min=0.0,
+        max=1.0,
+    ),
+    detector: str = typer.Option(
+        "ssim",
+        "--detector",
+        help="Change detector: ssim (accurate), hash (dHash), hist (histogram) or tiered (hash and thumbnail pre-filters before SSIM)",
+    ),
+    use_gpu: bool = typer.Option(
+        False,
+        "--gpu/--no-gpu",
+        help="Use GPU acceleration if available (default: False, so results compare across machines)",
+    ),
+    backend: str = typer.Option(
+        "auto",
+        "--backend",
+        help="Comparison backend: auto (fastest available, by a short benchmark; cpu with --no-gpu), cpu, cuda or umat (OpenCV transparent API, OpenCL when available)",
+    ),
+    sampling: str = typer.Option(
+        "auto",
+        "--sampling",
+        help="Frame sampling mode: auto, read (decode every frame), grab (skip without color conversion) or seek (jump between samples)",
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        help="Number of processes extracting segments of the video in parallel",
+        min=1,
+    ),
+    compare_workers: int = typer.Option(
+        DEFAULT_COMPARE_WORKERS,
+        "--compare-workers",
+        help="Number of threads computing frame similarity",
+        min=1,
+    ),
+    repeat: int = typer.Option(
+        1,
+        "--repeat",
+        "-r",
+        help="Number of runs; each stage reports its fastest run",
+        min=1,
+    ),
+    output: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Write the results as JSON (e.g. to record a new baseline)",
+    ),
+    baseline: Path | None = typer.Option(
+        None,
+        "--baseline",
+        help="Compare against results stored with --output and exit with status 1 on regressions",
+        exists=True,
+        dir_okay=False,
+        readable=True,
+    ),
+    tolerance: float = typer.Option(
+        DEFAULT_TOLERANCE,
+        "--tolerance",
+        help="Allowed relative slowdown, memory growth or throughput drop against the baseline",
+        min=0.0,
+    ),
+) -> None:
+    """
+    Measure conversion throughput on a synthetic lecture video.
+
+    Generates a deterministic lecture (slides, bullet animations, a moving speaker
+    overlay and noise), converts it and reports per-stage timings, throughput and
+    peak memory.
+
+    Examples:
+
+        # Default 60 s 720p lecture
+        video2slides bench
+
+        # Record a baseline, then check a change against it
+        video2slides bench --output benchmarks/baseline.json
+        video2slides bench --baseline benchmarks/baseline.json
+    """
+    from video2slides.bench import LectureSpec, compare_results, run_benchmark
+
+    spec = LectureSpec(
+        duration=duration,
+        width=width,
+        height=height,
+        fps=fps,
+        slide_seconds=slide_seconds,
+        animations=animations,
+        speaker=speaker,
+        noise=noise,
+        seed=seed,
+    )
+    options = {
+        "fps_interval": interval,
+        "similarity_threshold": similarity,
+        "detector": detector,
+        "use_gpu": use_gpu,
+        "backend": backend,
+        "sampling_mode": sampling,
+        "workers": workers,
+        "compare_workers": compare_workers,
+    }
+    try:
+        if video is None:
+            typer.echo(f"🎬 Synthetic lecture: {duration:g}s {width}x{height} @ {fps:g} fps")
+        else:
+            typer.echo(f"🎬 Video: {video}")
+        results = run_benchmark(
+            spec, options, repeat=repeat, video_path=str(video.resolve()) if video else None
+        )
+    except Exception as e:
+        typer.echo(f"❌ Error: {e}", err=True)
+        raise typer.Exit(code=1) from e
+
+    stages = results["stages"]
+    typer.echo(f"{'stage':<8} {'seconds':>9} {'throughput':>22} {'peak RSS':>10}")
+    throughput = {
+        "decode": f"{stages['decode']['frames_per_second']:g} frames/s",
+        "extract": f"{stages['extract']['comparisons_per_second']:g} comparisons/s",
+        "pptx": f"{stages['pptx']['bytes'] / 1024:.0f} KiB written",
+    }
+    for name, metrics in stages.items():
+        typer.echo(
+            f"{name:<8} {metrics['seconds']:>9.3f} {throughput[name]:>22} "
+            f"{metrics['peak_rss_mb']:>7.1f} MB"
+        )
+    slide_states = results["slide_states"]
+    typer.echo(
+        f"🖼️  {stages['extract']['slides']} slides kept"
+        + (f" ({slide_states} distinct slide states)" if slide_states else "")
+    )
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+        typer.echo(f"📝 Results: {output.absolute()}")
+
+    if baseline:
+        with open(baseline) as f:
+            reference = json.load(f)
+        try:
+            regressions = compare_results(results, reference, tolerance)
+        except ValueError as e:
+            typer.echo(f"❌ Error: {e}", err=True)
+            raise typer.Exit(code=1) from e
+        if regressions:
+            typer.echo(f"⚠️  {len(regressions)} regression(s) against {baseline}:")
+            for regression in regressions:
+                typer.echo(f"   {regression}")
+            raise typer.Exit(code=1)
+        typer.echo(f"✅ No regressions against {baseline} (tolerance {tolerance:.0%})")
+
+
+@app.command()
+def serve(
+    host: str = typer.Option(
+        DEFAULT_HOST,
+        "--host",
+        help="Address to listen on (use 0.0.0.0 to accept jobs from other machines)",
+    ),
+    port: int = typer.Option(
+        DEFAULT_PORT,
+        "--port",
+        "-p",
+        help="Port to listen on",
+        min=0,
+    ),
+    jobs: int = typer.Option(
+        DEFAULT_BATCH_WORKERS,
+        "--jobs",
+        "-j",
+        help="Worker processes, i.e. maximum number of videos converted at the same time",
+        min=1,
+    ),
+    max_decodes: int | None = typer.Option(
+        None,
+        "--max-decodes",
+        help="Maximum number of jobs reading their video at the same time, to protect disk or network I/O (default: --jobs)",
+        min=1,
+    ),
+    output_dir: Path = typer.Option(
+        Path("."),
+        "--output-dir",
+        help="Directory for PPTX files of jobs without an output path (default: current directory)",
+    ),
+    log_file: Path | None = typer.Option(
+        None,
+        "--log-file",
+        "-l",
+        help="Path to eliot JSON log file (optional)",
+    ),
+) -> None:
+    """
+    Run a conversion service: an HTTP job queue with warm worker processes.
+
+    Workers import OpenCV and python-pptx and select the comparison backend once,
+    then convert queued jobs back to back. Jobs take the same options as batch
+    manifests (Video2Slides argument names).
+
+    Examples:
+
+        # Serve on http://127.0.0.1:8765 with 4 workers, 2 of them decoding at a time
+        video2slides serve -j 4 --max-decodes 2
+
+        # Queue a job and wait for it
+        curl -d '{"video": "/data/lecture.mp4", "options": {"similarity_threshold": 0.9}}' http://127.0.0.1:8765/jobs
+        curl 'http://127.0.0.1:8765/jobs/<id>?wait=60'
+    """
+    if log_file:
+        from eliot import to_file
+
+        to_file(open(str(log_file), "w"))
+
+    from video2slides.service import ConversionService, make_server
+
+    with ConversionService(jobs, max_decodes, str(output_dir)) as service:
+        typer.echo(f"🔥 Starting {jobs} worker process(es)...")
+        service.warm_up()
+        try:
+            server = make_server(service, host, port)
+        except OSError as e:
+            typer.echo(f"❌ Error: {e}", err=True)
+            raise typer.Exit(code=1) from e
+
+        bound_host, bound_port = server.server_address[:2]
+        if isinstance(bound_host, bytes):
+            bound_host = bound_host.decode()
+        typer.echo(f"🚀 Serving on http://{bound_host}:{bound_port} (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            typer.echo("🛑 Stopping: cancelling queued jobs and finishing running ones...")
+        finally:
+            server.server_close()
+
+
+def _download_youtube_video(
+    url: str,
+    output_dir: Path,
+    verbose: bool = False,
+    force: bool = False,
+    stream_format: dict[str, object] | None = None,
+) -> str:
     """
     Download a YouTube video using yt-dlp.
 
@@ -451,23 +1636,20 @@ def _download_youtube_video(url: str, output_dir: Path, verbose: bool = False, f
         output_dir: Directory to save the downloaded video
         verbose: Whether to show verbose output
         force: Force re-download even if video already exists
+        stream_format: yt-dlp format options (default: video2slides.youtube.format_options())
 
     Returns:
         Path to the downloaded video file
     """
-    import yt_dlp  # type: ignore[import-untyped]
-
-    with start_action(action_type="download_youtube_video", video_url=url):
-        ydl_opts = {
-            "format": "best[ext=mp4]/best",
-            "outtmpl": str(output_dir / "%(title)s.%(ext)s"),
-            "quiet": not verbose,
-            "no_warnings": verbose,
-        }
+    import yt_dlp
+    from eliot import start_action
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+    with start_action(
+        action_type="download_youtube_video", video_url=url, stream_format=stream_format
+    ):
+        with yt_dlp.YoutubeDL(_youtube_options(output_dir, verbose, stream_format)) as ydl:
             info = ydl.extract_info(url, download=False)
-            filename = ydl.prepare_filename(info)
+            filename: str = ydl.prepare_filename(info)
 
             # Check if file already exists
             if os.path.exists(filename) and not force:
@@ -486,5 +1668,155 @@ def _download_youtube_video(url: str, output_dir: Path, verbose: bool = False, f
         return filename
 
 
+def _youtube_options(
+    output_dir: Path, verbose: bool, stream_format: dict[str, object] | None
+) -> dict[str, object]:
+    """yt-dlp options shared by the foreground and background downloads."""
+    from video2slides.youtube import format_options
+
+    return {
+        **(stream_format if stream_format is not None else format_options()),
+        "outtmpl": str(output_dir / "%(title)s.%(ext)s"),
+        "quiet": not verbose,
+        "no_warnings": verbose,
+    }
+
+
+# Subdirectory of the output directory that videos are downloaded to while being converted
+_DOWNLOADING_DIR = ".downloading"
+
+
+class _BackgroundDownload:
+    """A YouTube download running on a background thread while its file is converted."""
+
+    def __init__(
+        self,
+        filename: str,
+        ydl: Any = None,
+        url: str | None = None,
+        partial: str | None = None,
+    ) -> None:
+        """
+        Start the download, if any.
+
+        Args:
+            filename: Final path of the video
+            ydl: yt-dlp downloader to run with ``url`` (None if the file is already there)
+            url: YouTube video URL
+            partial: Path the downloader writes to, moved to ``filename`` once the download
+                has succeeded
+        """
+        self.filename = filename
+        self.partial = partial
+        self._error: BaseException | None = None
+        self._thread: threading.Thread | None = None
+        if ydl is not None:
+            self._thread = threading.Thread(
+                target=self._run, args=(ydl, url), name="download", daemon=True
+            )
+            self._thread.start()
+
+    @property
+    def path(self) -> str:
+        """Path to read the video from: the in-progress file until the download is done."""
+        return self.partial if self.partial is not None else self.filename
+
+    def _run(self, ydl: Any, url: str) -> None:
+        try:
+            with ydl:
+                ydl.extract_info(url, download=True)
+        except BaseException as e:  # re-raised by wait()
+            self._error = e
+
+    def is_finished(self) -> bool:
+        """Whether the download has ended, successfully or not."""
+        return self._thread is None or not self._thread.is_alive()
+
+    def wait(self) -> None:
+        """
+        Wait for the download to end and move the file to its final name.
+
+        Raises:
+            BaseException: The download's error if it failed; the in-progress file is left
+                where it is and never taken for a finished download
+        """
+        if self._thread is not None:
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+        if self.partial is not None:
+            partial, self.partial = self.partial, None
+            os.replace(partial, self.filename)
+            # Other downloads may still be in progress in the same directory
+            with contextlib.suppress(OSError):
+                os.rmdir(os.path.dirname(partial))
+
+
+def _start_youtube_download(
+    url: str,
+    output_dir: Path,
+    verbose: bool = False,
+    force: bool = False,
+    stream_format: dict[str, object] | None = None,
+) -> _BackgroundDownload:
+    """
+    Start downloading a YouTube video on a background thread, to convert it as it downloads.
+
+    The video is written to a file of the same name in a ".downloading" subdirectory,
+    without a ".part" file and with yt-dlp's fixups (which rewrite a finished file) disabled,
+    so it only ever grows. It is moved to its final name once the download has succeeded,
+    so an interrupted download is never taken for a finished one.
+
+    Args:
+        url: YouTube video URL
+        output_dir: Directory to save the downloaded video
+        verbose: Whether to show verbose output
+        force: Force re-download even if video already exists
+        stream_format: yt-dlp format options (default: video2slides.youtube.format_options())
+
+    Returns:
+        The download, whose path can be followed while it runs
+    """
+    import yt_dlp
+    from eliot import start_action
+
+    with start_action(
+        action_type="start_youtube_download", video_url=url, stream_format=stream_format
+    ):
+        options = _youtube_options(output_dir, verbose, stream_format)
+        ydl = yt_dlp.YoutubeDL(
+            {
+                **options,
+                "outtmpl": str(output_dir / _DOWNLOADING_DIR / "%(title)s.%(ext)s"),
+                "nopart": True,
+                "fixup": "never",
+            }
+        )
+        info = ydl.extract_info(url, download=False)
+        partial: str = ydl.prepare_filename(info)
+        filename = str(output_dir / os.path.basename(partial))
+
+        if os.path.exists(filename) and not force:
+            if not verbose:
+                typer.echo(
+                    f"✅ Video already exists, using existing file: {os.path.basename(filename)}"
+                )
+            ydl.close()
+            return _BackgroundDownload(filename)
+
+        if os.path.exists(partial):
+            # Left by an interrupted download; following it would read the old data
+            os.remove(partial)
+        if not verbose:
+            if os.path.exists(filename):
+                typer.echo(f"🔄 Force re-downloading: {os.path.basename(filename)}")
+            else:
+                typer.echo(
+                    f"📥 Downloading to: {os.path.basename(filename)} (converting as it downloads)"
+                )
+
+        return _BackgroundDownload(filename, ydl, url, partial)
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,92 @@
+"""
+Per-stage timers and resource figures of a conversion.
+
+Stages run on several threads (decoder, comparison pool, writers, slide builder) and in
+segment worker processes, so each stage accumulates busy time rather than wall time: the
+stage seconds of a run can add up to more than its duration when stages overlap.
+"""
+
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+# Stages in pipeline order:
+#   decode      decoding sampled frames (including seeks to them)
+#   skip        grabbing or decoding frames between samples
+#   prepare     reducing sampled frames to comparison signatures
+#   similarity  comparing signatures (SSIM statistics are computed on first comparison)
+#   encode      downscaling and encoding kept frames
+#   write       putting encoded frames into the frame store
+#   slide_add   adding slides to the presentation
+#   save        saving the presentation file
+STAGES = ("decode", "skip", "prepare", "similarity", "encode", "write", "slide_add", "save")
+
+
+class StageTimers:
+    """Thread-safe cumulative seconds and call counts per stage."""
+
+    def __init__(self) -> None:
+        """Initialize timers with every stage at zero."""
+        self._seconds = dict.fromkeys(STAGES, 0.0)
+        self._counts = dict.fromkeys(STAGES, 0)
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, dict]:
+        return {"seconds": self._seconds, "counts": self._counts}
+
+    def __setstate__(self, state: dict[str, dict]) -> None:
+        self._seconds = state["seconds"]
+        self._counts = state["counts"]
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float, count: int = 1) -> None:
+        """Add ``count`` calls taking ``seconds`` in total to a stage."""
+        with self._lock:
+            self._seconds[stage] += seconds
+            self._counts[stage] += count
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Time the body as one call of a stage (also when it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+    def merge(self, other: "StageTimers") -> None:
+        """Add the stages of another run (e.g. a segment worker's) to these."""
+        for stage in STAGES:
+            self.add(stage, other.seconds(stage), other.count(stage))
+
+    def seconds(self, stage: str) -> float:
+        """Cumulative seconds of a stage."""
+        return self._seconds[stage]
+
+    def count(self, stage: str) -> int:
+        """Number of calls of a stage."""
+        return self._counts[stage]
+
+    def to_dict(self) -> dict[str, dict[str, float]]:
+        """{stage: {"seconds": ..., "count": ...}} in pipeline order."""
+        with self._lock:
+            return {
+                stage: {"seconds": round(self._seconds[stage], 6), "count": self._counts[stage]}
+                for stage in STAGES
+            }
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident memory of this process so far in megabytes (None if unknown)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
@@ -0,0 +1,224 @@
+"""Bounded-queue building blocks for the threaded frame extraction pipeline."""
+
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class BoundedProducer(Generic[T]):
+    """
+    Drive an iterable on a background thread into a bounded queue.
+
+    The producer blocks once ``maxsize`` items are waiting, so a fast decoder
+    cannot run ahead of slower consumers and memory stays bounded. Exceptions
+    raised by the iterable are re-raised in the consuming thread.
+    """
+
+    def __init__(self, source: Iterable[T], maxsize: int, name: str = "producer") -> None:
+        """
+        Initialize producer.
+
+        Args:
+            source: Iterable to consume on the background thread
+            maxsize: Maximum number of items buffered between producer and consumer
+            name: Thread name (useful in stack dumps)
+        """
+        self._source = source
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max(1, maxsize))
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def _put(self, item: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self) -> None:
+        try:
+            for item in self._source:
+                if not self._put(item):
+                    return
+        except BaseException as e:
+            # Forward the failure to the consumer instead of dying silently
+            self._put(e)
+            return
+        self._put(_DONE)
+
+    def __enter__(self) -> "BoundedProducer[T]":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[T]:
+        while True:
+            item = self._queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def close(self) -> None:
+        """Stop the producer thread and wait for it to finish."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+
+class BoundedExecutor:
+    """
+    Thread pool that blocks ``submit`` once ``max_pending`` tasks are in flight.
+
+    Used for the JPEG writer stage: accepted frames are handed to the pool as
+    soon as they are decided, and the decision loop stalls instead of piling up
+    full-resolution frames when the disk cannot keep up.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, name: str = "worker") -> None:
+        """
+        Initialize executor.
+
+        Args:
+            max_workers: Number of worker threads
+            max_pending: Maximum number of submitted but unfinished tasks
+            name: Thread name prefix
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix=name)
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._futures: list[Future[Any]] = []
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> Future[T]:
+        """
+        Submit a task, blocking while the pending limit is reached.
+
+        Re-raises the failure of an earlier task that has already completed, so callers
+        stop producing work as soon as a task fails instead of at the next ``wait``.
+        """
+        self._slots.acquire()
+        try:
+            self._raise_failure()
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        # Forget finished tasks so long runs do not accumulate futures; failures are kept for wait()
+        self._futures = [f for f in self._futures if not f.done() or f.exception() is not None]
+        self._futures.append(future)
+        return future
+
+    def __enter__(self) -> "BoundedExecutor":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+
+    def _raise_failure(self) -> None:
+        """Re-raise the first failure among the tasks that have completed."""
+        for future in self._futures:
+            if future.done():
+                error = future.exception()
+                if error is not None:
+                    raise error
+
+    def wait(self) -> None:
+        """Wait for all submitted tasks and re-raise the first failure."""
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def shutdown(self) -> None:
+        """Wait for running tasks and release the worker threads."""
+        self._executor.shutdown(wait=True)
+
+
+class OrderedConsumer(Generic[T]):
+    """
+    Consume numbered items on a background thread in index order.
+
+    Items may be submitted from several threads and out of order (e.g. by writer threads
+    finishing at different times); each is consumed once every item with a lower index
+    has been. Exceptions raised by the consumer are re-raised by ``finish``.
+    """
+
+    def __init__(self, consume: Callable[[T], None], name: str = "consumer") -> None:
+        """
+        Initialize consumer.
+
+        Args:
+            consume: Callback run on the background thread for each item, in index order
+            name: Thread name (useful in stack dumps)
+        """
+        self._consume = consume
+        self._pending: dict[int, T] = {}
+        self._next = 0
+        self._closed = False
+        self._error: BaseException | None = None
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._next not in self._pending and not self._closed:
+                    self._condition.wait()
+                if self._next not in self._pending:
+                    return
+                item = self._pending.pop(self._next)
+            try:
+                self._consume(item)
+            except BaseException as e:
+                with self._condition:
+                    self._error = e
+                    self._condition.notify_all()
+                return
+            with self._condition:
+                self._next += 1
+                self._condition.notify_all()
+
+    def __enter__(self) -> "OrderedConsumer[T]":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def submit(self, index: int, item: T) -> None:
+        """Hand over the item with the given index (0-based, each index exactly once)."""
+        with self._condition:
+            self._pending[index] = item
+            self._condition.notify_all()
+
+    def finish(self, count: int) -> None:
+        """
+        Wait until items ``0 .. count - 1`` have been consumed, then stop the thread.
+
+        All of them must have been submitted (or be about to be).
+        """
+        with self._condition:
+            while self._next < count and self._error is None:
+                self._condition.wait()
+        self.close()
+        if self._error is not None:
+            raise self._error
+
+    def close(self) -> None:
+        """Stop the thread once the item being consumed is done, dropping the rest."""
+        with self._condition:
+            self._closed = True
+            self._pending.clear()
+            self._condition.notify_all()
+        if self._thread.is_alive():
+            self._thread.join()
@@ -0,0 +1,239 @@
+"""
+Direct PPTX writer for very large decks.
+
+python-pptx keeps every slide part, image and XML tree in memory until ``save``, which
+gets slow and memory hungry for thousands of slides. This writer streams each slide's XML
+and image straight into the zip file and only keeps the list of slide names; the parts that
+reference every slide (presentation.xml, its relationships and the content types) are
+written when the presentation is saved.
+
+The package is derived from python-pptx's default template (master, layouts, theme), so
+the result matches what python-pptx produces for the same slides.
+"""
+
+import functools
+import io
+import os
+import re
+import zipfile
+from types import TracebackType
+from xml.sax.saxutils import escape
+
+from pptx import Presentation
+
+PPTX_WRITERS = ("python-pptx", "direct")
+
+# Layouts of python-pptx's default template used for the title and picture slides
+TITLE_LAYOUT = "slideLayout1.xml"
+BLANK_LAYOUT = "slideLayout7.xml"
+# Parts rewritten when the presentation is saved
+_REWRITTEN_PARTS = (
+    "[Content_Types].xml",
+    "ppt/presentation.xml",
+    "ppt/_rels/presentation.xml.rels",
+)
+_FIRST_SLIDE_ID = 256
+
+_NAMESPACES = (
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+_XML_HEADER = "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+_SLIDE_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
+_REL_TYPES = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_IMAGE_CONTENT_TYPES = {"jpg": "image/jpeg", "jpeg": "image/jpeg", "png": "image/png"}
+
+
+@functools.lru_cache(maxsize=1)
+def _template() -> dict[str, bytes]:
+    """Parts of an empty presentation saved by python-pptx."""
+    buffer = io.BytesIO()
+    Presentation().save(buffer)
+    with zipfile.ZipFile(buffer) as package:
+        return {name: package.read(name) for name in package.namelist()}
+
+
+def _slide_xml(shapes: str) -> str:
+    return (
+        f"{_XML_HEADER}<p:sld {_NAMESPACES}><p:cSld><p:spTree>"
+        '<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+        f"<p:grpSpPr/>{shapes}</p:spTree></p:cSld>"
+        "<p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sld>"
+    )
+
+
+def _placeholder_xml(shape_id: int, name: str, placeholder: str, lines: list[str]) -> str:
+    paragraphs = "".join(f"<a:p><a:r><a:t>{escape(line)}</a:t></a:r></a:p>" for line in lines)
+    return (
+        f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="{name}"/>'
+        '<p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr>'
+        f"<p:nvPr>{placeholder}</p:nvPr></p:nvSpPr><p:spPr/>"
+        f"<p:txBody><a:bodyPr/><a:lstStyle/>{paragraphs}</p:txBody></p:sp>"
+    )
+
+
+def _relationships_xml(relationships: list[tuple[str, str, str]]) -> str:
+    entries = "".join(
+        f'<Relationship Id="{rel_id}" Type="{_REL_TYPES}/{rel_type}" Target="{target}"/>'
+        for rel_id, rel_type, target in relationships
+    )
+    return (
+        f"{_XML_HEADER}<Relationships "
+        f'xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        f"{entries}</Relationships>"
+    )
+
+
+class DirectPresentationWriter:
+    """
+    Write a presentation slide by slide straight into a PPTX (zip) file.
+
+    The file is written next to ``output_path`` under a temporary name and only moved into
+    place by ``save``, so a failed conversion never leaves a truncated presentation behind.
+    """
+
+    def __init__(self, output_path: str, slide_width: int, slide_height: int) -> None:
+        """
+        Initialize writer.
+
+        Args:
+            output_path: Path of the PPTX file to write
+            slide_width: Slide width in EMU
+            slide_height: Slide height in EMU
+        """
+        self.output_path = output_path
+        self.slide_width = slide_width
+        self.slide_height = slide_height
+        self.slide_count = 0
+        self._media_extensions: set[str] = set()
+        self._template = _template()
+
+        directory, name = os.path.split(output_path)
+        self._temp_path = os.path.join(directory, f".{name}.partial")
+        self._package = zipfile.ZipFile(self._temp_path, "w", zipfile.ZIP_DEFLATED)
+        for name, data in self._template.items():
+            if name not in _REWRITTEN_PARTS:
+                self._package.writestr(name, data)
+
+    def _add_slide(self, xml: str, relationships: list[tuple[str, str, str]]) -> None:
+        self.slide_count += 1
+        number = self.slide_count
+        self._package.writestr(f"ppt/slides/slide{number}.xml", xml)
+        self._package.writestr(
+            f"ppt/slides/_rels/slide{number}.xml.rels", _relationships_xml(relationships)
+        )
+
+    def add_title_slide(self, title: str, subtitle: str) -> None:
+        """Add a slide with the title layout; subtitle lines become separate paragraphs."""
+        subtitle_placeholder = '<p:ph type="subTitle" idx="1"/>'
+        shapes = _placeholder_xml(2, "Title 1", '<p:ph type="ctrTitle"/>', [title])
+        shapes += _placeholder_xml(3, "Subtitle 2", subtitle_placeholder, subtitle.split("\n"))
+        self._add_slide(
+            _slide_xml(shapes),
+            [("rId1", "slideLayout", f"../slideLayouts/{TITLE_LAYOUT}")],
+        )
+
+    def add_picture_slide(
+        self, image: bytes, left: int, top: int, width: int, height: int, extension: str = "jpg"
+    ) -> None:
+        """
+        Add a blank slide showing one picture.
+
+        Args:
+            image: Encoded image bytes
+            left: Picture position from the left slide edge in EMU
+            top: Picture position from the top slide edge in EMU
+            width: Picture width in EMU
+            height: Picture height in EMU
+            extension: Image format of ``image`` ("jpg", "jpeg" or "png")
+        """
+        if extension not in _IMAGE_CONTENT_TYPES:
+            raise ValueError(f"Unsupported image format: {extension}")
+        self._media_extensions.add(extension)
+
+        media_name = f"image{self.slide_count + 1}.{extension}"
+        self._package.writestr(f"ppt/media/{media_name}", image)
+        picture = (
+            '<p:pic><p:nvPicPr><p:cNvPr id="2" name="Picture 1" '
+            f'descr="{media_name}"/>'
+            '<p:cNvPicPr><a:picLocks noChangeAspect="1"/></p:cNvPicPr><p:nvPr/></p:nvPicPr>'
+            '<p:blipFill><a:blip r:embed="rId2"/><a:stretch><a:fillRect/></a:stretch></p:blipFill>'
+            f'<p:spPr><a:xfrm><a:off x="{int(left)}" y="{int(top)}"/>'
+            f'<a:ext cx="{int(width)}" cy="{int(height)}"/></a:xfrm>'
+            '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr></p:pic>'
+        )
+        self._add_slide(
+            _slide_xml(picture),
+            [
+                ("rId1", "slideLayout", f"../slideLayouts/{BLANK_LAYOUT}"),
+                ("rId2", "image", f"../media/{media_name}"),
+            ],
+        )
+
+    def _presentation_xml(self, first_rel_id: int) -> str:
+        xml = self._template["ppt/presentation.xml"].decode("utf-8")
+        slide_ids = "".join(
+            f'<p:sldId id="{_FIRST_SLIDE_ID + i}" r:id="rId{first_rel_id + i}"/>'
+            for i in range(self.slide_count)
+        )
+        if slide_ids:
+            xml = xml.replace(
+                "</p:sldMasterIdLst>", f"</p:sldMasterIdLst><p:sldIdLst>{slide_ids}</p:sldIdLst>", 1
+            )
+        return re.sub(
+            r"<p:sldSz [^>]*/>",
+            f'<p:sldSz cx="{self.slide_width}" cy="{self.slide_height}"/>',
+            xml,
+            count=1,
+        )
+
+    def _presentation_rels_xml(self) -> tuple[str, int]:
+        xml = self._template["ppt/_rels/presentation.xml.rels"].decode("utf-8")
+        first_rel_id = max(int(n) for n in re.findall(r'Id="rId(\d+)"', xml)) + 1
+        slides = "".join(
+            f'<Relationship Id="rId{first_rel_id + i}" Type="{_REL_TYPES}/slide" '
+            f'Target="slides/slide{i + 1}.xml"/>'
+            for i in range(self.slide_count)
+        )
+        return xml.replace("</Relationships>", f"{slides}</Relationships>", 1), first_rel_id
+
+    def _content_types_xml(self) -> str:
+        xml = self._template["[Content_Types].xml"].decode("utf-8")
+        defaults = "".join(
+            f'<Default Extension="{extension}" ContentType="{_IMAGE_CONTENT_TYPES[extension]}"/>'
+            for extension in sorted(self._media_extensions)
+            if f'Extension="{extension}"' not in xml
+        )
+        overrides = "".join(
+            f'<Override PartName="/ppt/slides/slide{i + 1}.xml" ContentType="{_SLIDE_CONTENT_TYPE}"/>'
+            for i in range(self.slide_count)
+        )
+        return xml.replace("</Types>", f"{defaults}{overrides}</Types>", 1)
+
+    def save(self) -> None:
+        """Write the parts listing all slides, close the package and move it into place."""
+        rels_xml, first_rel_id = self._presentation_rels_xml()
+        self._package.writestr("ppt/_rels/presentation.xml.rels", rels_xml)
+        self._package.writestr("ppt/presentation.xml", self._presentation_xml(first_rel_id))
+        self._package.writestr("[Content_Types].xml", self._content_types_xml())
+        self._package.close()
+        os.replace(self._temp_path, self.output_path)
+
+    def discard(self) -> None:
+        """Close the package and delete the partial file."""
+        self._package.close()
+        if os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+
+    def __enter__(self) -> "DirectPresentationWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is not None:
+            self.discard()
@@ -0,0 +1,234 @@
+"""Comparison regions: which part of a frame takes part in similarity detection."""
+
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+# Frames sampled when auto-detecting a speaker box, and the gap between the two frames of a pair
+SPEAKER_SAMPLE_PAIRS = 8
+SPEAKER_PAIR_GAP_SECONDS = 0.5
+# Width of the thumbnails the speaker box is detected on
+SPEAKER_DETECTION_WIDTH = 160
+# Boxes covering more than this fraction of the frame are motion in the slide itself
+SPEAKER_MAX_AREA = 0.4
+# Extra margin added around a detected speaker box (fraction of frame size)
+SPEAKER_MARGIN = 0.02
+
+
+@dataclass(frozen=True)
+class Rect:
+    """Axis-aligned rectangle in fractions (0-1) of the frame width and height."""
+
+    x: float
+    y: float
+    width: float
+    height: float
+
+    def to_pixels(self, frame_width: int, frame_height: int) -> tuple[int, int, int, int]:
+        """
+        Convert to pixel coordinates clipped to the frame.
+
+        Returns:
+            (x0, y0, x1, y1) with x1/y1 exclusive
+        """
+        x0 = min(frame_width, max(0, int(self.x * frame_width)))
+        y0 = min(frame_height, max(0, int(self.y * frame_height)))
+        x1 = min(frame_width, max(x0, int(round((self.x + self.width) * frame_width))))
+        y1 = min(frame_height, max(y0, int(round((self.y + self.height) * frame_height))))
+        return x0, y0, x1, y1
+
+
+def parse_rect(text: str) -> Rect:
+    """
+    Parse a rectangle given as "x,y,width,height" in fractions of the frame size.
+
+    Args:
+        text: Comma-separated rectangle, e.g. "0.7,0.7,0.3,0.3" for the bottom-right corner
+
+    Returns:
+        Parsed rectangle
+    """
+    parts = [part.strip() for part in text.split(",")]
+    if len(parts) != 4:
+        raise ValueError(f"Expected x,y,width,height, got: {text}")
+    try:
+        x, y, width, height = (float(part) for part in parts)
+    except ValueError as e:
+        raise ValueError(f"Rectangle values must be numbers: {text}") from e
+    if not all(0.0 <= value <= 1.0 for value in (x, y, width, height)):
+        raise ValueError(f"Rectangle values must be fractions between 0 and 1: {text}")
+    if width <= 0 or height <= 0:
+        raise ValueError(f"Rectangle must have a positive size: {text}")
+    return Rect(x, y, width, height)
+
+
+class ComparisonRegion:
+    """
+    Crop and mask applied to frames before comparing them.
+
+    The crop is applied to the full-resolution frame as a view, so pixels outside the
+    slide area are never converted or resized. Ignored areas (corners, rectangles) are
+    zeroed with a mask that is built once per comparison resolution and reused.
+    """
+
+    def __init__(
+        self,
+        ignore_corners: bool = True,
+        corner_size_percent: float = 0.15,
+        ignore_rects: tuple[Rect, ...] = (),
+        crop: Rect | None = None,
+    ) -> None:
+        """
+        Initialize comparison region.
+
+        Args:
+            ignore_corners: If True, mask all four corners of the (cropped) frame
+            corner_size_percent: Size of corners to ignore as percentage of frame dimensions (0-1)
+            ignore_rects: Rectangles to mask, relative to the full frame
+            crop: Slide area to compare, relative to the full frame (None for the whole frame)
+        """
+        self.ignore_corners = ignore_corners
+        self.corner_size_percent = corner_size_percent
+        self.ignore_rects = ignore_rects
+        self.crop = crop
+        self._masks: dict[tuple[int, int], np.ndarray | None] = {}
+
+    def crop_frame(self, frame: np.ndarray) -> np.ndarray:
+        """Return a view of the slide area of a full-resolution frame."""
+        if self.crop is None:
+            return frame
+        x0, y0, x1, y1 = self.crop.to_pixels(frame.shape[1], frame.shape[0])
+        return frame[y0:y1, x0:x1]
+
+    def _to_crop_space(self, rect: Rect) -> Rect:
+        """Express a full-frame rectangle relative to the crop area."""
+        if self.crop is None:
+            return rect
+        return Rect(
+            (rect.x - self.crop.x) / self.crop.width,
+            (rect.y - self.crop.y) / self.crop.height,
+            rect.width / self.crop.width,
+            rect.height / self.crop.height,
+        )
+
+    def _build_mask(self, height: int, width: int) -> np.ndarray | None:
+        if not self.ignore_corners and not self.ignore_rects:
+            return None
+
+        mask = np.full((height, width), 255, dtype=np.uint8)
+
+        if self.ignore_corners:
+            corner_h = int(height * self.corner_size_percent)
+            corner_w = int(width * self.corner_size_percent)
+
+            # Mask all four corners (typically bottom-right for speaker, but mask all for safety)
+            mask[0:corner_h, 0:corner_w] = 0  # Top-left
+            mask[0:corner_h, width - corner_w : width] = 0  # Top-right
+            mask[height - corner_h : height, 0:corner_w] = 0  # Bottom-left
+            mask[height - corner_h : height, width - corner_w : width] = 0  # Bottom-right
+
+        for rect in self.ignore_rects:
+            x0, y0, x1, y1 = self._to_crop_space(rect).to_pixels(width, height)
+            mask[y0:y1, x0:x1] = 0
+
+        return mask
+
+    def mask_for(self, height: int, width: int) -> np.ndarray | None:
+        """
+        Get the mask for a comparison image of the given size, building it on first use.
+
+        Returns:
+            uint8 mask (255 = compared, 0 = ignored), or None if nothing is ignored
+        """
+        key = (height, width)
+        if key not in self._masks:
+            self._masks[key] = self._build_mask(height, width)
+        return self._masks[key]
+
+    def apply_mask(self, gray: np.ndarray) -> np.ndarray:
+        """Zero ignored pixels of a (cropped, downscaled) grayscale image in place."""
+        mask = self.mask_for(*gray.shape[:2])
+        if mask is not None:
+            cv2.bitwise_and(gray, mask, dst=gray)
+        return gray
+
+
+def detect_speaker_box(
+    video_path: str,
+    sample_pairs: int = SPEAKER_SAMPLE_PAIRS,
+    pair_gap_seconds: float = SPEAKER_PAIR_GAP_SECONDS,
+) -> Rect | None:
+    """
+    Detect a speaker/webcam overlay from motion that persists across the video.
+
+    Pairs of frames a fraction of a second apart are taken from evenly spaced points of
+    the video. Within a pair the slide is almost always unchanged, so the differences
+    come from the speaker. The bounding box of the largest region moving in most pairs is
+    returned.
+
+    Args:
+        video_path: Path to the video file
+        sample_pairs: Number of frame pairs to sample
+        pair_gap_seconds: Time between the two frames of a pair
+
+    Returns:
+        Speaker box in fractions of the frame size, or None if no consistent overlay was found
+    """
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise ValueError(f"Unable to open video file: {video_path}")
+
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        gap = max(1, int(fps * pair_gap_seconds))
+        if total_frames <= gap:
+            return None
+
+        motion_votes: np.ndarray | None = None
+        used_pairs = 0
+        for i in range(sample_pairs):
+            start = int((total_frames - gap - 1) * (i + 0.5) / sample_pairs)
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+            ret1, first = cap.read()
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start + gap)
+            ret2, second = cap.read()
+            if not (ret1 and ret2):
+                continue
+
+            scale = SPEAKER_DETECTION_WIDTH / first.shape[1]
+            size = (SPEAKER_DETECTION_WIDTH, max(1, int(first.shape[0] * scale)))
+            thumbs = [
+                cv2.resize(cv2.cvtColor(f, cv2.COLOR_BGR2GRAY), size, interpolation=cv2.INTER_AREA)
+                for f in (first, second)
+            ]
+            diff = cv2.absdiff(thumbs[0], thumbs[1])
+            moving = (diff > 12).astype(np.uint16)
+            motion_votes = moving if motion_votes is None else motion_votes + moving
+            used_pairs += 1
+    finally:
+        cap.release()
+
+    if motion_votes is None or used_pairs < 2:
+        return None
+
+    # Pixels moving in at least half the pairs belong to a persistent overlay
+    persistent = cv2.dilate(
+        (motion_votes * 2 >= used_pairs).astype(np.uint8), np.ones((5, 5), dtype=np.uint8)
+    )
+    count, _, stats, _ = cv2.connectedComponentsWithStats(persistent)
+    if count <= 1:
+        return None
+
+    largest = 1 + int(np.argmax(stats[1:, cv2.CC_STAT_AREA]))
+    x, y, w, h = (int(v) for v in stats[largest, :4])
+    thumb_h, thumb_w = persistent.shape
+    if w * h > SPEAKER_MAX_AREA * thumb_w * thumb_h:
+        return None
+
+    x0 = max(0.0, x / thumb_w - SPEAKER_MARGIN)
+    y0 = max(0.0, y / thumb_h - SPEAKER_MARGIN)
+    x1 = min(1.0, (x + w) / thumb_w + SPEAKER_MARGIN)
+    y1 = min(1.0, (y + h) / thumb_h + SPEAKER_MARGIN)
+    return Rect(x0, y0, x1 - x0, y1 - y0)
@@ -0,0 +1,375 @@
+"""Sparse frame sampling strategies for reading every N-th frame of a video."""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from typing import Generic, TypeVar
+
+import cv2
+import numpy as np
+
+from video2slides.follow import Capture
+from video2slides.metrics import StageTimers
+
+SAMPLING_MODES = ("auto", "read", "grab", "seek")
+# Sampling mode of the converter that steps adaptively (AdaptiveSampler) instead of every N frames
+ADAPTIVE_SAMPLING = "adaptive"
+
+# Below this many frames between samples seeking never pays off, so "auto" skips the GOP probe
+MIN_SEEK_INTERVAL = 30
+# Maximum number of frames grabbed while looking for the distance between two keyframes
+GOP_PROBE_FRAMES = 600
+# Seek when the sampling interval spans at least this many GOPs; a seek decodes on average
+# half a GOP plus demuxer overhead, grabbing decodes the whole interval
+SEEK_GOP_MULTIPLIER = 2
+
+_KEYFRAME_TYPE = ord("I")
+
+Signature = TypeVar("Signature")
+
+
+def estimate_gop_size(cap: Capture, max_frames: int = GOP_PROBE_FRAMES) -> int | None:
+    """
+    Estimate the keyframe distance (GOP size) by grabbing the leading frames of a video.
+
+    The capture is rewound to its starting position afterwards.
+
+    Args:
+        cap: Opened video capture
+        max_frames: Maximum number of frames to grab while probing
+
+    Returns:
+        Distance between the first two keyframes, or None if it could not be determined
+    """
+    frame_type_prop = getattr(cv2, "CAP_PROP_FRAME_TYPE", None)
+    if frame_type_prop is None:
+        return None
+
+    start_position = cap.get(cv2.CAP_PROP_POS_FRAMES)
+    keyframes: list[int] = []
+    try:
+        for index in range(max_frames):
+            if not cap.grab():
+                break
+            if int(cap.get(frame_type_prop)) == _KEYFRAME_TYPE:
+                keyframes.append(index)
+                if len(keyframes) == 2:
+                    break
+    finally:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, start_position)
+
+    if len(keyframes) < 2:
+        return None
+    return keyframes[1] - keyframes[0]
+
+
+def choose_sampling_mode(frame_interval: int, gop_size: int | None) -> str:
+    """
+    Choose between grabbing and seeking for a given sampling interval.
+
+    Args:
+        frame_interval: Number of frames between two samples
+        gop_size: Estimated keyframe distance, or None if unknown
+
+    Returns:
+        "seek" if seeking is expected to decode fewer frames than grabbing, otherwise "grab"
+    """
+    if frame_interval < MIN_SEEK_INTERVAL or gop_size is None:
+        return "grab"
+    if frame_interval >= SEEK_GOP_MULTIPLIER * gop_size:
+        return "seek"
+    return "grab"
+
+
+class FrameSampler:
+    """
+    Iterate over every ``frame_interval``-th frame of an opened video capture.
+
+    Modes:
+        read: decode and convert every frame (reference behaviour, slowest)
+        grab: ``cap.grab()`` skipped frames and only ``cap.retrieve()`` sampled ones
+        seek: jump straight to each sampled frame via ``CAP_PROP_POS_FRAMES``
+        auto: probe the GOP size and pick "grab" or "seek"
+    """
+
+    def __init__(
+        self,
+        cap: Capture,
+        frame_interval: int,
+        mode: str = "auto",
+        total_frames: int = 0,
+        start_frame: int = 0,
+        end_frame: int | None = None,
+        timers: StageTimers | None = None,
+    ) -> None:
+        """
+        Initialize sampler.
+
+        Args:
+            cap: Opened video capture positioned at the first frame
+            frame_interval: Number of frames between two samples (values below 1 are treated as 1)
+            mode: Sampling mode, one of SAMPLING_MODES
+            total_frames: Frame count reported by the container (0 if unknown)
+            start_frame: First frame to sample; the capture is moved there if needed
+            end_frame: Stop before this frame (None to read until the end of the video)
+            timers: Timers to add decoding of sampled frames ("decode") and of the frames
+                in between ("skip") to
+        """
+        if mode not in SAMPLING_MODES:
+            raise ValueError(f"Unknown sampling mode: {mode}. Expected one of {SAMPLING_MODES}")
+
+        self.cap = cap
+        self.frame_interval = max(1, frame_interval)
+        self.total_frames = total_frames
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+        self.gop_size: int | None = None
+        self.timers = timers
+
+        if start_frame > 0:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+
+        if mode == "auto":
+            if self.frame_interval >= MIN_SEEK_INTERVAL:
+                self.gop_size = estimate_gop_size(cap)
+            mode = choose_sampling_mode(self.frame_interval, self.gop_size)
+        self.mode = mode
+
+    def __iter__(self) -> Iterator[tuple[int, np.ndarray]]:
+        """Yield (frame_index, frame) tuples for sampled frames."""
+        if self.mode == "read":
+            return self._iter_read()
+        if self.mode == "seek":
+            return self._iter_seek()
+        return self._iter_grab()
+
+    def _in_range(self, frame_index: int) -> bool:
+        return self.end_frame is None or frame_index < self.end_frame
+
+    def _timed(self, stage: str, start: float) -> None:
+        if self.timers is not None:
+            self.timers.add(stage, time.perf_counter() - start)
+
+    def _iter_read(self) -> Iterator[tuple[int, np.ndarray]]:
+        frame_index = self.start_frame
+        while self._in_range(frame_index):
+            start = time.perf_counter()
+            ret, frame = self.cap.read()
+            if not ret or frame is None:
+                return
+            if (frame_index - self.start_frame) % self.frame_interval == 0:
+                self._timed("decode", start)
+                yield frame_index, frame
+            else:
+                self._timed("skip", start)
+            frame_index += 1
+
+    def _iter_grab(self) -> Iterator[tuple[int, np.ndarray]]:
+        frame_index = self.start_frame
+        while self._in_range(frame_index):
+            start = time.perf_counter()
+            if not self.cap.grab():
+                return
+            if (frame_index - self.start_frame) % self.frame_interval == 0:
+                ret, frame = self.cap.retrieve()
+                if not ret or frame is None:
+                    return
+                self._timed("decode", start)
+                yield frame_index, frame
+            else:
+                self._timed("skip", start)
+            frame_index += 1
+
+    def _iter_seek(self) -> Iterator[tuple[int, np.ndarray]]:
+        frame_index = self.start_frame
+        while self._in_range(frame_index) and (
+            self.total_frames <= 0 or frame_index < self.total_frames
+        ):
+            start = time.perf_counter()
+            if frame_index > self.start_frame:
+                self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+            ret, frame = self.cap.read()
+            if not ret or frame is None:
+                return
+            self._timed("decode", start)
+            yield frame_index, frame
+            frame_index += self.frame_interval
+
+
+class AdaptiveSampler(Generic[Signature]):
+    """
+    Sample sparsely through static stretches of a video and locate each change exactly.
+
+    Samples are compared with the last kept frame, the reference. The step between samples
+    starts at ``min_interval`` frames and doubles after every sample that matches the
+    reference, up to ``max_interval``. When a sample differs, the first differing frame
+    between it and the last matching sample is found by binary search, to within
+    ``precision`` frames. That frame is kept as the new reference and stepping restarts
+    from it at ``min_interval``. A static stretch thus costs a logarithmic number of
+    comparisons, and every slide starts at the frame it appears on. Each change costs
+    about log2 of the step more comparisons, so this only pays off on videos with long
+    static stretches; videos that change often take more comparisons than fixed sampling.
+
+    A slide that appears and disappears between two samples, with the same slide before
+    and after it, is missed; ``max_interval`` bounds how long such a slide can be.
+
+    Iterating yields (frame_index, frame, keep) for every compared frame: keep is True for
+    the first frame and each located change. Kept frames come in increasing order; frames
+    probed by a binary search do not.
+    """
+
+    def __init__(
+        self,
+        cap: Capture,
+        prepare: Callable[[int, np.ndarray], Signature],
+        differs: Callable[[Signature, Signature], bool],
+        min_interval: int,
+        max_interval: int,
+        total_frames: int = 0,
+        precision: int = 1,
+        timers: StageTimers | None = None,
+    ) -> None:
+        """
+        Initialize sampler.
+
+        Args:
+            cap: Opened video capture positioned at the first frame
+            prepare: Computes the comparison signature of (frame_index, frame)
+            differs: Whether a signature differs from the reference signature (reference, other)
+            min_interval: Step in frames after a change (values below 1 are treated as 1)
+            max_interval: Longest step in frames through a static stretch
+            total_frames: Frame count reported by the container (0 if unknown)
+            precision: Frames to which changes are located (1 for the exact frame)
+            timers: Timers to add decoding of compared frames ("decode") and of frames
+                grabbed on the way to them ("skip") to
+        """
+        self.cap = cap
+        self.prepare = prepare
+        self.differs = differs
+        self.min_interval = max(1, min_interval)
+        self.max_interval = max(self.min_interval, max_interval)
+        self.total_frames = total_frames
+        self.precision = max(1, precision)
+        self.timers = timers
+        # Index of the next frame the capture decodes (None after a failed read)
+        self._position: int | None = 0
+
+    def __iter__(self) -> Iterator[tuple[int, np.ndarray, bool]]:
+        frame = self._read(0)
+        if frame is None:
+            return
+        reference = self.prepare(0, frame)
+        yield 0, frame, True
+
+        # Last frame matching the reference, and the exclusive end of the video if known
+        matched = 0
+        end = self.total_frames if self.total_frames > 0 else None
+        step = self.min_interval
+        while True:
+            candidate = matched + step if end is None else min(matched + step, end - 1)
+            if candidate <= matched:
+                return
+            frame = self._read(candidate)
+            if frame is None:
+                # Past the last frame (container frame counts can be wrong): look closer
+                end = candidate
+                step = max(1, (candidate - matched) // 2)
+                continue
+            signature = self.prepare(candidate, frame)
+            if not self.differs(reference, signature):
+                yield candidate, frame, False
+                matched = candidate
+                step = min(step * 2, self.max_interval)
+                continue
+
+            # The change is in (matched, candidate]: bisect to its first frame
+            changed = candidate
+            while changed - matched > self.precision:
+                middle = (matched + changed) // 2
+                probe = self._read(middle)
+                if probe is None:
+                    break
+                probe_signature = self.prepare(middle, probe)
+                if self.differs(reference, probe_signature):
+                    yield changed, frame, False
+                    changed, frame, signature = middle, probe, probe_signature
+                else:
+                    yield middle, probe, False
+                    matched = middle
+            yield changed, frame, True
+            reference = signature
+            matched = changed
+            step = self.min_interval
+
+    def _timed(self, stage: str, start: float, count: int = 1) -> None:
+        if self.timers is not None:
+            self.timers.add(stage, time.perf_counter() - start, count)
+
+    def _read(self, frame_index: int) -> np.ndarray | None:
+        """Decode one frame, grabbing forward over short gaps and seeking otherwise."""
+        gap = frame_index - self._position if self._position is not None else -1
+        start = time.perf_counter()
+        if 0 <= gap < MIN_SEEK_INTERVAL:
+            for _ in range(gap):
+                if not self.cap.grab():
+                    self._position = None
+                    return None
+            if gap:
+                self._timed("skip", start, gap)
+                start = time.perf_counter()
+        else:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+        ret, frame = self.cap.read()
+        if not ret:
+            self._position = None
+            return None
+        self._position = frame_index + 1
+        self._timed("decode", start)
+        return frame
+
+
+class FrameFetcher:
+    """
+    Random access to full-resolution frames through a dedicated capture.
+
+    Used when sampled frames are reduced right after decoding: only frames that become
+    slides are decoded again at full resolution. Requests for increasing frame numbers
+    (the usual case) skip the seek when the capture is already positioned. Reads are
+    serialized, so one fetcher can be shared by several writer threads.
+    """
+
+    def __init__(self, video_path: str) -> None:
+        """
+        Initialize fetcher.
+
+        Args:
+            video_path: Path to the video file
+        """
+        self.cap = cv2.VideoCapture(video_path)
+        if not self.cap.isOpened():
+            raise ValueError(f"Unable to open video file: {video_path}")
+        self._position = 0
+        self._lock = threading.Lock()
+
+    def read(self, frame_number: int) -> np.ndarray:
+        """Decode one frame at full resolution."""
+        with self._lock:
+            if frame_number != self._position:
+                self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+            ret, frame = self.cap.read()
+            if not ret:
+                self._position = -1
+                raise ValueError(f"Unable to read frame {frame_number}")
+            self._position = frame_number + 1
+            return frame
+
+    def close(self) -> None:
+        """Release the capture."""
+        with self._lock:
+            self.cap.release()
+
+    def __enter__(self) -> "FrameFetcher":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,258 @@
+"""Split a video timeline into segments and run change detection on each in its own process."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import cv2
+import numpy as np
+
+from video2slides.follow import Capture
+from video2slides.metrics import StageTimers
+from video2slides.pipeline import BoundedExecutor
+from video2slides.sampling import FrameFetcher, FrameSampler
+
+if TYPE_CHECKING:
+    from video2slides.converter import Video2Slides
+
+# Most leading samples a worker sends for stitching; samples past them are decoded again
+LEADING_SAMPLE_LIMIT = 512
+
+
+@dataclass
+class Segment:
+    """A range of frames ``[start_frame, end_frame)`` aligned to the sampling grid."""
+
+    index: int
+    start_frame: int
+    end_frame: int | None
+
+
+@dataclass
+class SegmentResult:
+    """Frames a worker kept for one segment, detected independently of earlier segments."""
+
+    segment: Segment
+    kept_frames: list[int] = field(default_factory=list)
+    encoded: dict[int, bytes] = field(default_factory=dict)
+    sample_count: int = 0
+    tier_counts: dict[str, int] = field(default_factory=dict)
+    # Busy time of the worker's pipeline stages
+    timers: StageTimers = field(default_factory=StageTimers)
+    # Comparison images recorded for the analysis cache (frame_number -> PNG bytes)
+    samples: dict[int, bytes] = field(default_factory=dict)
+    # (frame_number, PNG comparison image) of the samples up to the second kept frame,
+    # which stitch_segment decides again against the true reference
+    leading: list[tuple[int, bytes]] = field(default_factory=list)
+
+
+def plan_segments(
+    total_frames: int, frame_interval: int, segment_count: int, start_frame: int = 0
+) -> list[Segment]:
+    """
+    Split ``[start_frame, total_frames)`` into contiguous segments starting on sampled frames.
+
+    The last segment is open-ended because container frame counts can be inaccurate.
+
+    Args:
+        total_frames: Frame count reported by the container
+        frame_interval: Number of frames between two samples
+        segment_count: Desired number of segments
+        start_frame: First sampled frame (e.g. where a resumed extraction continues)
+
+    Returns:
+        List of segments (fewer than requested for short videos)
+    """
+    sample_count = max(1, -(-(total_frames - start_frame) // frame_interval))
+    segment_count = max(1, min(segment_count, sample_count))
+    samples_per_segment = -(-sample_count // segment_count)
+
+    segments: list[Segment] = []
+    for index in range(segment_count):
+        start_sample = index * samples_per_segment
+        if start_sample >= sample_count:
+            break
+        end_sample = start_sample + samples_per_segment
+        end_frame = (
+            start_frame + end_sample * frame_interval if end_sample < sample_count else None
+        )
+        segments.append(Segment(index, start_frame + start_sample * frame_interval, end_frame))
+    return segments
+
+
+def extract_segment(
+    converter: "Video2Slides", segment: Segment, frame_interval: int
+) -> SegmentResult:
+    """
+    Run change detection on one segment with its own capture (process pool entry point).
+
+    The first sampled frame of the segment is always kept, since the worker does not know
+    what the previous segment ended with; ``stitch_segment`` fixes this up afterwards.
+
+    Args:
+        converter: Converter providing the comparison settings
+        segment: Segment to process
+        frame_interval: Number of frames between two samples
+
+    Returns:
+        Kept frame numbers and their encoded images
+    """
+    cap = cv2.VideoCapture(converter.video_path)
+    if not cap.isOpened():
+        raise ValueError(f"Unable to open video file: {converter.video_path}")
+
+    result = SegmentResult(segment)
+    converter.detector_tiers.clear()
+    try:
+        sampler = FrameSampler(
+            cap,
+            frame_interval,
+            mode=converter.sampling_mode,
+            total_frames=int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+            start_frame=segment.start_frame,
+            end_frame=segment.end_frame,
+            timers=converter.timers,
+        )
+        reduced = converter.reduced_decode
+        encoded: dict[int, Future[bytes]] = {}
+        leading: list[tuple[int, Future[bytes]]] = []
+        collecting = True
+        with (
+            FrameFetcher(converter.video_path) if reduced else nullcontext() as fetcher,
+            ThreadPoolExecutor(max_workers=1) as comparer,
+            BoundedExecutor(
+                converter.writer_workers, converter.write_queue_size, name="encoder"
+            ) as encoder,
+        ):
+            samples = converter._iter_samples(sampler)
+            decisions = converter._iter_decisions(samples, comparer, reduced=reduced)
+            for frame_number, frame, should_save in decisions:
+                result.sample_count += 1
+                if should_save:
+                    result.kept_frames.append(frame_number)
+                    encoded[frame_number] = encoder.submit(
+                        converter._encode_frame, frame_number, frame, fetcher
+                    )
+                if collecting:
+                    # Up to its second kept frame, stitching re-decides the segment against
+                    # the true reference, which only the main process knows
+                    image = frame if reduced else converter._reduce_frame(frame)
+                    leading.append((frame_number, encoder.submit(_encode_png, image)))
+                    collecting = len(result.kept_frames) < 2 and len(leading) < LEADING_SAMPLE_LIMIT
+            encoder.wait()
+    finally:
+        cap.release()
+
+    result.encoded = {frame_number: future.result() for frame_number, future in encoded.items()}
+    result.leading = [(frame_number, future.result()) for frame_number, future in leading]
+    result.tier_counts = dict(converter.detector_tiers)
+    result.timers = converter.timers
+    if converter._sample_recorder is not None:
+        result.samples = converter._sample_recorder.samples
+    return result
+
+
+def _encode_png(image: np.ndarray) -> bytes:
+    ok, buffer = cv2.imencode(".png", image)
+    if not ok:
+        raise ValueError("Unable to encode comparison image")
+    return buffer.tobytes()
+
+
+def _decode_png(data: bytes) -> np.ndarray:
+    image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+    if image is None:
+        raise ValueError("Unable to decode comparison image")
+    return image
+
+
+def read_frame_at(cap: Capture, frame_number: int) -> np.ndarray:
+    """Decode a single frame by seeking to it."""
+    cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+    ret, frame = cap.read()
+    if not ret or frame is None:
+        raise ValueError(f"Unable to read frame {frame_number}")
+    return frame
+
+
+def stitch_segment(
+    converter: "Video2Slides",
+    cap: Capture,
+    result: SegmentResult,
+    reference: np.ndarray,
+    frame_interval: int,
+) -> tuple[list[tuple[int, bytes]], int, int]:
+    """
+    Re-check the start of a segment against the last frame kept before it.
+
+    Decisions only depend on the current reference frame, so once the serial decision
+    process keeps a frame the worker also kept, both agree for the rest of the segment.
+    Until then, samples are decided again against the true reference. When a segment
+    starts inside a slide, the common case, that means every sample up to the next slide
+    change. The worker sends the comparison images of its samples up to its second kept
+    frame, so those are re-decided without decoding; the serial process is in sync by
+    then unless a change is too small for the worker's reference but not for the true
+    one. Only samples past them (or past LEADING_SAMPLE_LIMIT) are seeked to and decoded
+    again, one after another, as are kept frames the worker did not keep.
+
+    Args:
+        converter: Converter providing the comparison settings
+        cap: Capture used to decode frames again at the start of the segment
+        result: Independent result for the segment
+        reference: Last frame kept before the segment starts
+        frame_interval: Number of frames between two samples
+
+    Returns:
+        ((frame_number, encoded image) for kept frames in order, number of samples
+        re-decided, number of them decoded again)
+    """
+    worker_kept = set(result.kept_frames)
+    kept: list[tuple[int, bytes]] = []
+    rechecked = 0
+    decoded = 0
+
+    def keep(frame_number: int, frame: np.ndarray | None = None) -> bool:
+        """Add a frame the serial process keeps; True once it is in sync with the worker."""
+        if frame_number in worker_kept:
+            kept.extend((n, result.encoded[n]) for n in result.kept_frames if n >= frame_number)
+            return True
+        nonlocal decoded
+        if frame is None:
+            frame = read_frame_at(cap, frame_number)
+            decoded += 1
+        kept.append((frame_number, converter._encode_frame(frame_number, frame)))
+        return False
+
+    leading = ((frame_number, _decode_png(data)) for frame_number, data in result.leading)
+    with ThreadPoolExecutor(max_workers=1) as comparer:
+        decisions = converter._iter_decisions(leading, comparer, reference=reference, reduced=True)
+        for frame_number, _, should_save in decisions:
+            rechecked += 1
+            if should_save and keep(frame_number):
+                decisions.close()
+                return kept, rechecked, decoded
+
+    # Not in sync yet: decode the samples after the leading ones
+    if kept:
+        reference = read_frame_at(cap, kept[-1][0])
+    sampler = FrameSampler(
+        cap,
+        frame_interval,
+        mode="seek" if frame_interval > 1 else "grab",
+        start_frame=result.leading[-1][0] + frame_interval
+        if result.leading
+        else result.segment.start_frame,
+        end_frame=result.segment.end_frame,
+        timers=converter.timers,
+    )
+    with ThreadPoolExecutor(max_workers=1) as comparer:
+        decisions = converter._iter_decisions(sampler, comparer, reference=reference)
+        for frame_number, frame, should_save in decisions:
+            rechecked += 1
+            decoded += 1
+            if should_save and keep(frame_number, frame):
+                break
+        decisions.close()
+
+    return kept, rechecked, decoded
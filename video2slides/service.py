@@ -0,0 +1,558 @@
+"""
+Long-running conversion service: an HTTP job queue in front of warm worker processes.
+
+Jobs (a video path, an optional output path and Video2Slides options, as in batch
+manifests) are queued and run on a pool of worker processes that import OpenCV and
+python-pptx and select the comparison backend once, when they start. Workers forward the
+eliot progress messages of their current job, so clients can follow a conversion while it
+runs. Decoding can be limited to fewer jobs than there are workers, so saving
+presentations overlaps with reading videos without oversubscribing the disk.
+
+API (JSON bodies and responses):
+
+- ``POST /jobs``: queue ``{"video": ..., "output": ..., "options": {...}}``; the output and
+  the cache and checkpoint directories are relative to the service's output directory
+  and must stay within it
+- ``GET /jobs``: all jobs in submission order
+- ``GET /jobs/<id>``: one job; ``?wait=<seconds>`` blocks until it finishes or the time is up
+- ``DELETE /jobs/<id>``: cancel a job that has not started
+- ``GET /health``: job counts per status and the pool settings
+"""
+
+import json
+import multiprocessing
+import os
+import signal
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from eliot import add_destinations, log_message
+
+from video2slides.accelerator import select_accelerator
+from video2slides.batch import BatchJob, JobResult, coerce_option, default_output_path, run_job
+from video2slides.converter import Video2Slides
+from video2slides.defaults import DEFAULT_BATCH_WORKERS
+
+JOB_STATUSES = ("queued", "running", "converted", "failed", "cancelled")
+# Minimum seconds between two progress updates a worker sends for the same stage of a job
+PROGRESS_INTERVAL = 0.25
+# Longest ``?wait`` a request may block a server thread for
+MAX_WAIT_SECONDS = 300.0
+# Job options naming directories the job writes to, which must stay within output_dir
+_OUTPUT_DIR_OPTIONS = ("cache_dir", "checkpoint_dir")
+
+
+class _ProgressTracker:
+    """Eliot destination turning a worker's log messages into progress of its current job."""
+
+    def __init__(self, updates: multiprocessing.Queue) -> None:
+        self._updates = updates
+        self._lock = threading.Lock()
+        self._job_id: str | None = None
+        self._state: dict[str, Any] = {}
+        self._sent = 0.0
+
+    def start(self, job_id: str) -> None:
+        with self._lock:
+            self._job_id = job_id
+            self._state = {"stage": "starting", "fraction": 0.0, "slides": 0}
+            self._send(force=True)
+
+    def set_stage(self, stage: str) -> None:
+        with self._lock:
+            if self._job_id is not None:
+                self._state["stage"] = stage
+                self._send(force=True)
+
+    def finish(self) -> None:
+        with self._lock:
+            self._job_id = None
+
+    def __call__(self, message: dict[str, Any]) -> None:
+        # Called from every thread of the worker that logs
+        with self._lock:
+            if self._job_id is None:
+                return
+            state = self._state
+            stage = state["stage"]
+            kind = message.get("message_type")
+            if message.get("action_type") == "extract_frames":
+                if message.get("action_status") != "started":
+                    return
+                state["stage"] = "extracting"
+            elif kind == "video_info":
+                state["total_frames"] = message["total_frames"]
+            elif kind == "frame_skipped":
+                state["frame"] = message["frame_number"]
+            elif kind == "segments_planned":
+                state["segments"] = len(message["segments"])
+                state["segments_done"] = 0
+            elif kind == "segment_stitched":
+                state["segments_done"] += 1
+            elif kind == "slide_added":
+                state["slides"] += 1
+            elif kind == "extraction_complete":
+                state["stage"] = "saving"
+                state["slides"] = message["total_extracted"]
+            else:
+                return
+            state["fraction"] = self._fraction()
+            self._send(force=state["stage"] != stage)
+
+    def _fraction(self) -> float:
+        state = self._state
+        if state["stage"] == "saving":
+            return 1.0
+        if state.get("segments"):
+            return round(float(state["segments_done"] / state["segments"]), 3)
+        if state.get("total_frames"):
+            return round(min(1.0, float(state.get("frame", 0) / state["total_frames"])), 3)
+        return 0.0
+
+    def _send(self, force: bool) -> None:
+        now = time.monotonic()
+        if force or now - self._sent >= PROGRESS_INTERVAL:
+            self._sent = now
+            self._updates.put((self._job_id, dict(self._state)))
+
+
+# Worker process state, set up by _init_worker
+_decode_slots: Any = None
+_progress: _ProgressTracker | None = None
+
+
+def _init_worker(updates: multiprocessing.Queue, decode_slots: Any) -> None:
+    """Process pool initializer: pick the comparison backend and start forwarding progress."""
+    global _decode_slots, _progress
+    # Ctrl+C reaches the whole process group; the service shuts the workers down itself
+    # after their running jobs
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _decode_slots = decode_slots
+    _progress = _ProgressTracker(updates)
+    add_destinations(_progress)
+    # Cached for the life of the worker, so GPU jobs do not detect and benchmark devices each
+    select_accelerator()
+
+
+def _ready() -> int:
+    return os.getpid()
+
+
+def _tracker() -> _ProgressTracker:
+    """Progress tracker of this worker process."""
+    if _progress is None:
+        raise RuntimeError("Service jobs only run in worker processes started by the service")
+    return _progress
+
+
+class _ServiceConverter(Video2Slides):
+    """Video2Slides holding one of the service's decode slots while it reads the video."""
+
+    def extract_frames(self) -> None:
+        if _decode_slots is None:
+            super().extract_frames()
+            return
+        if not _decode_slots.acquire(block=False):
+            _tracker().set_stage("waiting")
+            _decode_slots.acquire()
+        try:
+            super().extract_frames()
+        finally:
+            _decode_slots.release()
+
+
+def _run_service_job(job_id: str, job: BatchJob) -> JobResult:
+    """Convert the video of a service job (process pool entry point)."""
+    progress = _tracker()
+    progress.start(job_id)
+    try:
+        return run_job(job, converter_class=_ServiceConverter)
+    finally:
+        progress.finish()
+
+
+@dataclass
+class ServiceJob:
+    """A job submitted to the service, with its progress and, once finished, its result."""
+
+    id: str
+    video_path: str
+    output_path: str
+    # Options as submitted (JSON values)
+    options: dict[str, Any] = field(default_factory=dict)
+    status: str = "queued"
+    submitted_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    progress: dict[str, Any] = field(default_factory=dict)
+    result: JobResult | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("converted", "failed", "cancelled")
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class ConversionService:
+    """Queue of conversion jobs run on a pool of warm worker processes."""
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_BATCH_WORKERS,
+        max_decodes: int | None = None,
+        output_dir: str = ".",
+    ) -> None:
+        """
+        Initialize the service and start its worker pool.
+
+        Args:
+            workers: Number of worker processes, i.e. jobs converted at the same time
+            max_decodes: Maximum number of jobs reading their video at the same time
+                (None for one per worker); the others wait or save their presentation
+            output_dir: Directory for outputs not given with a job
+
+        Raises:
+            ValueError: If workers or max_decodes is below 1
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if max_decodes is not None and max_decodes < 1:
+            raise ValueError(f"max_decodes must be at least 1, got {max_decodes}")
+
+        self.workers = workers
+        self.max_decodes = max_decodes
+        self.output_dir = str(Path(output_dir).resolve())
+        self._jobs: dict[str, ServiceJob] = {}
+        self._futures: dict[str, Future[JobResult]] = {}
+        # Guards the jobs and signals waiters whenever one changes
+        self._changed = threading.Condition()
+
+        # Forking a process that already ran OpenCV's thread pool can deadlock the child
+        context = multiprocessing.get_context("spawn")
+        self._updates = context.Queue()
+        decode_slots = (
+            context.BoundedSemaphore(max_decodes)
+            if max_decodes is not None and max_decodes < workers
+            else None
+        )
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self._updates, decode_slots),
+        )
+        self._listener = threading.Thread(target=self._listen, name="progress", daemon=True)
+        self._listener.start()
+
+    def __enter__(self) -> "ConversionService":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def warm_up(self) -> None:
+        """Start every worker process and wait until all of them are ready for jobs."""
+        futures = [self._pool.submit(_ready) for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+
+    def submit(
+        self,
+        video_path: str,
+        output_path: str | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> ServiceJob:
+        """
+        Queue a conversion.
+
+        Args:
+            video_path: Video file to convert
+            output_path: PPTX file to write, relative to ``output_dir`` (None to name it
+                after the video)
+            options: Video2Slides options by constructor argument name, e.g.
+                {"similarity_threshold": 0.9}; values may be strings as in CSV manifests.
+                ``cache_dir`` and ``checkpoint_dir`` are relative to ``output_dir``
+
+        Returns:
+            The queued job
+
+        Raises:
+            FileNotFoundError: If the video does not exist
+            ValueError: If an option is unknown or invalid, an output path is absolute or
+                outside ``output_dir``, or another unfinished job writes the same output
+        """
+        video_path = str(Path(video_path).resolve())
+        if not os.path.isfile(video_path):
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+        output_path = (
+            self._output_location("output", output_path)
+            if output_path
+            else default_output_path(video_path, self.output_dir)
+        )
+        options = dict(options or {})
+        job_options = {name: coerce_option(name, value) for name, value in options.items()}
+        for name in _OUTPUT_DIR_OPTIONS:
+            if job_options.get(name) is not None:
+                job_options[name] = self._output_location(name, str(job_options[name]))
+        # Divide the comparison threads between the jobs running at the same time
+        job_options.setdefault("compare_workers", max(1, (os.cpu_count() or 1) // self.workers))
+
+        with self._changed:
+            for other in self._jobs.values():
+                if not other.done and other.output_path == output_path:
+                    raise ValueError(f"Job {other.id} already writes {output_path}")
+            job = ServiceJob(uuid.uuid4().hex[:12], video_path, output_path, options)
+            self._jobs[job.id] = job
+            future = self._pool.submit(
+                _run_service_job, job.id, BatchJob(video_path, output_path, job_options)
+            )
+            self._futures[job.id] = future
+        log_message(
+            message_type="job_submitted",
+            job_id=job.id,
+            video_path=video_path,
+            output_path=output_path,
+        )
+        future.add_done_callback(lambda future: self._finish(job.id, future))
+        return job
+
+    def _output_location(self, name: str, path: str) -> str:
+        """
+        Resolve a path a job writes to against ``output_dir``.
+
+        Raises:
+            ValueError: If the path is absolute or leads outside ``output_dir``
+        """
+        if os.path.isabs(path):
+            raise ValueError(f"{name} must be relative to the output directory, got {path}")
+        resolved = (Path(self.output_dir) / path).resolve()
+        if not resolved.is_relative_to(self.output_dir):
+            raise ValueError(f"{name} must be within the output directory, got {path}")
+        return str(resolved)
+
+    def get(self, job_id: str) -> ServiceJob:
+        """
+        Look up a job.
+
+        Raises:
+            KeyError: If there is no job with this id
+        """
+        with self._changed:
+            return self._jobs[job_id]
+
+    def jobs(self) -> list[ServiceJob]:
+        """All jobs in submission order."""
+        with self._changed:
+            return list(self._jobs.values())
+
+    def wait(self, job_id: str, timeout: float | None = None) -> ServiceJob:
+        """
+        Wait until a job has finished or the timeout has passed.
+
+        Returns:
+            The job, finished unless the timeout passed first
+
+        Raises:
+            KeyError: If there is no job with this id
+        """
+        with self._changed:
+            job = self._jobs[job_id]
+            self._changed.wait_for(lambda: job.done, timeout)
+            return job
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a job that has not started yet.
+
+        Returns:
+            True if the job was cancelled, False if it is already running or finished
+
+        Raises:
+            KeyError: If there is no job with this id
+        """
+        with self._changed:
+            future = self._futures[job_id]
+        # Runs the done callback, which marks the job cancelled, before returning
+        return future.cancel()
+
+    def summary(self) -> dict[str, Any]:
+        """Number of jobs per status and the pool settings."""
+        with self._changed:
+            counts = {
+                status: sum(job.status == status for job in self._jobs.values())
+                for status in JOB_STATUSES
+            }
+        return {
+            "workers": self.workers,
+            "max_decodes": self.max_decodes or self.workers,
+            "jobs": counts,
+        }
+
+    def close(self) -> None:
+        """Cancel queued jobs, wait for running ones and stop the worker processes."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._updates.put(None)
+        self._listener.join()
+
+    def _listen(self) -> None:
+        """Apply the progress updates sent by workers to their jobs."""
+        while True:
+            update = self._updates.get()
+            if update is None:
+                return
+            job_id, progress = update
+            with self._changed:
+                job = self._jobs.get(job_id)
+                # Updates can arrive after the job's result
+                if job is None or job.done:
+                    continue
+                if job.status == "queued":
+                    job.status = "running"
+                    job.started_at = time.time()
+                job.progress = progress
+                self._changed.notify_all()
+
+    def _finish(self, job_id: str, future: Future[JobResult]) -> None:
+        if future.cancelled():
+            result = None
+        else:
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker process died (e.g. killed for running out of memory)
+                job = self.get(job_id)
+                result = JobResult(
+                    job.video_path, job.output_path, "failed", error=f"{type(e).__name__}: {e}"
+                )
+
+        with self._changed:
+            job = self._jobs[job_id]
+            job.status = "cancelled" if result is None else result.status
+            job.result = result
+            job.finished_at = time.time()
+            if job.status == "converted":
+                job.progress = {**job.progress, "stage": "done", "fraction": 1.0}
+            self._changed.notify_all()
+        log_message(
+            message_type="job_finished",
+            job_id=job_id,
+            **(asdict(result) if result is not None else {"status": job.status}),
+        )
+
+
+class ServiceHTTPServer(ThreadingHTTPServer):
+    """HTTP server exposing a ConversionService."""
+
+    daemon_threads = True
+
+    def __init__(self, service: ConversionService, address: tuple[str, int]) -> None:
+        self.service = service
+        super().__init__(address, _RequestHandler)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: ServiceHTTPServer
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        service = self.server.service
+        if url.path == "/health":
+            self._send_json(HTTPStatus.OK, service.summary())
+        elif url.path == "/jobs":
+            self._send_json(HTTPStatus.OK, {"jobs": [job.to_dict() for job in service.jobs()]})
+        elif job_id := self._job_id(url.path):
+            try:
+                wait = float(parse_qs(url.query).get("wait", ["0"])[0])
+            except ValueError:
+                self._send_error(HTTPStatus.BAD_REQUEST, "wait must be a number of seconds")
+                return
+            try:
+                job = service.wait(job_id, min(wait, MAX_WAIT_SECONDS)) if wait > 0 else (
+                    service.get(job_id)
+                )
+            except KeyError:
+                self._send_error(HTTPStatus.NOT_FOUND, f"Unknown job: {job_id}")
+                return
+            self._send_json(HTTPStatus.OK, job.to_dict())
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown path: {url.path}")
+
+    def do_POST(self) -> None:
+        if urlsplit(self.path).path != "/jobs":
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown path: {self.path}")
+            return
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            if not isinstance(body, dict) or "video" not in body:
+                raise ValueError('Expected a JSON object with a "video" entry')
+            job = self.server.service.submit(
+                str(body["video"]), body.get("output"), body.get("options")
+            )
+        except (ValueError, TypeError, FileNotFoundError) as e:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(e))
+            return
+        self._send_json(HTTPStatus.CREATED, job.to_dict())
+
+    def do_DELETE(self) -> None:
+        job_id = self._job_id(urlsplit(self.path).path)
+        if job_id is None:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown path: {self.path}")
+            return
+        service = self.server.service
+        try:
+            cancelled = service.cancel(job_id)
+        except KeyError:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown job: {job_id}")
+            return
+        if not cancelled:
+            self._send_error(HTTPStatus.CONFLICT, f"Job {job_id} has already started")
+            return
+        self._send_json(HTTPStatus.OK, service.get(job_id).to_dict())
+
+    @staticmethod
+    def _job_id(path: str) -> str | None:
+        prefix, _, job_id = path.rstrip("/").rpartition("/")
+        return job_id if prefix == "/jobs" and job_id else None
+
+    def _send_json(self, status: HTTPStatus, data: dict[str, Any]) -> None:
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        # Requests go to the eliot log instead of stderr
+        log_message(message_type="http_request", request=format % args)
+
+
+def make_server(service: ConversionService, host: str, port: int) -> ServiceHTTPServer:
+    """
+    Create an HTTP server for a service; call ``serve_forever`` to handle requests.
+
+    Args:
+        service: Service the requests are forwarded to
+        host: Address to listen on
+        port: Port to listen on (0 for any free port, see ``server_address``)
+    """
+    return ServiceHTTPServer(service, (host, port))
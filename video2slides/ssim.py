@@ -0,0 +1,189 @@
+"""
+Structural similarity (SSIM) built on OpenCV box filters.
+
+Reproduces ``skimage.metrics.structural_similarity`` with its defaults for uint8
+images (7x7 uniform window, sample covariance, K1=0.01, K2=0.03, data range 255,
+mean over the image with a 3-pixel border cropped) in float32. Scores agree with
+scikit-image to within SSIM_TOLERANCE.
+
+Per-image statistics (local means and variances) are computed once per image and
+cached in ``SSIMStats``, so comparing a frame against the kept reference only needs
+one box filter for the cross term. Work buffers are kept per thread and reused.
+"""
+
+import threading
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+WIN_SIZE = 7
+K1 = 0.01
+K2 = 0.03
+DATA_RANGE = 255.0
+# Maximum absolute difference to skimage.metrics.structural_similarity (float32 accumulation)
+SSIM_TOLERANCE = 1e-4
+
+_PAD = (WIN_SIZE - 1) // 2
+_NP = WIN_SIZE * WIN_SIZE
+_COV_NORM = _NP / (_NP - 1)
+_C1 = (K1 * DATA_RANGE) ** 2
+_C2 = (K2 * DATA_RANGE) ** 2
+
+
+def _box(src: np.ndarray, dst: np.ndarray | None = None) -> np.ndarray:
+    # BORDER_REFLECT matches scipy.ndimage's "reflect"; borders are cropped anyway
+    return cv2.boxFilter(
+        src, cv2.CV_32F, (WIN_SIZE, WIN_SIZE), dst=dst, normalize=True,
+        borderType=cv2.BORDER_REFLECT,
+    )
+
+
+@dataclass(frozen=True)
+class SSIMStats:
+    """Local statistics of one image, reusable across comparisons."""
+
+    image: np.ndarray
+    mean: np.ndarray
+    mean_sq: np.ndarray
+    variance: np.ndarray
+
+
+def compute_stats(image: np.ndarray) -> SSIMStats:
+    """
+    Compute the local statistics SSIM needs for one grayscale image.
+
+    Args:
+        image: 2-D image (any numeric dtype, at least WIN_SIZE pixels on each side)
+
+    Returns:
+        Float32 image, local mean, squared local mean and local sample variance
+    """
+    if image.ndim != 2:
+        raise ValueError(f"Expected a 2-D grayscale image, got shape {image.shape}")
+    if min(image.shape) < WIN_SIZE:
+        raise ValueError(f"Image must be at least {WIN_SIZE}x{WIN_SIZE}, got {image.shape}")
+
+    image32 = image.astype(np.float32)
+    mean = _box(image32)
+    mean_sq = mean * mean
+    variance = _box(image32 * image32)
+    variance -= mean_sq
+    variance *= _COV_NORM
+    return SSIMStats(image32, mean, mean_sq, variance)
+
+
+class _Buffers(threading.local):
+    def __init__(self) -> None:
+        self.by_shape: dict[tuple[int, ...], tuple[np.ndarray, ...]] = {}
+
+    def get(self, shape: tuple[int, ...], count: int) -> tuple[np.ndarray, ...]:
+        key = (*shape, count)
+        if key not in self.by_shape:
+            self.by_shape[key] = tuple(np.empty(shape, dtype=np.float32) for _ in range(count))
+        return self.by_shape[key]
+
+
+_buffers = _Buffers()
+
+
+def _ssim_map_mean(
+    ref: SSIMStats, mean: np.ndarray, mean_sq: np.ndarray, variance: np.ndarray,
+    cross: np.ndarray, work: tuple[np.ndarray, ...],
+) -> np.ndarray:
+    """Mean SSIM over the cropped region; leading axes of the candidate arrays are batched."""
+    inner = (..., slice(_PAD, -_PAD), slice(_PAD, -_PAD))
+    ref_mean = ref.mean[inner[1:]]
+    ref_mean_sq = ref.mean_sq[inner[1:]]
+    ref_variance = ref.variance[inner[1:]]
+    mean, mean_sq, variance, cross = mean[inner], mean_sq[inner], variance[inner], cross[inner]
+    product, numerator, denominator = work
+
+    # product = mu_x * mu_y; numerator = (2 mu_x mu_y + C1) * (2 cov_xy + C2)
+    np.multiply(mean, ref_mean, out=product)
+    np.subtract(cross, product, out=numerator)
+    numerator *= 2 * _COV_NORM
+    numerator += _C2
+    product *= 2
+    product += _C1
+    numerator *= product
+
+    # denominator = (mu_x^2 + mu_y^2 + C1) * (var_x + var_y + C2)
+    np.add(mean_sq, ref_mean_sq, out=denominator)
+    denominator += _C1
+    np.add(variance, ref_variance, out=product)
+    product += _C2
+    denominator *= product
+
+    numerator /= denominator
+    means: np.ndarray = numerator.mean(axis=(-2, -1), dtype=np.float64)
+    return means
+
+
+def ssim_score(ref: SSIMStats, other: SSIMStats) -> float:
+    """
+    SSIM between two images given their precomputed statistics.
+
+    Args:
+        ref: Statistics of the reference image
+        other: Statistics of the compared image (same shape)
+
+    Returns:
+        Mean SSIM (1 = identical)
+    """
+    if ref.image.shape != other.image.shape:
+        raise ValueError(f"Shape mismatch: {ref.image.shape} vs {other.image.shape}")
+
+    h, w = ref.image.shape
+    cross_product, cross = _buffers.get((h, w), 2)
+    np.multiply(ref.image, other.image, out=cross_product)
+    _box(cross_product, dst=cross)
+
+    inner_shape = (h - 2 * _PAD, w - 2 * _PAD)
+    work = _buffers.get(inner_shape, 3)
+    return float(
+        _ssim_map_mean(ref, other.mean, other.mean_sq, other.variance, cross, work)
+    )
+
+
+def ssim_batch(ref: SSIMStats, candidates: list[SSIMStats]) -> np.ndarray:
+    """
+    SSIM of one reference against several candidates in one pass.
+
+    Candidates are stacked vertically so a single box filter computes every cross term.
+    Rows bleeding across candidate boundaries lie in the cropped border, so results are
+    identical to scoring each candidate separately.
+
+    Args:
+        ref: Statistics of the reference image
+        candidates: Statistics of the compared images (same shape as the reference)
+
+    Returns:
+        Array of K SSIM scores
+    """
+    if not candidates:
+        return np.empty(0, dtype=np.float64)
+    for candidate in candidates:
+        if candidate.image.shape != ref.image.shape:
+            raise ValueError(f"Shape mismatch: {ref.image.shape} vs {candidate.image.shape}")
+
+    k = len(candidates)
+    h, w = ref.image.shape
+    stacked = np.stack([c.image for c in candidates])
+    stacked *= ref.image
+    cross = _box(stacked.reshape(k * h, w)).reshape(k, h, w)
+
+    work = tuple(np.empty((k, h - 2 * _PAD, w - 2 * _PAD), dtype=np.float32) for _ in range(3))
+    return _ssim_map_mean(
+        ref,
+        np.stack([c.mean for c in candidates]),
+        np.stack([c.mean_sq for c in candidates]),
+        np.stack([c.variance for c in candidates]),
+        cross,
+        work,
+    )
+
+
+def structural_similarity(image1: np.ndarray, image2: np.ndarray) -> float:
+    """Drop-in replacement for ``skimage.metrics.structural_similarity(image1, image2)``."""
+    return ssim_score(compute_stats(image1), compute_stats(image2))
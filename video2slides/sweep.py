@@ -0,0 +1,303 @@
+"""Evaluate many similarity thresholds in a single pass over a video."""
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from eliot import start_action
+
+from video2slides.pipeline import BoundedProducer
+from video2slides.sampling import SAMPLING_MODES, FrameSampler
+
+if TYPE_CHECKING:
+    from video2slides.converter import ChangeDetector, FrameSignature, Video2Slides
+
+
+def parse_thresholds(spec: str) -> list[float]:
+    """
+    Parse a threshold grid.
+
+    Args:
+        spec: Comma-separated thresholds ("0.8,0.9,0.95") or an inclusive range
+            "start:stop:step" ("0.5:0.99:0.01")
+
+    Returns:
+        Sorted, distinct thresholds in 0-1
+    """
+    try:
+        if ":" in spec:
+            start, stop, step = (float(part) for part in spec.split(":"))
+            if step <= 0 or stop < start:
+                raise ValueError
+            count = int(round((stop - start) / step)) + 1
+            values = [round(start + i * step, 6) for i in range(count)]
+        else:
+            values = [float(part) for part in spec.split(",") if part.strip()]
+    except ValueError:
+        raise ValueError(
+            f"Expected thresholds as 'a,b,c' or 'start:stop:step', got: {spec}"
+        ) from None
+    if not values or any(not 0.0 <= value <= 1.0 for value in values):
+        raise ValueError(f"Thresholds must be between 0 and 1, got: {spec}")
+    return sorted(set(values))
+
+
+@dataclass
+class ThresholdResult:
+    """Slides kept at one similarity threshold."""
+
+    threshold: float
+    frame_numbers: list[int] = field(default_factory=list)
+    timestamps: list[float] = field(default_factory=list)
+
+    @property
+    def slide_count(self) -> int:
+        """Number of kept frames (slides after the title slide)."""
+        return len(self.frame_numbers)
+
+
+@dataclass
+class SweepResult:
+    """Outcome of a threshold sweep over one video."""
+
+    video_path: str
+    detector: str
+    fps: float
+    frame_interval: int
+    sample_frame_numbers: list[int]
+    # Similarity of each sample to the previous one (None for the first sample)
+    similarity_to_previous: list[float | None]
+    results: list[ThresholdResult]
+    # Distinct detector comparisons run for all thresholds together
+    comparisons: int = 0
+
+    def closest_to_slide_count(self, target: int) -> ThresholdResult:
+        """
+        Threshold whose slide count is closest to a target.
+
+        Of several thresholds equally close, the middle one is returned, so the choice
+        sits well inside the range producing that count.
+        """
+        best = min(abs(result.slide_count - target) for result in self.results)
+        candidates = [r for r in self.results if abs(r.slide_count - target) == best]
+        return candidates[len(candidates) // 2]
+
+    def knee(self) -> ThresholdResult:
+        """
+        Threshold at the knee of the slide count curve.
+
+        Slide counts grow slowly with the threshold while real slide changes are picked up
+        and quickly once it starts splitting slides on noise, animations or speaker
+        motion. The knee is the threshold furthest below the straight line between the
+        ends of the normalized curve; the middle of the run of thresholds sharing its
+        slide count is returned.
+        """
+        thresholds = np.array([result.threshold for result in self.results])
+        counts = np.array([result.slide_count for result in self.results], dtype=float)
+        if len(self.results) < 3 or counts.max() == counts.min():
+            return self.results[len(self.results) // 2]
+
+        x = (thresholds - thresholds.min()) / (thresholds.max() - thresholds.min())
+        y = (counts - counts.min()) / (counts.max() - counts.min())
+        knee = int(np.argmax(x - y))
+
+        start = knee
+        while start > 0 and self.results[start - 1].slide_count == self.results[knee].slide_count:
+            start -= 1
+        return self.results[(start + knee) // 2]
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form of the result, including slide counts."""
+        data = asdict(self)
+        for result, entry in zip(self.results, data["results"], strict=True):
+            entry["slide_count"] = result.slide_count
+        return data
+
+
+def _prepare_ahead(
+    samples: Iterable[tuple[int, np.ndarray]],
+    executor: Executor,
+    prepare: Callable[[int, np.ndarray], "FrameSignature"],
+    window: int,
+) -> Iterator[tuple[int, "FrameSignature"]]:
+    """Prepare signatures on the executor, up to ``window`` samples ahead, in sample order."""
+    pending: deque[tuple[int, Future[FrameSignature]]] = deque()
+    for frame_number, frame in samples:
+        pending.append((frame_number, executor.submit(prepare, frame_number, frame)))
+        if len(pending) >= window:
+            number, signature = pending.popleft()
+            yield number, signature.result()
+    while pending:
+        number, signature = pending.popleft()
+        yield number, signature.result()
+
+
+def _score_key(
+    detector: "ChangeDetector", reference: int, threshold: float
+) -> tuple[int, float | None]:
+    """Memoization key of a comparison: thresholds share it unless the score depends on them."""
+    return reference, threshold if detector.uses_threshold else None
+
+
+def _sweep(
+    converter: "Video2Slides",
+    samples: Iterable[tuple[int, np.ndarray]],
+    reduced: bool,
+    thresholds: list[float],
+) -> tuple[list[int], list[float | None], list[list[int]], int]:
+    """
+    Decide every sample for all thresholds at once.
+
+    Each threshold keeps its own reference (the last frame it kept), exactly like a
+    conversion at that threshold. Thresholds mostly share references, and a comparison
+    between a reference and a sample is run once for all thresholds using it (once per
+    threshold for detectors whose score depends on it), so N thresholds cost little more
+    than one. Only the signatures still referenced are kept in memory.
+
+    Returns:
+        (sample frame numbers, similarity to previous sample, kept frame numbers per
+        threshold, number of comparisons)
+    """
+    detector = converter.detector
+    references: list[int | None] = [None] * len(thresholds)
+    kept: list[list[int]] = [[] for _ in thresholds]
+    live: dict[int, FrameSignature] = {}
+    sample_frame_numbers: list[int] = []
+    similarity_to_previous: list[float | None] = []
+    comparisons = 0
+
+    with (
+        BoundedProducer(samples, converter.decode_queue_size, name="decoder") as decoded,
+        ThreadPoolExecutor(
+            max_workers=converter.compare_workers, thread_name_prefix="compare"
+        ) as comparer,
+    ):
+        prepare = converter._sample_preparer(reduced)
+        window = max(1, converter.compare_workers) * 2
+        previous: int | None = None
+        for index, (frame_number, signature) in enumerate(
+            _prepare_ahead(decoded, comparer, prepare, window)
+        ):
+            # Every (reference, threshold) pair is scored once, in parallel
+            requests = [
+                (reference, threshold)
+                for reference, threshold in zip(references, thresholds, strict=True)
+                if reference is not None
+            ]
+            if previous is not None:
+                requests.append((previous, converter.similarity_threshold))
+            scores: dict[tuple[int, float | None], Future[tuple[float, str]]] = {}
+            for reference, threshold in requests:
+                key = _score_key(detector, reference, threshold)
+                if key not in scores:
+                    scores[key] = comparer.submit(
+                        detector.compare, live[reference], signature, threshold
+                    )
+
+            for i, (current, threshold) in enumerate(zip(references, thresholds, strict=True)):
+                if (
+                    current is None
+                    or scores[_score_key(detector, current, threshold)].result()[0] < threshold
+                ):
+                    references[i] = index
+                    kept[i].append(frame_number)
+
+            to_previous = (
+                scores[_score_key(detector, previous, converter.similarity_threshold)]
+                if previous is not None
+                else None
+            )
+            sample_frame_numbers.append(frame_number)
+            similarity_to_previous.append(
+                round(to_previous.result()[0], 6) if to_previous is not None else None
+            )
+            comparisons += len(scores)
+
+            live[index] = signature
+            previous = index
+            live = {i: live[i] for i in {*references, previous} if i is not None}
+
+    return sample_frame_numbers, similarity_to_previous, kept, comparisons
+
+
+def sweep_thresholds(converter: "Video2Slides", thresholds: list[float]) -> SweepResult:
+    """
+    Find the slides every threshold would keep, decoding the video once.
+
+    All other settings (interval, sampling mode, detector, masks, crop, analysis cache)
+    are taken from the converter; its own similarity threshold is only used for the
+    similarity time series of threshold-dependent detectors. Adaptive sampling picks its
+    samples by the decisions of a single threshold, so it cannot be swept.
+
+    Args:
+        converter: Converter providing the video and comparison settings
+        thresholds: Similarity thresholds to evaluate
+
+    Returns:
+        Kept frames per threshold, in ascending threshold order
+    """
+    thresholds = sorted(set(thresholds))
+    if not thresholds:
+        raise ValueError("No thresholds to evaluate")
+    if converter.sampling_mode not in SAMPLING_MODES:
+        raise ValueError(
+            f"Threshold sweeps need one of the sampling modes {SAMPLING_MODES}, "
+            f"got: {converter.sampling_mode}"
+        )
+
+    with start_action(
+        action_type="sweep_thresholds",
+        video_path=converter.video_path,
+        fps_interval=converter.fps_interval,
+        detector=converter.detector.name,
+        thresholds=thresholds,
+    ) as action:
+        cap, frame_interval, total_frames = converter._open_video(action)
+        try:
+            with converter._analysis(frame_interval, action) as cached:
+                samples: Iterable[tuple[int, np.ndarray]]
+                if cached is not None:
+                    samples, reduced = cached, True
+                else:
+                    sampler = FrameSampler(
+                        cap,
+                        frame_interval,
+                        mode=converter.sampling_mode,
+                        total_frames=total_frames,
+                        timers=converter.timers,
+                    )
+                    samples, reduced = converter._iter_samples(sampler), converter.reduced_decode
+                sample_numbers, to_previous, kept, comparisons = _sweep(
+                    converter, samples, reduced, thresholds
+                )
+        finally:
+            cap.release()
+
+        fps = converter.fps
+        result = SweepResult(
+            video_path=converter.video_path,
+            detector=converter.detector.name,
+            fps=fps,
+            frame_interval=frame_interval,
+            sample_frame_numbers=sample_numbers,
+            similarity_to_previous=to_previous,
+            results=[
+                ThresholdResult(
+                    threshold,
+                    frame_numbers,
+                    [round(n / fps, 3) if fps > 0 else 0.0 for n in frame_numbers],
+                )
+                for threshold, frame_numbers in zip(thresholds, kept, strict=True)
+            ],
+            comparisons=comparisons,
+        )
+        action.log(
+            message_type="sweep_complete",
+            samples=len(sample_numbers),
+            comparisons=comparisons,
+            slide_counts={str(r.threshold): r.slide_count for r in result.results},
+        )
+    return result
@@ -0,0 +1,41 @@
+"""Choose the YouTube stream to download for slide extraction."""
+
+from video2slides.defaults import DEFAULT_MAX_HEIGHT
+
+# AV1 needs a decoder many OpenCV builds lack
+_NOT_AV1 = "[vcodec!^=?av01]"
+
+
+def format_options(
+    max_height: int | None = DEFAULT_MAX_HEIGHT, video_only: bool = True
+) -> dict[str, object]:
+    """
+    Build yt-dlp format options that download no more than slide extraction needs.
+
+    Slide changes are detected on frames scaled down to 480 lines and slides are shown at
+    10x7.5 inches, so taller streams only cost download bytes and decoding time. Streams are
+    ranked by resolution first: the tallest one no taller than ``max_height``, or the
+    smallest one if there is none that small. Among streams of the same resolution, H.264
+    (the cheapest to decode) and then the smallest file is preferred.
+
+    The format selector takes the best ranked stream of the first available kind:
+
+    1. video-only streams (with ``video_only``): no audio track to download and, unlike
+       separate video and audio streams, no ffmpeg needed to merge them
+    2. streams with video and audio, other than AV1 (which many OpenCV builds cannot
+       decode), then in any codec
+    3. any stream with video, so that selection never fails
+
+    Args:
+        max_height: Maximum stream height in lines (None or 0 for no limit)
+        video_only: Prefer streams without audio
+
+    Returns:
+        yt-dlp options: the format selector ("format") and the stream ranking ("format_sort")
+    """
+    kinds = [f"bv{_NOT_AV1}"] if video_only else []
+    kinds += [f"b{_NOT_AV1}", "b", "bv*"]
+    return {
+        "format": "/".join(kinds),
+        "format_sort": [f"res:{max_height}" if max_height else "res", "vcodec:h264", "+size"],
+    }